@@ -1,3 +1,14 @@
-from .enum_units import get_states, get_counties, get_tracts, get_school_districts, get_block_groups, get_zctas
+from .enum_units import get_states, get_counties, get_tracts, get_school_districts, get_block_groups, get_blocks, get_zctas, get_area_water, get_layer
 from . import util
+from .catalog import list_available
+from .changes import compare_vintages
+from .adjacency import get_adjacency
+from .raster import get_raster_index, build_raster_index, lookup_points
+from .crosswalk import get_crosswalk
+from .water import erase_water
+from .shift import shift_geometry
+from .national import NationalDataset
+from .arrow import to_arrow
+from .derived import derived_attributes, add_derived
+from .precision import quantize, encode_geometry, decode_geometry, save_encoded, load_encoded
 from .constants import SchoolDistrict
\ No newline at end of file
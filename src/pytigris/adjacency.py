@@ -0,0 +1,89 @@
+import numpy as np
+import shapely
+import geopandas as gpd
+from scipy import sparse
+from typing import Optional, NamedTuple
+from .util import get_geoids, derived_cache_path, layer_cache_key, standardize_year
+from .enum_units import read_layer
+
+# DE-9IM patterns for two features whose boundaries share at least a point (queen) or a line (rook)
+CONTIGUITY_PATTERNS = {
+    'queen': '****T****',
+    'rook': '****1****'
+}
+
+class Adjacency(NamedTuple):
+    matrix: sparse.csr_matrix
+    geoids: np.ndarray
+
+def adjacency_matrix(df: gpd.GeoDataFrame, kind: str = 'queen') -> Adjacency:
+    """Build the contiguity matrix of a layer.
+
+    Candidate neighbours are found with the layer's STRtree spatial index, then tested for a shared
+    vertex (queen) or shared edge (rook) in a single vectorized relate call.
+
+    Args:
+        df (geopandas.GeoDataFrame): The layer.
+        kind (str, optional): 'queen' (features sharing at least a vertex) or 'rook' (features sharing an edge). Defaults to 'queen'.
+
+    Raises:
+        ValueError: If kind is not 'queen' or 'rook'.
+
+    Returns:
+        Adjacency: Symmetric sparse CSR matrix, with rows and columns in the order of `geoids`.
+    """
+    if kind not in CONTIGUITY_PATTERNS:
+        raise ValueError(f"Invalid contiguity kind: '{kind}'. Should be one of: 'queen', 'rook'")
+
+    geoids = get_geoids(df).values.astype(str)
+    geoms = np.asarray(df.geometry.values)
+
+    left, right = df.sindex.query(df.geometry, predicate = 'intersects')
+    # Test each pair once
+    keep = left < right
+    left, right = left[keep], right[keep]
+
+    keep = shapely.relate_pattern(geoms[left], geoms[right], CONTIGUITY_PATTERNS[kind])
+    left, right = left[keep], right[keep]
+
+    n = len(df)
+    matrix = sparse.coo_matrix((np.ones(len(left)), (left, right)), shape = (n, n)).tocsr()
+    return Adjacency(matrix + matrix.T, geoids)
+
+def get_adjacency(layer: str, year: Optional[int] = None, state: Optional[str] = None, kind: str = 'queen', cb: bool = False, use_cache: bool = False, **kwargs) -> Adjacency:
+    """Contiguity (neighbour) graph of a layer, e.g. for regionalization or spatial regression.
+
+    With use_cache = True the graph is cached alongside the layer, so it is only built once per vintage
+    (and per set of get_* arguments changing the features, such as counties or bbox).
+
+    Args:
+        layer (str): One of 'county', 'tract', 'bg' (or any other layer accepted by `get_layer`).
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
+        state (Optional[str], optional): The state to build the graph for. Defaults to None.
+        kind (str, optional): 'queen' (features sharing at least a vertex) or 'rook' (features sharing an edge). Defaults to 'queen'.
+        cb (bool, optional): If to use the cartographic boundary file. Defaults to False.
+        use_cache (bool, optional): If to utilise the cache for the downloaded file and the graph. Defaults to False.
+        **kwargs: Further arguments passed on to the get_* function.
+
+    Raises:
+        ValueError: If kind is not 'queen' or 'rook', or the layer is not available.
+
+    Returns:
+        Adjacency: Symmetric sparse CSR matrix, with rows and columns in the order of `geoids`.
+    """
+    if kind not in CONTIGUITY_PATTERNS:
+        raise ValueError(f"Invalid contiguity kind: '{kind}'. Should be one of: 'queen', 'rook'")
+
+    year = standardize_year(year, layer, cb)
+    path = derived_cache_path(layer_cache_key(layer, year, cb, state, **kwargs), f'.{kind}.npz')
+    if use_cache and path.exists() and not kwargs.get('refresh', False):
+        with np.load(path) as f:
+            matrix = sparse.csr_matrix((f['data'], f['indices'], f['indptr']), shape = tuple(f['shape']))
+            return Adjacency(matrix, f['geoids'])
+
+    adjacency = adjacency_matrix(read_layer(layer, state = state, year = year, cb = cb, use_cache = use_cache, **kwargs), kind)
+    if use_cache:
+        path.parent.mkdir(parents = True, exist_ok = True)
+        matrix = adjacency.matrix
+        np.savez(path, data = matrix.data, indices = matrix.indices, indptr = matrix.indptr, shape = matrix.shape, geoids = adjacency.geoids)
+    return adjacency
@@ -0,0 +1,202 @@
+import json
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyproj
+import shapely
+import geopandas as gpd
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from shapely.geometry import box, shape
+from shapely.geometry.base import BaseGeometry
+from typing import Iterable, Optional
+from .constants import logger
+from .precision import snap_geometries
+from .derived import DerivedAttributes, derived_attributes, derived_columns, take_derived
+from . import util
+
+try:
+    import pyogrio
+    import pyogrio.raw
+except ImportError:
+    pyogrio = None
+
+def load_tiger_arrow(url: str, refresh: bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox = None, mask = None, crs = None, precision: Optional[float] = None, derived: bool = False) -> pa.Table:
+    """Arrow counterpart of `load_tiger`: the features of a TIGER file as a `pyarrow.Table` with WKB geometry.
+
+    With pyogrio installed, attributes are read straight into Arrow and only the geometry column is decoded
+    (when reprojecting, snapping or filtering by a region in another CRS). Otherwise the file is read with
+    geopandas and converted. With use_cache = True the file is read from the same spatially indexed, reprojected
+    and quantized copy as `load_tiger`, which is parsed (with `workers` processes) the first time it is needed.
+    """
+    tiger_file = url.split("/")[-1]
+    if use_cache:
+        blob = util.cached_blob(tiger_file)
+        if blob is None or refresh:
+            with util.open_tiger_url(url, progress_bar) as r_raw:
+                blob = util.store_blob(r_raw, tiger_file, url)
+        parsed = util.parsed_layer(blob, workers, crs, precision)
+        table = standardise_table(read_arrow(str(parsed), bbox, mask, keep_order = derived))
+        if derived:
+            attributes = util.cached_derived(parsed)
+            if util.ROW_ORDER_COLUMN in table.column_names:
+                attributes = take_derived(attributes, table[util.ROW_ORDER_COLUMN].to_numpy())
+                table = table.drop([util.ROW_ORDER_COLUMN])
+            table = add_derived_columns(table, attributes)
+        return table
+
+    with tempfile.NamedTemporaryFile(suffix = '.zip') as file:
+        with util.open_tiger_url(url, progress_bar) as r_raw:
+            shutil.copyfileobj(r_raw, file)
+        file.flush()
+        return _finish(read_arrow('zip://' + file.name, bbox, mask, crs, workers = workers), bbox, mask, crs, precision, derived)
+
+def _finish(table: pa.Table, bbox, mask, crs, precision: Optional[float], derived: bool = False) -> pa.Table:
+    table = standardise_table(table)
+    source_crs = geometry_crs(table)
+    if (crs is None or source_crs.equals(crs)) and precision is None:
+        return add_derived_columns(table) if derived else table
+
+    geoms = shapely.from_wkb(table['geometry'].to_numpy(zero_copy_only = False))
+    if crs is not None and not source_crs.equals(crs):
+        geoms = gpd.GeoSeries(geoms, crs = source_crs).to_crs(crs).values.data
+        source_crs = pyproj.CRS.from_user_input(crs)
+        region = _region(bbox, mask, crs)
+        if region is not None:
+            # Filtering the source file by the reprojected bbox or mask can select extra features
+            keep = shapely.intersects(geoms, region)
+            table, geoms = table.filter(pa.array(keep)), geoms[keep]
+    if precision is not None:
+        geoms = snap_geometries(geoms, precision)
+
+    table = with_geometry(table.drop(['geometry']), shapely.to_wkb(geoms), source_crs)
+    if derived:
+        table = add_derived_columns(table, derived_attributes(gpd.GeoSeries(geoms, crs = source_crs)))
+    return table
+
+def read_arrow(path: str, bbox = None, mask = None, crs = None, keep_order: bool = False, workers: Optional[int] = None) -> pa.Table:
+    """Read a file into a `pyarrow.Table` with a WKB 'geometry' column (see `with_geometry`).
+
+    bbox and mask may be given as in `load_tiger`; tuples and geometries are in `crs` (or the CRS of the file, if None).
+    With keep_order = True, files written by `write_parsed` keep the column holding each feature's original position.
+    Unfiltered reads are split across `workers` processes as in `read_tiger_file`.
+    """
+    if pyogrio is None:
+        logger.info("pyogrio is not installed: reading with geopandas and converting to Arrow")
+        if crs is not None:
+            bbox, mask = _as_series(bbox, crs), _as_series(mask, crs)
+        df = util.read_tiger_file(path, workers, bbox, mask)
+        return _restore_order(to_arrow(df), keep_order)
+
+    bbox, mask = _source_region(path, bbox, crs), _source_region(path, mask, crs)
+    bounds = None
+    if workers is not None and workers != 1 and bbox is None and mask is None:
+        bounds = util.feature_ranges(max(pyogrio.read_info(path)['features'], 0), workers)
+    if bounds is None or len(bounds) <= 2:
+        meta, table = pyogrio.raw.read_arrow(path, bbox = bbox.bounds if bbox is not None else None, mask = mask)
+    else:
+        with ProcessPoolExecutor(max_workers = len(bounds) - 1) as executor:
+            ranges = list(executor.map(_read_arrow_range, repeat(path), bounds[:-1], bounds[1:]))
+        meta, table = ranges[0][0], pa.concat_tables([table for _, table in ranges])
+    source_crs = pyproj.CRS.from_user_input(meta['crs'] or 'EPSG:4269')
+    geometry_name = meta['geometry_name'] or 'wkb_geometry'
+    wkb = table[geometry_name]
+    table = table.drop([geometry_name])
+    return _restore_order(with_geometry(table, wkb, source_crs), keep_order)
+
+def _read_arrow_range(path: str, start: int, stop: int) -> tuple:
+    return pyogrio.raw.read_arrow(path, skip_features = start, max_features = stop - start)
+
+def to_arrow(df: gpd.GeoDataFrame) -> pa.Table:
+    """Convert a GeoDataFrame to a `pyarrow.Table` with a WKB 'geometry' column (see `with_geometry`)."""
+    table = pa.Table.from_pandas(pd.DataFrame(df.drop(columns = df.geometry.name)), preserve_index = False)
+    return with_geometry(table, shapely.to_wkb(np.asarray(df.geometry.values)), df.crs or pyproj.CRS.from_epsg(4269))
+
+def with_geometry(table: pa.Table, wkb, crs) -> pa.Table:
+    """Append a WKB geometry column, tagged as GeoArrow (geoarrow.wkb) and GeoParquet, so Arrow-aware tools recognise it."""
+    projjson = json.loads(pyproj.CRS.from_user_input(crs).to_json())
+    field = pa.field('geometry', pa.binary(), metadata = {
+        'ARROW:extension:name': 'geoarrow.wkb',
+        'ARROW:extension:metadata': json.dumps({'crs': projjson})
+    })
+    geo = {
+        'version': '1.0.0',
+        'primary_column': 'geometry',
+        'columns': {'geometry': {'encoding': 'WKB', 'geometry_types': [], 'crs': projjson}}
+    }
+    if isinstance(wkb, (pa.Array, pa.ChunkedArray)):
+        wkb = wkb.cast(pa.binary())
+    else:
+        wkb = pa.array(wkb, type = pa.binary())
+    table = table.append_column(field, wkb)
+    return table.replace_schema_metadata({**(table.schema.metadata or {}), b'geo': json.dumps(geo).encode()})
+
+def geometry_crs(table: pa.Table) -> pyproj.CRS:
+    """CRS of the geometry column of a table built by `with_geometry`."""
+    return pyproj.CRS.from_json_dict(json.loads(table.schema.metadata[b'geo'])['columns']['geometry']['crs'])
+
+def standardise_table(table: pa.Table) -> pa.Table:
+    """Arrow counterpart of `standardise_df`: rename columns to the names shared across vintages."""
+    names = util.standard_column_names(table.column_names)
+    # Keep the field and schema metadata describing the geometry column
+    schema = pa.schema([field.with_name(name) for field, name in zip(table.schema, names)], metadata = table.schema.metadata)
+    return pa.Table.from_arrays(table.columns, schema = schema)
+
+def filter_isin(df, column: str, values: Iterable[str]):
+    """Rows of a GeoDataFrame or Table whose `column` is one of `values`."""
+    if isinstance(df, pa.Table):
+        return df.filter(pc.is_in(df[column], value_set = pa.array(list(values), type = df.schema.field(column).type)))
+    return df[df[column].isin(values)]
+
+def filter_startswith(df, column: str, prefix: str):
+    """Rows of a GeoDataFrame or Table whose `column` starts with `prefix`."""
+    if isinstance(df, pa.Table):
+        return df.filter(pc.starts_with(df[column], prefix))
+    return df[df[column].str.startswith(prefix)]
+
+def add_derived_columns(table: pa.Table, attributes: Optional[DerivedAttributes] = None) -> pa.Table:
+    """Arrow counterpart of `add_derived`: append the derived attributes as float columns, computing them if not given."""
+    if attributes is None:
+        geoms = shapely.from_wkb(table['geometry'].to_numpy(zero_copy_only = False))
+        attributes = derived_attributes(gpd.GeoSeries(geoms, crs = geometry_crs(table)))
+    for name, values in derived_columns(attributes).items():
+        table = table.append_column(name, pa.array(values, type = pa.float64()))
+    return table
+
+def _restore_order(table: pa.Table, keep_order: bool = False) -> pa.Table:
+    # Files written by `write_parsed` are stored in spatial index order
+    if util.ROW_ORDER_COLUMN in table.column_names:
+        table = table.sort_by(util.ROW_ORDER_COLUMN)
+        if not keep_order:
+            table = table.drop([util.ROW_ORDER_COLUMN])
+    return table
+
+def _as_series(region, crs):
+    if region is None or isinstance(region, (gpd.GeoDataFrame, gpd.GeoSeries)):
+        return region
+    if isinstance(region, tuple):
+        region = box(*region)
+    elif isinstance(region, dict):
+        region = shape(region)
+    return gpd.GeoSeries([region], crs = crs)
+
+def _source_region(path: str, region, crs) -> Optional[BaseGeometry]:
+    # pyogrio expects filters in the CRS of the file
+    series = _as_series(region, crs)
+    if series is None:
+        return None
+    if series.crs is not None:
+        source_crs = pyogrio.read_info(path)['crs'] or 'EPSG:4269'
+        series = series.to_crs(source_crs)
+    return series.unary_union
+
+def _region(bbox, mask, crs) -> Optional[BaseGeometry]:
+    if bbox is not None:
+        series = _as_series(bbox, crs)
+        return box(*series.to_crs(crs).total_bounds)
+    if mask is not None:
+        return _as_series(mask, crs).to_crs(crs).unary_union
+    return None
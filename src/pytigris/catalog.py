@@ -0,0 +1,212 @@
+import json
+import functools
+import importlib
+import datetime
+import requests
+import pandas as pd
+from pathlib import Path
+from tqdm import tqdm
+from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from .constants import logger
+
+CATALOG_COLUMNS = ['layer', 'year', 'cb', 'resolution', 'scope', 'size']
+
+_RESOLUTIONS = ['500k', '5m', '20m']
+
+def _candidates(latest: int) -> list:
+    # Candidate (layer, cb, scope, resolutions, years) combinations, up to the year `latest`. `build_catalog` expands
+    # these into catalog rows, optionally verifying each one against the Census Bureau server. A resolution of None
+    # means the files are only published at a single scale, so the requested resolution is ignored.
+    return [
+        ('state', True, 'us', [None], [1990, 2000]),
+        ('state', True, 'us', _RESOLUTIONS, [2010, *range(2013, latest + 1)]),
+        ('state', False, 'us', [None], [2000, *range(2008, latest + 1)]),
+        ('county', True, 'us', [None], [1990, 2000]),
+        ('county', True, 'us', _RESOLUTIONS, [2010, *range(2013, latest + 1)]),
+        ('county', False, 'us', [None], [2000, *range(2008, latest + 1)]),
+        ('tract', True, 'state', [None], [1990, 2000]),
+        ('tract', True, 'state', ['500k'], [2010, *range(2013, latest + 1)]),
+        ('tract', True, 'us', ['500k'], range(2019, latest + 1)),
+        ('tract', False, 'state', [None], [2000, *range(2008, latest + 1)]),
+        ('bg', True, 'state', [None], [1990, 2000]),
+        ('bg', True, 'state', ['500k'], [2010, *range(2013, latest + 1)]),
+        ('bg', True, 'us', ['500k'], range(2019, latest + 1)),
+        ('bg', False, 'state', [None], [2000, *range(2008, latest + 1)]),
+        ('block', False, 'state', [None], [2000, *range(2010, latest + 1)]),
+        ('areawater', False, 'county', [None], range(2011, latest + 1)),
+        ('zcta', True, 'us', [None], [2000]),
+        ('zcta', True, 'state', [None], [2000]),
+        ('zcta', True, 'us', ['500k'], [2010, *range(2013, 2021)]),
+        ('zcta', False, 'us', [None], [2000, 2008, 2009, 2010, *range(2012, latest + 1)]),
+        ('zcta', False, 'state', [None], [2000, 2010]),
+        *[(sd, True, 'state', ['500k'], [2010, *range(2016, latest + 1)]) for sd in ('unsd', 'elsd', 'scsd')],
+        *[(sd, True, 'us', ['500k'], range(2019, latest + 1)) for sd in ('unsd', 'elsd', 'scsd')],
+        *[(sd, False, 'state', [None], [2000, *range(2008, latest + 1)]) for sd in ('unsd', 'elsd', 'scsd')],
+    ]
+
+@functools.cache
+def _load_catalog():
+    path = importlib.resources.files('pytigris') / 'data' / 'catalog.json'
+    with path.open() as f:
+        catalog = json.load(f)
+    df = pd.DataFrame(catalog['files'], columns = CATALOG_COLUMNS)
+    df['size'] = df['size'].astype('Int64')
+    return catalog['version'], catalog.get('verified', False), df
+
+def _catalog_latest() -> int:
+    # Most recent vintage in the shipped catalog
+    return int(_load_catalog()[2]['year'].max())
+
+def catalog_version() -> str:
+    """Version of the availability catalog shipped with the package."""
+    return _load_catalog()[0]
+
+def catalog_verified() -> bool:
+    """If the shipped catalog was checked against the Census Bureau server (see `build_catalog`), rather than listing the candidate files."""
+    return _load_catalog()[1]
+
+def get_catalog() -> pd.DataFrame:
+    """Availability catalog of every (layer, year, cb, resolution, scope) combination published by the Census Bureau.
+
+    `scope` is 'us' for national files, 'state' for files published per state and 'county' for files published per county.
+    `size` is the size of the national file, or the summed size of all per-state (or per-county) files, in bytes (where known).
+    """
+    return _load_catalog()[2].copy()
+
+def list_available(layer: Optional[str] = None, year: Optional[int] = None, cb: Optional[bool] = None, resolution: Optional[str] = None, scope: Optional[str] = None) -> pd.DataFrame:
+    """List the files available for download, optionally filtered.
+
+    Args:
+        layer (Optional[str], optional): Layer to filter for (e.g. 'state', 'county', 'tract', 'bg', 'zcta', 'unsd'). Defaults to None (all layers).
+        year (Optional[int], optional): Year to filter for. Defaults to None (all years).
+        cb (Optional[bool], optional): Filter for cartographic boundary (True) or TIGER/Line (False) files. Defaults to None (both).
+        resolution (Optional[str], optional): Resolution of the cartographic boundary file. Defaults to None (all resolutions).
+        scope (Optional[str], optional): 'us' for national files, 'state' for per-state files or 'county' for per-county files. Defaults to None (all).
+
+    Returns:
+        pandas.DataFrame: The matching rows of the availability catalog.
+    """
+    df = get_catalog()
+    if layer is not None:
+        df = df[df['layer'] == layer.lower()]
+    if year is not None:
+        df = df[df['year'] == year]
+    if cb is not None:
+        df = df[df['cb'] == cb]
+    if resolution is not None:
+        df = df[df['resolution'].isna() | (df['resolution'] == resolution)]
+    if scope is not None:
+        df = df[df['scope'] == scope]
+    return df.reset_index(drop = True)
+
+def _scope(state: str) -> str:
+    # Per-county files are requested with the 5-digit county FIPS code in place of the state
+    if state == 'us':
+        return 'us'
+    return 'county' if len(state) == 5 else 'state'
+
+def is_available(layer: str, year: int, cb: bool, resolution: Optional[str] = None, state: str = 'us', scope: Optional[str] = None) -> bool:
+    """If the file for a state ('us', a state FIPS code or a 5-digit county FIPS code) is listed in the availability catalog.
+
+    Pass scope ('us', 'state' or 'county') instead of a state to check whether any file is published at that scope.
+    Years after the latest vintage of the catalog are assumed to continue the files published in that vintage, so
+    newly released files can be downloaded before the catalog is refreshed.
+    """
+    scope = scope or _scope(state)
+    year = min(year, _catalog_latest())
+    return len(list_available(layer, year, cb, resolution, scope)) > 0
+
+def check_available(layer: str, year: int, cb: bool, resolution: Optional[str] = None, state: str = 'us', scope: Optional[str] = None):
+    """Raise a ValueError if the requested file is not listed in the availability catalog (see `is_available`)."""
+    scope = scope or _scope(state)
+    if is_available(layer, year, cb, resolution, scope = scope):
+        if year > _catalog_latest():
+            logger.info(f"The year {year} is newer than the availability catalog (version {catalog_version()}), assuming '{layer}' is still published")
+        return
+
+    kind = 'cartographic boundary' if cb else 'TIGER/Line'
+    years = sorted(list_available(layer, cb = cb, resolution = resolution if cb else None, scope = scope)['year'].unique())
+    if len(years) == 0:
+        raise ValueError(f"No {kind} files are available for '{layer}' at the {scope} level")
+    raise ValueError(f"No {kind} file is available for '{layer}' at the {scope} level for the year {year}. Years available: {', '.join(str(y) for y in years)}")
+
+def latest_year(layer: str, cb: Optional[bool] = None, scope: Optional[str] = None) -> int:
+    """Most recent year in the availability catalog for the given layer."""
+    df = list_available(layer, cb = cb, scope = scope)
+    if len(df) == 0:
+        raise ValueError(f"No files are available for '{layer}'")
+    return int(df['year'].max())
+
+def build_catalog(path: Optional[Union[str, Path]] = None, verify: bool = True, progress_bar: bool = True, latest: Optional[int] = None, workers: int = 16) -> pd.DataFrame:
+    """Build the availability catalog from the candidate combinations known to the package.
+
+    When `verify` is True, each candidate file is checked with a HEAD request: missing files are dropped
+    and file sizes are recorded. This is used to refresh `data/catalog.json` before each release:
+
+        python -m pytigris.catalog
+
+    Args:
+        path (Optional[Union[str, Path]], optional): If given, write the catalog (as JSON) to this path. Defaults to None.
+        verify (bool, optional): If to check each file against the Census Bureau server. Defaults to True.
+        progress_bar (bool, optional): If to display a progress bar while verifying. Defaults to True.
+        latest (Optional[int], optional): Most recent year to list. Defaults to None (the latest year of the shipped catalog,
+                                          plus one when verifying, so a newly released vintage is picked up).
+        workers (int, optional): Number of HEAD requests sent concurrently while verifying. Defaults to 16.
+
+    Returns:
+        pandas.DataFrame: The availability catalog.
+    """
+    from .util import tiger_url, get_state_fips_table, get_county_fips_table
+
+    if latest is None:
+        latest = _catalog_latest() + 1 if verify else _catalog_latest()
+
+    candidates = [
+        (layer, year, cb, resolution, scope)
+        for layer, cb, scope, resolutions, years in _candidates(latest)
+        for year in years
+        for resolution in resolutions
+    ]
+
+    rows = []
+    with ThreadPoolExecutor(max_workers = workers) as executor:
+        for layer, year, cb, resolution, scope in (tqdm(candidates) if progress_bar and verify else candidates):
+            size = None
+            if verify:
+                if scope == 'us':
+                    states = ['us']
+                elif scope == 'county':
+                    counties = get_county_fips_table()
+                    states = (counties.ST_FIPS + counties.CT_FIPS).tolist()
+                else:
+                    states = get_state_fips_table().fips.tolist()
+                sizes = list(executor.map(_remote_size, [tiger_url(year, layer, cb, resolution or '500k', state) for state in states]))
+                sizes = [s for s in sizes if s is not None]
+                if len(sizes) == 0:
+                    logger.info(f"Dropping unavailable catalog entry: {layer}, {year}, cb = {cb}, {resolution}, {scope}")
+                    continue
+                size = sum(sizes)
+            rows.append({'layer': layer, 'year': year, 'cb': cb, 'resolution': resolution, 'scope': scope, 'size': size})
+
+    if path is not None:
+        header = {'version': datetime.date.today().strftime('%Y.%m.%d'), 'verified': verify}
+        # One file entry per line keeps the catalog diffable between versions
+        with open(path, 'w') as f:
+            f.write(json.dumps(header)[:-1] + ', "files": [\n')
+            f.write(',\n'.join(json.dumps(row) for row in rows))
+            f.write('\n]}\n')
+
+    df = pd.DataFrame(rows, columns = CATALOG_COLUMNS)
+    df['size'] = df['size'].astype('Int64')
+    return df
+
+def _remote_size(url: str) -> Optional[int]:
+    r = requests.head(url, allow_redirects = True, timeout = 60)
+    if r.status_code != 200:
+        return None
+    return int(r.headers.get('Content-Length', 0))
+
+if __name__ == '__main__':
+    # Regenerate the shipped catalog
+    build_catalog(importlib.resources.files('pytigris') / 'data' / 'catalog.json')
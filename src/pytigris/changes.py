@@ -0,0 +1,107 @@
+import pandas as pd
+import geopandas as gpd
+from typing import Optional, Iterable, NamedTuple, Set
+from .util import get_geoids, derived_cache_path, layer_cache_key, validate_state
+from .enum_units import read_layer
+
+class VintageChanges(NamedTuple):
+    added: Set[str]
+    removed: Set[str]
+    geometry_changed: Set[str]
+    attribute_changed: Set[str]
+    unchanged: Set[str]
+
+def hash_features(df: gpd.GeoDataFrame) -> pd.DataFrame:
+    """Hash the normalized geometry and each attribute of every feature.
+
+    Geometries are normalized (canonical ring order and orientation) before hashing their WKB, so
+    the same boundary digitised in a different order hashes identically.
+
+    Args:
+        df (geopandas.GeoDataFrame): The layer to hash.
+
+    Raises:
+        ValueError: If the layer has no GEOID column, or GEOIDs are not unique.
+
+    Returns:
+        pandas.DataFrame: One uint64 column per attribute, plus 'geometry', indexed by GEOID.
+    """
+    geoids = get_geoids(df)
+    if not geoids.is_unique:
+        raise ValueError("Cannot hash features: GEOIDs are not unique")
+
+    hashes = {'geometry': pd.util.hash_array(df.geometry.normalize().to_wkb().values)}
+    for col in df.columns:
+        if col != df.geometry.name:
+            hashes[col] = pd.util.hash_array(df[col].values)
+
+    return pd.DataFrame(hashes, index = pd.Index(geoids.values, name = 'GEOID'))
+
+def get_feature_hashes(layer: str, year: int, state: Optional[str] = None, cb: bool = False, use_cache: bool = False, **kwargs) -> pd.DataFrame:
+    """Feature hashes (see `hash_features`) of a layer, cached alongside the layer if use_cache = True.
+
+    The cache is keyed on the get_* arguments that change the features (see `layer_cache_key`).
+    """
+    path = derived_cache_path(layer_cache_key(layer, year, cb, state, **kwargs), '.hashes.pkl')
+    if use_cache and path.exists() and not kwargs.get('refresh', False):
+        return pd.read_pickle(path)
+
+    hashes = hash_features(read_layer(layer, state = state, year = year, cb = cb, use_cache = use_cache, **kwargs))
+    if use_cache:
+        path.parent.mkdir(parents = True, exist_ok = True)
+        hashes.to_pickle(path)
+    return hashes
+
+def compare_vintages(layer: str, from_year: int, to_year: int, state: Optional[str] = None, cb: bool = False, attributes: Optional[Iterable[str]] = None, use_cache: bool = False, **kwargs) -> VintageChanges:
+    """Compare two vintages of a layer, feature by feature.
+
+    Features are matched by GEOID. Geometry changes are detected on the normalized geometry, and
+    attribute changes on the attributes present in both vintages (or those given in `attributes`).
+    With use_cache = True the feature hashes are cached, so later comparisons against either vintage
+    do not need to load the layer again.
+
+    Args:
+        layer (str): One of 'state', 'county', 'tract', 'bg', 'zcta', or a school district type ('unsd', 'elsd', 'scsd').
+        from_year (int): The earlier vintage.
+        to_year (int): The later vintage.
+        state (Optional[str], optional): The state to compare. Defaults to None.
+        cb (bool, optional): If to compare cartographic boundary files. Defaults to False.
+        attributes (Optional[Iterable[str]], optional): Attributes to compare. Defaults to None (all attributes common to both vintages).
+        use_cache (bool, optional): If to utilise the cache for the downloaded files and feature hashes. Defaults to False.
+        **kwargs: Further arguments passed on to the get_* function.
+
+    Raises:
+        ValueError: If a requested attribute is missing from either vintage.
+
+    Returns:
+        VintageChanges: GEOIDs added, removed, with changed geometry, with changed attributes, and unchanged.
+    """
+    if state is not None:
+        state = validate_state(state)
+
+    old = get_feature_hashes(layer, from_year, state, cb, use_cache, **kwargs)
+    new = get_feature_hashes(layer, to_year, state, cb, use_cache, **kwargs)
+
+    if attributes is None:
+        attributes = [col for col in old.columns.intersection(new.columns) if col != 'geometry']
+    else:
+        attributes = list(attributes)
+        missing = [col for col in attributes if col not in old.columns or col not in new.columns]
+        if len(missing) > 0:
+            raise ValueError(f"Attributes missing from one of the vintages: {', '.join(missing)}")
+
+    common = old.index.intersection(new.index)
+    added = new.index.difference(common)
+    removed = old.index.difference(common)
+    old, new = old.loc[common], new.loc[common]
+
+    geometry_changed = old['geometry'].values != new['geometry'].values
+    attribute_changed = (old[attributes].values != new[attributes].values).any(axis = 1)
+
+    return VintageChanges(
+        added = set(added),
+        removed = set(removed),
+        geometry_changed = set(common[geometry_changed]),
+        attribute_changed = set(common[attribute_changed]),
+        unchanged = set(common[~(geometry_changed | attribute_changed)])
+    )
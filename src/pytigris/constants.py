@@ -3,6 +3,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Minimum number of features each worker process should parse when reading in parallel
+MIN_FEATURES_PER_WORKER = 5000
+
+# Number of features held in memory at once when streaming a file (e.g. to partition it by county)
+STREAM_CHUNK_SIZE = 100000
+
+# World Cylindrical Equal Area: areas are exact everywhere, including Alaska, Hawaii and the territories
+EQUAL_AREA_CRS = 'EPSG:6933'
+
+# Conus Albers: the equal-area projection national maps of the US are drawn in, with Alaska, Hawaii and Puerto Rico as insets
+INSET_CRS = 'EPSG:5070'
+
 class Resolution(enum.Enum):
     R500K = '500k'
     R5M = '5m'
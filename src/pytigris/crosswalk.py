@@ -0,0 +1,105 @@
+import os
+import numpy as np
+import pandas as pd
+import shapely
+import requests
+import geopandas as gpd
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from .constants import EQUAL_AREA_CRS, logger
+from .catalog import is_available
+from .util import get_geoids, derived_cache_path, layer_cache_key, get_state_fips_table, validate_state
+from .enum_units import read_layer
+
+CROSSWALK_COLUMNS = ['GEOID_from', 'GEOID_to', 'area', 'weight']
+
+def area_crosswalk(source: gpd.GeoDataFrame, target: gpd.GeoDataFrame) -> pd.DataFrame:
+    """Area-weighted crosswalk from the features of one layer to those of another.
+
+    Candidate pairs are found with the target layer's STRtree spatial index, and the areas of their
+    intersections are computed in a single vectorized call, in an equal-area CRS.
+
+    Args:
+        source (geopandas.GeoDataFrame): The layer to move data from.
+        target (geopandas.GeoDataFrame): The layer to move data to.
+
+    Returns:
+        pandas.DataFrame: One row per intersecting (GEOID_from, GEOID_to) pair, with the area of the intersection
+                          (in square meters) and its weight: the share of the source feature's area falling in the target feature.
+    """
+    source = source.to_crs(EQUAL_AREA_CRS)
+    target = target.to_crs(EQUAL_AREA_CRS)
+    source_geoms = np.asarray(source.geometry.values)
+    target_geoms = np.asarray(target.geometry.values)
+
+    source_idx, target_idx = target.sindex.query(source.geometry, predicate = 'intersects')
+    area = shapely.area(shapely.intersection(source_geoms[source_idx], target_geoms[target_idx]))
+    # Features only touching along their boundaries
+    keep = area > 0
+    source_idx, target_idx, area = source_idx[keep], target_idx[keep], area[keep]
+
+    return pd.DataFrame({
+        'GEOID_from': get_geoids(source).values[source_idx],
+        'GEOID_to': get_geoids(target).values[target_idx],
+        'area': area,
+        'weight': area / shapely.area(source_geoms)[source_idx]
+    })
+
+def get_crosswalk(layer: str, from_year: int, to_year: int, state: Optional[str] = None, cb: bool = False, use_cache: bool = False, workers: Optional[int] = None, **kwargs) -> pd.DataFrame:
+    """Area-weighted crosswalk between two vintages of a layer (e.g. 2010 to 2020 tracts).
+
+    For layers published per state, the crosswalk is built state by state; when state is None all states
+    are processed in parallel. With use_cache = True each state's crosswalk is cached alongside the layers,
+    keyed on the get_* arguments changing the features (see `layer_cache_key`).
+
+    Args:
+        layer (str): One of 'tract', 'bg', 'county' (or any other layer accepted by `get_layer`).
+        from_year (int): The vintage to move data from.
+        to_year (int): The vintage to move data to.
+        state (Optional[str], optional): The state to build the crosswalk for. Defaults to None (all states).
+        cb (bool, optional): If to use the cartographic boundary files. Defaults to False.
+        use_cache (bool, optional): If to utilise the cache for the downloaded files and the crosswalks. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes used across states. None or -1 uses all cores. Defaults to None.
+        **kwargs: Further arguments passed on to the get_* function.
+
+    Returns:
+        pandas.DataFrame: One row per intersecting (GEOID_from, GEOID_to) pair, with the area of the intersection
+                          (in square meters) and its weight: the share of the GEOID_from feature's area falling in GEOID_to.
+    """
+    layer = layer.lower()
+    per_state = is_available(layer, from_year, cb, '500k', scope = 'state') and is_available(layer, to_year, cb, '500k', scope = 'state')
+    if state is not None or not per_state:
+        return _state_crosswalk(layer, from_year, to_year, state, cb, use_cache, kwargs)
+
+    states = get_state_fips_table().fips.tolist()
+    kwargs.setdefault('progress_bar', False)
+    with ProcessPoolExecutor(max_workers = workers if workers is not None and workers > 0 else os.cpu_count()) as executor:
+        frames = list(executor.map(_state_crosswalk_or_none, repeat(layer), repeat(from_year), repeat(to_year), states, repeat(cb), repeat(use_cache), repeat(kwargs)))
+
+    return pd.concat([df for df in frames if df is not None], ignore_index = True)
+
+def _state_crosswalk(layer: str, from_year: int, to_year: int, state: Optional[str], cb: bool, use_cache: bool, kwargs: dict) -> pd.DataFrame:
+    if state is not None:
+        state = validate_state(state)
+    # Named after both layers, so refreshing either file with new content removes it (see `store_blob`)
+    path = derived_cache_path(f'{layer_cache_key(layer, from_year, cb, state, **kwargs)}_to_{layer_cache_key(layer, to_year, cb, state, **kwargs)}', '.crosswalk.pkl')
+    if use_cache and path.exists() and not kwargs.get('refresh', False):
+        return pd.read_pickle(path)
+
+    df = area_crosswalk(
+        read_layer(layer, state = state, year = from_year, cb = cb, use_cache = use_cache, **kwargs),
+        read_layer(layer, state = state, year = to_year, cb = cb, use_cache = use_cache, **kwargs)
+    )
+    if use_cache:
+        path.parent.mkdir(parents = True, exist_ok = True)
+        df.to_pickle(path)
+    return df
+
+def _state_crosswalk_or_none(layer: str, from_year: int, to_year: int, state: str, cb: bool, use_cache: bool, kwargs: dict) -> Optional[pd.DataFrame]:
+    # Not every state or territory is published for every vintage
+    try:
+        return _state_crosswalk(layer, from_year, to_year, state, cb, use_cache, kwargs)
+    except requests.HTTPError:
+        logger.warning(f"Skipping state {state}: no {layer} file for {from_year} or {to_year}")
+        return None
@@ -0,0 +1,70 @@
+import os
+import numpy as np
+import shapely
+import geopandas as gpd
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+from .constants import EQUAL_AREA_CRS
+
+# Float columns added to layers loaded with derived = True
+DERIVED_COLUMNS = ['POINT_X', 'POINT_Y', 'MINX', 'MINY', 'MAXX', 'MAXY', 'AREA_M2']
+
+class DerivedAttributes(NamedTuple):
+    points: np.ndarray
+    bounds: np.ndarray
+    area: np.ndarray
+
+def derived_attributes(geometry: gpd.GeoSeries) -> DerivedAttributes:
+    """Compute the attributes most consumers of a layer derive from its geometries.
+
+    Representative points (guaranteed to lie within their feature, unlike centroids) and bounds are in
+    the CRS of the geometries; areas are in square metres, measured in an equal-area CRS. Missing and
+    empty geometries get NaN.
+
+    Args:
+        geometry (geopandas.GeoSeries): The geometries, e.g. the geometry column of a layer.
+
+    Returns:
+        DerivedAttributes: Arrays of representative points (n, 2), bounds (n, 4) as (minx, miny, maxx, maxy) and areas (n,).
+    """
+    geoms = np.asarray(geometry.values)
+    bounds = shapely.bounds(geoms)
+
+    # Missing and empty geometries keep NaN
+    present = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+    points = np.full((len(geoms), 2), np.nan)
+    surface = shapely.point_on_surface(geoms[present])
+    points[present] = np.column_stack([shapely.get_x(surface), shapely.get_y(surface)])
+
+    crs = geometry.crs if geometry.crs is not None else 'EPSG:4269'
+    area = np.full(len(geoms), np.nan)
+    area[present] = gpd.GeoSeries(geoms[present], crs = crs).to_crs(EQUAL_AREA_CRS).area.values
+    return DerivedAttributes(points, bounds, area)
+
+def derived_columns(attributes: DerivedAttributes) -> Dict[str, np.ndarray]:
+    """The attributes as float columns, named as in DERIVED_COLUMNS."""
+    arrays = [attributes.points[:, 0], attributes.points[:, 1], *attributes.bounds.T, attributes.area]
+    return dict(zip(DERIVED_COLUMNS, arrays))
+
+def take_derived(attributes: DerivedAttributes, rows: np.ndarray) -> DerivedAttributes:
+    """The attributes of a subset of features, selected by position."""
+    return DerivedAttributes(attributes.points[rows], attributes.bounds[rows], attributes.area[rows])
+
+def add_derived(df: gpd.GeoDataFrame, attributes: Optional[DerivedAttributes] = None) -> gpd.GeoDataFrame:
+    """Add the derived attributes of a layer as float columns (see `derived_attributes`), computing them if not given."""
+    if attributes is None:
+        attributes = derived_attributes(df.geometry)
+    return df.assign(**derived_columns(attributes))
+
+def save_derived(attributes: DerivedAttributes, path: Union[str, Path]):
+    """Save derived attributes to a .npz file."""
+    path = Path(path)
+    tmp_path = path.with_name(path.stem + '.tmp' + path.suffix)
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, points = attributes.points, bounds = attributes.bounds, area = attributes.area)
+    os.replace(tmp_path, path)
+
+def load_derived(path: Union[str, Path]) -> DerivedAttributes:
+    """Load derived attributes saved by `save_derived`."""
+    with np.load(path) as f:
+        return DerivedAttributes(f['points'], f['bounds'], f['area'])
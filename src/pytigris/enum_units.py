@@ -1,10 +1,19 @@
 import datetime
-from .util import standardize_year, construct_url, load_tiger, validate_county, validate_state
+import requests
+from .util import standardize_year, construct_url, load_tiger, stream_tiger, standardise_df, validate_county, validate_state, get_county_fips_table
+from .catalog import is_available
+from .national import NationalDataset, assemble_national
+from .precision import quantize
+from .derived import add_derived
+from .arrow import to_arrow, filter_isin, filter_startswith
 import geopandas as gpd
-from typing import Optional, Union, Iterable
+import pandas as pd
+import pyarrow as pa
+from shapely.geometry.base import BaseGeometry
+from typing import Optional, Union, Iterable, Iterator, Any
 from .constants import SchoolDistrict, logger
 
-def get_states(cb: bool = False, resolution: str = '500k', year: Optional[int] = None, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False) -> gpd.GeoDataFrame:
+def get_states(cb: bool = False, resolution: str = '500k', year: Optional[int] = None, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox: Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]] = None, mask: Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]] = None, crs: Optional[Any] = None, precision: Optional[float] = None, output: str = 'geopandas', derived: bool = False) -> Union[gpd.GeoDataFrame, pa.Table]:
     """Download shapefile for all states.
     
     States and Equivalent Entities are the primary governmental divisions of the
@@ -16,35 +25,58 @@ def get_states(cb: bool = False, resolution: str = '500k', year: Optional[int] =
     Args:
         cb (bool, optional): If cb (cartographic boundaries) is set to True, download a generalized (1:500k) states file. Defaults to False.
         resolution (str, optional): The resolution of the cartographic boundary file (if cb == True). Options are: '500k', '5m', '20m'. Defaults to '500k'.
-        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (year before current).
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
         refresh (bool, optional): If to refresh the cached file (if use_cache = True). Defaults to False.
         progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
         use_cache (bool, optional): If to utilise the cache for the downloaded zip file. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes used to parse the file. Set to -1 to use all cores. Defaults to None (single process).
+        bbox (Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this bounding box,
+                                                                    given as (minx, miny, maxx, maxy) in the CRS of the returned layer or as a GeoDataFrame/GeoSeries.
+                                                                    With use_cache = True only the matching features are read from disk. Defaults to None.
+        mask (Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this geometry.
+                                                                    Cannot be combined with bbox. Defaults to None.
+        crs (Optional[Any], optional): Coordinate reference system to return the boundaries in (anything accepted by pyproj, e.g. 'EPSG:5070').
+                                      With use_cache = True the reprojected layer is cached on disk and in memory. Defaults to None (NAD83, EPSG:4269).
+        precision (Optional[float], optional): Snap coordinates to a grid of this size, in the units of the returned CRS (e.g. 1e-6 degrees).
+                                              Boundaries shared by neighbouring features stay identical. With use_cache = True the quantized layer is cached. Defaults to None.
+        output (str, optional): 'geopandas' to return a GeoDataFrame, or 'arrow' to return a pyarrow.Table with WKB (GeoArrow) geometry.
+                                With pyogrio installed, Arrow output is read without building a GeoDataFrame,
+                                except when a file is first parsed into the cache (use_cache = True). Defaults to 'geopandas'.
+        derived (bool, optional): If to add float columns derived from the geometries: representative points (POINT_X, POINT_Y) and bounds
+                                  (MINX, MINY, MAXX, MAXY) in the returned CRS, and areas in square metres (AREA_M2).
+                                  With use_cache = True they are computed once and stored next to the cached layer. Defaults to False.
 
     Raises:
         ValueError: If invalid resolution is specified
         ValueError: If cb (cartographic boundaries) is False and year is 1990
 
     Returns:
-        geopandas.GeoDataFrame: GeoDataFrame of state boundaries from the given year
+        Union[geopandas.GeoDataFrame, pyarrow.Table]: GeoDataFrame of state boundaries from the given year (a Table if output = 'arrow')
     """
     if resolution not in {'500k', '5m', '20m'}:
         raise ValueError(f"Invalid resolution value: '{resolution}'. Should be one of: '500k', '5m', '20m'")
     
-    year = standardize_year(year)
+    year = standardize_year(year, 'state', cb)
     
     url = construct_url(year, 'state', cb, resolution)
 
-    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache)
+    # Files from 1990 and 2000 are dissolved as GeoDataFrames
+    legacy = cb and year in {1990, 2000}
 
-    if cb and year in {1990, 2000}:
+    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, workers = workers, bbox = bbox, mask = mask, crs = crs, precision = precision, output = 'geopandas' if legacy else output, derived = derived and not legacy)
+
+    if legacy:
         df = df.dissolve('STATEFP', aggfunc = {"AREA": sum, "PERIMETER": sum}).join(
             df.loc[:, ~df.columns.isin({'geometry', 'AREA', 'PERIMETER'})].groupby('STATEFP').first()
         ).reset_index()
+        if derived:
+            df = add_derived(df)
+        if output == 'arrow':
+            df = to_arrow(df)
 
     return df
 
-def get_counties(states: Optional[Union[str, Iterable[str]]] = None, cb: bool = False, resolution: str = '500k', year: Optional[int] = None, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False) -> gpd.GeoDataFrame:
+def get_counties(states: Optional[Union[str, Iterable[str]]] = None, cb: bool = False, resolution: str = '500k', year: Optional[int] = None, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox: Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]] = None, mask: Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]] = None, crs: Optional[Any] = None, precision: Optional[float] = None, output: str = 'geopandas', derived: bool = False) -> Union[gpd.GeoDataFrame, pa.Table]:
     """Download a US Counties shapefile, and optionally subset by state
 
 Description from the US Census Bureau (see link for source):
@@ -78,17 +110,33 @@ Description from the US Census Bureau (see link for source):
         states (Optional[Union[str, Iterable[str]]], optional): The two-digit FIPS code (string) of the state you want, or a list of codes if you want multiple states. Can also be state name or state abbreviation. Defaults to None (All states).
         cb (bool, optional): If cb (cartographic boundaries) is set to True, download a generalized (1:500k) counties file. Defaults to False.
         resolution (str, optional): The resolution of the cartographic boundary file (if cb == True). Options are: '500k', '5m', '20m'. Defaults to '500k'.
-        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (year before current).
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
         refresh (bool, optional): If to refresh the cached file (if use_cache = True). Defaults to False.
         progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
         use_cache (bool, optional): If to utilise the cache for the downloaded zip file. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes used to parse the file. Set to -1 to use all cores. Defaults to None (single process).
+        bbox (Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this bounding box,
+                                                                    given as (minx, miny, maxx, maxy) in the CRS of the returned layer or as a GeoDataFrame/GeoSeries.
+                                                                    With use_cache = True only the matching features are read from disk. Defaults to None.
+        mask (Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this geometry.
+                                                                    Cannot be combined with bbox. Defaults to None.
+        crs (Optional[Any], optional): Coordinate reference system to return the boundaries in (anything accepted by pyproj, e.g. 'EPSG:5070').
+                                      With use_cache = True the reprojected layer is cached on disk and in memory. Defaults to None (NAD83, EPSG:4269).
+        precision (Optional[float], optional): Snap coordinates to a grid of this size, in the units of the returned CRS (e.g. 1e-6 degrees).
+                                              Boundaries shared by neighbouring features stay identical. With use_cache = True the quantized layer is cached. Defaults to None.
+        output (str, optional): 'geopandas' to return a GeoDataFrame, or 'arrow' to return a pyarrow.Table with WKB (GeoArrow) geometry.
+                                With pyogrio installed, Arrow output is read without building a GeoDataFrame,
+                                except when a file is first parsed into the cache (use_cache = True). Defaults to 'geopandas'.
+        derived (bool, optional): If to add float columns derived from the geometries: representative points (POINT_X, POINT_Y) and bounds
+                                  (MINX, MINY, MAXX, MAXY) in the returned CRS, and areas in square metres (AREA_M2).
+                                  With use_cache = True they are computed once and stored next to the cached layer. Defaults to False.
 
     Raises:
         ValueError: If invalid resolution is specified
         ValueError: If cb (cartographic boundaries) is False and year is 1990
 
     Returns:
-        geopandas.GeoDataFrame: GeoDataFrame of county boundaries from the given year for the given state(s).
+        Union[geopandas.GeoDataFrame, pyarrow.Table]: GeoDataFrame of county boundaries from the given year for the given state(s) (a Table if output = 'arrow').
     """
     if resolution not in {'500k', '5m', '20m'}:
         raise ValueError(f"Invalid resolution value: '{resolution}'. Should be one of: '500k', '5m', '20m'")
@@ -98,25 +146,32 @@ Description from the US Census Bureau (see link for source):
             states = [states]
         states = [validate_state(state) for state in states]
     
-    year = standardize_year(year)
+    year = standardize_year(year, 'county', cb)
     
     url = construct_url(year, 'county', cb, resolution)
     
-    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache)
+    # Files from 1990 and 2000 are dissolved as GeoDataFrames
+    legacy = cb and year in {1990, 2000}
+
+    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, workers = workers, bbox = bbox, mask = mask, crs = crs, precision = precision, output = 'geopandas' if legacy else output, derived = derived and not legacy)
 
-    if cb and year in {1990, 2000}:
+    if legacy:
         df = df.dissolve(['STATEFP', "COUNTYFP"], aggfunc = {"AREA": sum, "PERIMETER": sum}).join(
             df.loc[:, ~df.columns.isin({'geometry', 'AREA', 'PERIMETER'})].groupby(['STATEFP', "COUNTYFP"]).first()
         ).reset_index()
+        if derived:
+            df = add_derived(df)
+        if output == 'arrow':
+            df = to_arrow(df)
 
     
     if states and len(states) > 0:
-        return df[df["STATEFP"].isin(states)]
+        return filter_isin(df, "STATEFP", states)
     else:
         return df
 
     
-def get_tracts(state:Optional[str] = None, counties:Optional[Union[str, Iterable[str]]] = None, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False) -> gpd.GeoDataFrame:
+def get_tracts(state:Optional[str] = None, counties:Optional[Union[str, Iterable[str]]] = None, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox: Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]] = None, mask: Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]] = None, crs: Optional[Any] = None, precision: Optional[float] = None, output: str = 'geopandas', derived: bool = False) -> Union[gpd.GeoDataFrame, pa.Table, NationalDataset]:
     """Download a Census tracts shapefile, and optionally subset by county
 
         Description from the US Census Bureau (see link for source):
@@ -149,32 +204,55 @@ def get_tracts(state:Optional[str] = None, counties:Optional[Union[str, Iterable
     Args:
         state (Optional[str], optional): The two-digit FIPS code (string) of the state you want.
                                         Can also be state name or state abbreviation.
-                                        When None and combined with cb = True, a national dataset of Census tracts will be
-                                        returned for years 2019 and later.
+                                        When None, a national dataset is returned: the national file where one is published
+                                        (cb = True, 2019 and later), otherwise a NationalDataset assembled from the per-state files.
                                         Defaults to None.
         counties (Optional[Union[str, Iterable[str]]], optional): The three-digit FIPS code (string) of the county you'd like to subset for,
                                                                     or an iterable of FIPS codes if you desire multiple counties.
                                                                     Can also be a county name or iterable of names. Defaults to None.
-        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (year before current).
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
         cb (bool, optional): If cb (cartographic boundaries) is set to True,
                              download a generalized (1:500k) tracts file. Defaults to False.
         refresh (bool, optional): If to refresh the cached file (if use_cache = True). Defaults to False.
         progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
         use_cache (bool, optional): If to utilise the cache for the downloaded zip file. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes used to parse the file. Set to -1 to use all cores. Defaults to None (single process).
+                                           When assembling a national dataset from per-state files, the number of states processed concurrently.
+        bbox (Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this bounding box,
+                                                                    given as (minx, miny, maxx, maxy) in the CRS of the returned layer or as a GeoDataFrame/GeoSeries.
+                                                                    With use_cache = True only the matching features are read from disk. Defaults to None.
+        mask (Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this geometry.
+                                                                    Cannot be combined with bbox. Defaults to None.
+        crs (Optional[Any], optional): Coordinate reference system to return the boundaries in (anything accepted by pyproj, e.g. 'EPSG:5070').
+                                      With use_cache = True the reprojected layer is cached on disk and in memory. Defaults to None (NAD83, EPSG:4269).
+        precision (Optional[float], optional): Snap coordinates to a grid of this size, in the units of the returned CRS (e.g. 1e-6 degrees).
+                                              Boundaries shared by neighbouring features stay identical. With use_cache = True the quantized layer is cached. Defaults to None.
+        output (str, optional): 'geopandas' to return a GeoDataFrame, or 'arrow' to return a pyarrow.Table with WKB (GeoArrow) geometry.
+                                With pyogrio installed, Arrow output is read without building a GeoDataFrame,
+                                except when a file is first parsed into the cache (use_cache = True). Defaults to 'geopandas'.
+        derived (bool, optional): If to add float columns derived from the geometries: representative points (POINT_X, POINT_Y) and bounds
+                                  (MINX, MINY, MAXX, MAXY) in the returned CRS, and areas in square metres (AREA_M2).
+                                  With use_cache = True they are computed once and stored next to the cached layer. Defaults to False.
 
     Raises:
         ValueError: If invalid year combination, or state or county is invalid.
 
     Returns:
-        geopandas.GeoDataFrame: GeoDataFrame of tract boundaries from the given year for the given state and counties.
+        Union[geopandas.GeoDataFrame, pyarrow.Table, NationalDataset]: GeoDataFrame of tract boundaries from the given year for the given state and counties
+                                                                       (a Table if output = 'arrow'), or a NationalDataset if assembled from per-state files
+                                                                       (a GeoDataFrame or Table if bbox or mask is given).
     """
-    year = standardize_year(year)
+    year = standardize_year(year, 'tract', cb)
 
     if state is None:
-        if year > 2018 and cb:
+        if is_available('tract', year, cb, '500k', scope = 'us'):
             state = 'us'
+        elif is_available('tract', year, cb, '500k', scope = 'state'):
+            if counties is not None:
+                raise ValueError("Must set state to filter tracts by counties.")
+            return _national('tract', year, cb, refresh, use_cache, workers, bbox, mask, crs, precision, output, derived)
         else:
-            raise ValueError("Must set year > 2018 and cb = True to retrieve tracts for entire US.")
+            raise ValueError(f"Tracts are not available for the year {year} (cb = {cb}).")
     else:
         state = validate_state(state)
 
@@ -185,12 +263,15 @@ def get_tracts(state:Optional[str] = None, counties:Optional[Union[str, Iterable
 
     url = construct_url(year, 'tract', cb, '500k', state)
 
-    df = load_tiger(url, refresh, progress_bar, use_cache)
+    # Files from 1990 and 2000 are dissolved as GeoDataFrames
+    legacy = cb and year in {1990, 2000}
+
+    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, workers = workers, bbox = bbox, mask = mask, crs = crs, precision = precision, output = 'geopandas' if legacy else output, derived = derived and not legacy)
 
     if counties is not None:
-        df = df[df["COUNTYFP"].isin(counties)]
+        df = filter_isin(df, "COUNTYFP", counties)
 
-    if cb and year in {1990, 2000}:
+    if legacy:
         if year == 1990:
             df["TRACTSUF"].fillna('00', inplace = True)
             df["TRACT"] = df["TRACTBASE"].astype('str') + df["TRACTSUF"].astype('str')
@@ -199,10 +280,14 @@ def get_tracts(state:Optional[str] = None, counties:Optional[Union[str, Iterable
         df = df.dissolve(['STATEFP', "COUNTYFP", "TRACT"], aggfunc = {"AREA": sum, "PERIMETER": sum}).join(
             df.loc[:, ~df.columns.isin({'geometry', 'AREA', 'PERIMETER'})].groupby(['STATEFP', "COUNTYFP", "TRACT"]).first()
         ).reset_index()
+        if derived:
+            df = add_derived(df)
+        if output == 'arrow':
+            df = to_arrow(df)
 
     return df
     
-def get_school_districts(state:Optional[str] = None, dtype:Union[str, SchoolDistrict] = SchoolDistrict.UNIFIED, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False) -> gpd.GeoDataFrame:
+def get_school_districts(state:Optional[str] = None, dtype:Union[str, SchoolDistrict] = SchoolDistrict.UNIFIED, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox: Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]] = None, mask: Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]] = None, crs: Optional[Any] = None, precision: Optional[float] = None, output: str = 'geopandas', derived: bool = False) -> Union[gpd.GeoDataFrame, pa.Table, NationalDataset]:
     """Download a school district shapefile into R
 
         From the US Census Bureau (see link for source):
@@ -221,49 +306,67 @@ def get_school_districts(state:Optional[str] = None, dtype:Union[str, SchoolDist
     Args:
         state (Optional[str], optional): The two-digit FIPS code (string) of the state you want.
                                         Can also be state name or state abbreviation.
-                                        When None and combined with cb = True, a national dataset of Census tracts will be
-                                        returned for years 2019 and later.
+                                        When None, a national dataset is returned: the national file where one is published
+                                        (cb = True, 2019 and later), otherwise a NationalDataset assembled from the per-state files.
                                         Defaults to None.
         dtype (Union[str, SchoolDistrict], optional): The type of school district to download.
                                                     Options are: 'unified', 'elementary', 'secondary'.
                                                     Defaults to SchoolDistrict.UNIFIED
-        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (year before current).
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
         cb (bool, optional): If cb (cartographic boundaries) is set to True,
                              download a generalized (1:500k) tracts file. Defaults to False.
         refresh (bool, optional): If to refresh the cached file (if use_cache = True). Defaults to False.
         progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
         use_cache (bool, optional): If to utilise the cache for the downloaded zip file. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes used to parse the file. Set to -1 to use all cores. Defaults to None (single process).
+                                           When assembling a national dataset from per-state files, the number of states processed concurrently.
+        bbox (Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this bounding box,
+                                                                    given as (minx, miny, maxx, maxy) in the CRS of the returned layer or as a GeoDataFrame/GeoSeries.
+                                                                    With use_cache = True only the matching features are read from disk. Defaults to None.
+        mask (Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this geometry.
+                                                                    Cannot be combined with bbox. Defaults to None.
+        crs (Optional[Any], optional): Coordinate reference system to return the boundaries in (anything accepted by pyproj, e.g. 'EPSG:5070').
+                                      With use_cache = True the reprojected layer is cached on disk and in memory. Defaults to None (NAD83, EPSG:4269).
+        precision (Optional[float], optional): Snap coordinates to a grid of this size, in the units of the returned CRS (e.g. 1e-6 degrees).
+                                              Boundaries shared by neighbouring features stay identical. With use_cache = True the quantized layer is cached. Defaults to None.
+        output (str, optional): 'geopandas' to return a GeoDataFrame, or 'arrow' to return a pyarrow.Table with WKB (GeoArrow) geometry.
+                                With pyogrio installed, Arrow output is read without building a GeoDataFrame,
+                                except when a file is first parsed into the cache (use_cache = True). Defaults to 'geopandas'.
+        derived (bool, optional): If to add float columns derived from the geometries: representative points (POINT_X, POINT_Y) and bounds
+                                  (MINX, MINY, MAXX, MAXY) in the returned CRS, and areas in square metres (AREA_M2).
+                                  With use_cache = True they are computed once and stored next to the cached layer. Defaults to False.
 
 
     Raises:
         ValueError: If invalid year combination, or state is invalid.
 
     Returns:
-        gpd.GeoDataFrame: GeoDataFrame of school district boundaries from the given year for the given state.
+        Union[gpd.GeoDataFrame, pyarrow.Table, NationalDataset]: GeoDataFrame of school district boundaries from the given year for the given state
+                                                                 (a Table if output = 'arrow'), or a NationalDataset if assembled from per-state files
+                                                                 (a GeoDataFrame or Table if bbox or mask is given).
     """
-    year = standardize_year(year)
+    if isinstance(dtype, str):
+        dtype = SchoolDistrict(dtype)
+
+    year = standardize_year(year, dtype.value, cb)
 
     if state is None:
-        if year > 2018 and cb:
+        if is_available(dtype.value, year, cb, '500k', scope = 'us'):
             state = 'us'
+        elif is_available(dtype.value, year, cb, '500k', scope = 'state'):
+            return _national(dtype.value, year, cb, refresh, use_cache, workers, bbox, mask, crs, precision, output, derived)
         else:
-            raise ValueError("Must set year > 2018 and cb = True to retrieve school districts for entire US.")
+            raise ValueError(f"School districts are not available for the year {year} (cb = {cb}).")
     else:
         state = validate_state(state)
-    # TODO: 2011 - 2015 cb = True do not have data
-    if cb and not (year >= 2016 or year == 2010):
-        raise ValueError("School districts for cb = True are only available for years: 2010, and 2016 onwards")
-
-    if isinstance(dtype, str):
-        dtype = SchoolDistrict(dtype)
 
     url = construct_url(year, dtype.value, cb, '500k', state)
 
-    df = load_tiger(url, refresh, progress_bar, use_cache)
+    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, workers = workers, bbox = bbox, mask = mask, crs = crs, precision = precision, output = output, derived = derived)
 
     return df
     
-def get_block_groups(state:Optional[str] = None, counties: Optional[Union[Iterable[str], str]] = None, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False) -> gpd.GeoDataFrame:
+def get_block_groups(state:Optional[str] = None, counties: Optional[Union[Iterable[str], str]] = None, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox: Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]] = None, mask: Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]] = None, crs: Optional[Any] = None, precision: Optional[float] = None, output: str = 'geopandas', derived: bool = False) -> Union[gpd.GeoDataFrame, pa.Table, NationalDataset]:
     """Download a Census block groups shapefile, and optionally subset by county
 
         Description from the US Census Bureau (see link for source):Standard block groups are clusters of
@@ -290,32 +393,55 @@ def get_block_groups(state:Optional[str] = None, counties: Optional[Union[Iterab
     Args:
         state (Optional[str], optional): The two-digit FIPS code (string) of the state you want.
                                         Can also be state name or state abbreviation.
-                                        When None and combined with cb = True, a national dataset of Census tracts will be
-                                        returned for years 2019 and later.
+                                        When None, a national dataset is returned: the national file where one is published
+                                        (cb = True, 2019 and later), otherwise a NationalDataset assembled from the per-state files.
                                         Defaults to None.
         counties (Optional[Union[str, Iterable[str]]], optional): The three-digit FIPS code (string) of the county you'd like to subset for,
                                                                     or an iterable of FIPS codes if you desire multiple counties.
                                                                     Can also be a county name or iterable of names. Defaults to None.
-        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (year before current).
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
         cb (bool, optional): If cb (cartographic boundaries) is set to True,
                              download a generalized (1:500k) tracts file. Defaults to False.
         refresh (bool, optional): If to refresh the cached file (if use_cache = True). Defaults to False.
         progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
         use_cache (bool, optional): If to utilise the cache for the downloaded zip file. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes used to parse the file. Set to -1 to use all cores. Defaults to None (single process).
+                                           When assembling a national dataset from per-state files, the number of states processed concurrently.
+        bbox (Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this bounding box,
+                                                                    given as (minx, miny, maxx, maxy) in the CRS of the returned layer or as a GeoDataFrame/GeoSeries.
+                                                                    With use_cache = True only the matching features are read from disk. Defaults to None.
+        mask (Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]], optional): Only return features intersecting this geometry.
+                                                                    Cannot be combined with bbox. Defaults to None.
+        crs (Optional[Any], optional): Coordinate reference system to return the boundaries in (anything accepted by pyproj, e.g. 'EPSG:5070').
+                                      With use_cache = True the reprojected layer is cached on disk and in memory. Defaults to None (NAD83, EPSG:4269).
+        precision (Optional[float], optional): Snap coordinates to a grid of this size, in the units of the returned CRS (e.g. 1e-6 degrees).
+                                              Boundaries shared by neighbouring features stay identical. With use_cache = True the quantized layer is cached. Defaults to None.
+        output (str, optional): 'geopandas' to return a GeoDataFrame, or 'arrow' to return a pyarrow.Table with WKB (GeoArrow) geometry.
+                                With pyogrio installed, Arrow output is read without building a GeoDataFrame,
+                                except when a file is first parsed into the cache (use_cache = True). Defaults to 'geopandas'.
+        derived (bool, optional): If to add float columns derived from the geometries: representative points (POINT_X, POINT_Y) and bounds
+                                  (MINX, MINY, MAXX, MAXY) in the returned CRS, and areas in square metres (AREA_M2).
+                                  With use_cache = True they are computed once and stored next to the cached layer. Defaults to False.
 
     Raises:
         ValueError: If invalid year combination, or state or county is invalid.
 
     Returns:
-        geopandas.GeoDataFrame: GeoDataFrame of block group boundaries from the given year for the given state and counties.
+        Union[geopandas.GeoDataFrame, pyarrow.Table, NationalDataset]: GeoDataFrame of block group boundaries from the given year for the given state and counties
+                                                                       (a Table if output = 'arrow'), or a NationalDataset if assembled from per-state files
+                                                                       (a GeoDataFrame or Table if bbox or mask is given).
     """
-    year = standardize_year(year)
+    year = standardize_year(year, 'bg', cb)
 
     if state is None:
-        if year > 2018 and cb:
+        if is_available('bg', year, cb, '500k', scope = 'us'):
             state = 'us'
+        elif is_available('bg', year, cb, '500k', scope = 'state'):
+            if counties is not None:
+                raise ValueError("Must set state to filter block groups by counties.")
+            return _national('bg', year, cb, refresh, use_cache, workers, bbox, mask, crs, precision, output, derived)
         else:
-            raise ValueError("Must set year > 2018 and cb = True to retrieve block groups for entire US.")
+            raise ValueError(f"Block groups are not available for the year {year} (cb = {cb}).")
     else:
         state = validate_state(state)
 
@@ -326,27 +452,184 @@ def get_block_groups(state:Optional[str] = None, counties: Optional[Union[Iterab
 
     url = construct_url(year, 'bg', cb, '500k', state)
 
-    df = load_tiger(url, refresh, progress_bar, use_cache)
+    # Files from 1990 and 2000 are dissolved as GeoDataFrames
+    legacy = cb and year in {1990, 2000}
+
+    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, workers = workers, bbox = bbox, mask = mask, crs = crs, precision = precision, output = 'geopandas' if legacy else output, derived = derived and not legacy)
 
     if counties is not None:
-        df = df[df["COUNTYFP"].isin(counties)]
+        df = filter_isin(df, "COUNTYFP", counties)
 
-    if cb and year in {1990, 2000}:
+    if legacy:
         if year == 2000:
             df["TRACT"] = df["TRACT"].str.pad(6, fillchar='0')
             df["GEOID"] = df.apply(lambda row: row.STATEFP + row.COUNTYFP + row.TRACT + row.BLKGROUP, axis = 1)
         df = df.dissolve('GEOID', aggfunc = {"AREA": sum, "PERIMETER": sum}).join(
             df.loc[:, ~df.columns.isin({'geometry', 'AREA', 'PERIMETER'})].groupby('GEOID').first()
         ).reset_index()
+        if derived:
+            df = add_derived(df)
+        if output == 'arrow':
+            df = to_arrow(df)
 
     return df
 
-def get_zctas(state:Optional[str] = None, starts_with: Optional[str] = None, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False) -> gpd.GeoDataFrame:
+def get_blocks(state: str, counties: Optional[Union[str, Iterable[str]]] = None, year: Optional[int] = None, chunksize: Optional[int] = None, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, crs: Optional[Any] = None, precision: Optional[float] = None, output: str = 'geopandas') -> Union[gpd.GeoDataFrame, pa.Table, Iterator[Union[gpd.GeoDataFrame, pa.Table]]]:
+    """Download a Census blocks shapefile for a state, and optionally subset by county
+
+        Description from the US Census Bureau (see link for source):
+        Census blocks are statistical areas bounded on all sides by visible features, such as streets, roads,
+        streams, and railroad tracks, and/or by non visible boundaries such as city, town, township, and
+        county limits, and short line-of-sight extensions of streets and roads. Generally, census blocks are
+        small in area; for example, a block in a city. Census blocks in suburban and rural areas may be large,
+        irregular and bounded by a variety of features, such as roads, streams, and/or transmission line
+        rights-of-way. In remote areas census blocks may encompass hundreds of square miles. Census blocks
+        cover all territory in the United States, Puerto Rico, and the Island areas. Blocks do not cross the
+        boundaries of any entity for which the Census Bureau tabulates data.
+
+        Block files are large (millions of features for the largest states), so counties are filtered while the
+        file is read, and with chunksize set the blocks are returned in chunks rather than all at once. With
+        use_cache = True the file is split by county on first use, and later calls only read the requested counties.
+
+    Args:
+        state (str): The two-digit FIPS code (string) of the state you want.
+                     Can also be state name or state abbreviation.
+        counties (Optional[Union[str, Iterable[str]]], optional): The three-digit FIPS code (string) of the county you'd like to subset for,
+                                                                    or an iterable of FIPS codes if you desire multiple counties.
+                                                                    Can also be a county name or iterable of names. Defaults to None.
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
+        chunksize (Optional[int], optional): If set, return an iterator over GeoDataFrames of at most this many blocks. Defaults to None.
+        refresh (bool, optional): If to refresh the cached file (if use_cache = True). Defaults to False.
+        progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
+        use_cache (bool, optional): If to utilise the cache for the downloaded zip file and its county partitions. Defaults to False.
+        crs (Optional[Any], optional): Coordinate reference system to return the boundaries in (anything accepted by pyproj, e.g. 'EPSG:5070').
+                                      Defaults to None (NAD83, EPSG:4269).
+        precision (Optional[float], optional): Snap coordinates to a grid of this size, in the units of the returned CRS (e.g. 1e-6 degrees).
+                                              Boundaries shared by neighbouring features stay identical. Defaults to None.
+        output (str, optional): 'geopandas' to return GeoDataFrames, or 'arrow' to return pyarrow.Tables with WKB (GeoArrow) geometry.
+                                Defaults to 'geopandas'.
 
-    if year is None:
-        year = 2020
-        # Log retrieving date if not specified
-        logger.info(f"Retrieving data for the year: {year}")
+    Raises:
+        ValueError: If invalid year combination, or state, county, chunksize, precision or output is invalid.
+
+    Returns:
+        Union[geopandas.GeoDataFrame, pyarrow.Table, Iterator[Union[geopandas.GeoDataFrame, pyarrow.Table]]]: GeoDataFrame of block boundaries from the given year for the given state and counties
+                                                                         (a Table if output = 'arrow'), or an iterator over chunks of it if chunksize is set.
+    """
+    if state is None:
+        raise ValueError("Must set state: blocks are only published per state.")
+    state = validate_state(state)
+
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"Invalid chunksize: {chunksize}. Should be a positive integer")
+
+    if precision is not None and precision <= 0:
+        raise ValueError(f"Invalid precision: {precision}. Should be a positive grid size")
+
+    if output not in {'geopandas', 'arrow'}:
+        raise ValueError(f"Invalid output value: '{output}'. Should be one of: 'geopandas', 'arrow'")
+
+    year = standardize_year(year, 'block', False)
+
+    if counties is not None:
+        if isinstance(counties, str):
+            counties = [counties]
+        counties = {validate_county(state, county) for county in counties}
+
+    url = construct_url(year, 'block', False, '500k', state)
+
+    chunks = _block_chunks(url, year, counties, chunksize, refresh, progress_bar, use_cache, crs, precision, output)
+    if chunksize is not None:
+        return chunks
+
+    df = next(chunks)
+    chunks.close()
+    return df
+
+def _block_chunks(url: str, year: int, counties: Optional[Iterable[str]], chunksize: Optional[int], refresh: bool, progress_bar: bool, use_cache: bool, crs, precision: Optional[float], output: str) -> Iterator[Union[gpd.GeoDataFrame, pa.Table]]:
+    for df in stream_tiger(url, 'COUNTYFP', counties, chunksize, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache):
+        df = standardise_df(df)
+        if year >= 2020:
+            # 2020 blocks suffix their columns with 20, like the 00 and 10 suffixes of earlier vintages
+            df = df.rename(columns = {col: col[:-2] for col in df.columns if col[-2:] == '20'})
+        if crs is not None:
+            df = df.to_crs(crs)
+        if precision is not None:
+            df = quantize(df, precision)
+        yield to_arrow(df) if output == 'arrow' else df
+
+def get_area_water(state: str, counties: Optional[Union[str, Iterable[str]]] = None, year: Optional[int] = None, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, crs: Optional[Any] = None, output: str = 'geopandas') -> Union[gpd.GeoDataFrame, pa.Table]:
+    """Download an area water shapefile for a state, and optionally subset by county
+
+        Description from the US Census Bureau (see link for source):
+        The area hydrography shapefile contains the geometry and attributes of both perennial and intermittent
+        area hydrography features, including ponds, lakes, oceans, swamps, glaciers, and the area covered by
+        large streams represented as double-line drainage. Single-line drainage water features can be found in the
+        linear hydrography shapefile.
+
+        Area water is published per county, so one file is downloaded for each county.
+
+    Args:
+        state (str): The two-digit FIPS code (string) of the state you want.
+                     Can also be state name or state abbreviation.
+        counties (Optional[Union[str, Iterable[str]]], optional): The three-digit FIPS code (string) of the county you'd like water for,
+                                                                    or an iterable of FIPS codes if you desire multiple counties.
+                                                                    Can also be a county name or iterable of names. Defaults to None (all counties in the state).
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
+        refresh (bool, optional): If to refresh the cached files (if use_cache = True). Defaults to False.
+        progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
+        use_cache (bool, optional): If to utilise the cache for the downloaded zip files. Defaults to False.
+        crs (Optional[Any], optional): Coordinate reference system to return the boundaries in (anything accepted by pyproj, e.g. 'EPSG:5070').
+                                      With use_cache = True the reprojected layers are cached. Defaults to None (NAD83, EPSG:4269).
+        output (str, optional): 'geopandas' to return a GeoDataFrame, or 'arrow' to return a pyarrow.Table with WKB (GeoArrow) geometry.
+                                Defaults to 'geopandas'.
+
+    Raises:
+        ValueError: If invalid year, or state, county or output is invalid.
+
+    Returns:
+        Union[geopandas.GeoDataFrame, pyarrow.Table]: GeoDataFrame of area water features from the given year for the given state and counties
+                                                      (a Table if output = 'arrow').
+    """
+    if state is None:
+        raise ValueError("Must set state: area water is only published per county.")
+    state = validate_state(state)
+
+    if output not in {'geopandas', 'arrow'}:
+        raise ValueError(f"Invalid output value: '{output}'. Should be one of: 'geopandas', 'arrow'")
+
+    year = standardize_year(year, 'areawater', False)
+
+    all_counties = counties is None
+    if all_counties:
+        county_table = get_county_fips_table()
+        counties = county_table[county_table["ST_FIPS"] == state].CT_FIPS.tolist()
+    else:
+        if isinstance(counties, str):
+            counties = [counties]
+        counties = {validate_county(state, county) for county in counties}
+
+    frames = []
+    for county in sorted(counties):
+        url = construct_url(year, 'areawater', False, '500k', state + county)
+        try:
+            frames.append(load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, crs = crs))
+        except requests.HTTPError:
+            if not all_counties:
+                raise
+            # The county list includes counties that have since been dissolved or renamed
+            logger.warning(f"Skipping county {state}{county}: no area water file for {year}")
+
+    # Counties are combined as GeoDataFrames, whose columns are aligned by name
+    if len(frames) == 0:
+        df = gpd.GeoDataFrame(columns = ['geometry'], geometry = 'geometry', crs = crs or 'EPSG:4269')
+    else:
+        df = gpd.GeoDataFrame(pd.concat(frames, ignore_index = True), crs = frames[0].crs)
+    return to_arrow(df) if output == 'arrow' else df
+
+def get_zctas(state:Optional[str] = None, starts_with: Optional[str] = None, year: Optional[int] = None, cb: bool = False, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox: Optional[Union[tuple, gpd.GeoDataFrame, gpd.GeoSeries]] = None, mask: Optional[Union[dict, BaseGeometry, gpd.GeoDataFrame, gpd.GeoSeries]] = None, crs: Optional[Any] = None, precision: Optional[float] = None, output: str = 'geopandas', derived: bool = False) -> Union[gpd.GeoDataFrame, pa.Table]:
+
+    year = standardize_year(year, 'zcta', cb)
 
     if year > 2010 and state is not None:
         raise ValueError("ZCTAs are only available by state for 2000 and 2010")
@@ -365,10 +648,69 @@ def get_zctas(state:Optional[str] = None, starts_with: Optional[str] = None, yea
     
     url = construct_url(year, 'zcta', cb, '500k', state = state)
 
-    df = load_tiger(url, refresh, progress_bar, use_cache)
+    df = load_tiger(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, workers = workers, bbox = bbox, mask = mask, crs = crs, precision = precision, output = output, derived = derived)
 
     if starts_with is not None:
-        zctaCol = [col for col in df.columns if col.upper().startswith('ZCTA')][0]
-        df = df[df[zctaCol].str.startswith(starts_with)]
+        columns = df.column_names if output == 'arrow' else df.columns
+        zctaCol = [col for col in columns if col.upper().startswith('ZCTA')][0]
+        df = filter_startswith(df, zctaCol, starts_with)
 
     return df
+
+
+def _national(layer: str, year: int, cb: bool, refresh: bool, use_cache: bool, workers: Optional[int], bbox, mask, crs, precision, output, derived) -> Union[gpd.GeoDataFrame, pa.Table, NationalDataset]:
+    dataset = assemble_national(layer, year, cb = cb, refresh = refresh, use_cache = use_cache, workers = workers, crs = crs, precision = precision, derived = derived)
+    if bbox is not None or mask is not None:
+        df = dataset.read(bbox = bbox, mask = mask)
+        return to_arrow(df) if output == 'arrow' else df
+    return dataset
+
+def get_layer(layer: str, state: Optional[str] = None, year: Optional[int] = None, cb: bool = False, **kwargs) -> Union[gpd.GeoDataFrame, pa.Table, NationalDataset, Iterator[gpd.GeoDataFrame]]:
+    """Download a layer by name, dispatching to the matching get_* function.
+
+    Args:
+        layer (str): One of 'state', 'county', 'tract', 'bg', 'block', 'zcta', 'areawater', or a school district type ('unsd', 'elsd', 'scsd').
+        state (Optional[str], optional): The state to retrieve (or subset to, for national layers). Defaults to None.
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
+        cb (bool, optional): If to download the cartographic boundary file. Defaults to False.
+        **kwargs: Further arguments passed on to the get_* function.
+
+    Raises:
+        ValueError: If the layer is unknown.
+
+    Returns:
+        Union[geopandas.GeoDataFrame, pyarrow.Table, NationalDataset, Iterator[geopandas.GeoDataFrame]]: Whatever the get_* function returns:
+            usually a GeoDataFrame, but a NationalDataset for layers only published per state when state is None (see `read_layer`).
+    """
+    layer = layer.lower()
+    if layer == 'state':
+        df = get_states(cb = cb, year = year, **kwargs)
+        return df if state is None else filter_isin(df, "STATEFP", [validate_state(state)])
+    elif layer == 'county':
+        return get_counties(states = state, cb = cb, year = year, **kwargs)
+    elif layer == 'tract':
+        return get_tracts(state = state, year = year, cb = cb, **kwargs)
+    elif layer == 'bg':
+        return get_block_groups(state = state, year = year, cb = cb, **kwargs)
+    elif layer == 'zcta':
+        return get_zctas(state = state, year = year, cb = cb, **kwargs)
+    elif layer in {'block', 'areawater'}:
+        if cb:
+            raise ValueError(f"'{layer}' is not published as cartographic boundary files")
+        if layer == 'block':
+            return get_blocks(state = state, year = year, **kwargs)
+        return get_area_water(state = state, year = year, **kwargs)
+
+    try:
+        dtype = SchoolDistrict(layer)
+    except ValueError:
+        raise ValueError(f"Unknown layer: '{layer}'")
+    return get_school_districts(state = state, dtype = dtype, year = year, cb = cb, **kwargs)
+
+def read_layer(layer: str, state: Optional[str] = None, year: Optional[int] = None, cb: bool = False, **kwargs) -> gpd.GeoDataFrame:
+    """Like `get_layer`, but national layers assembled from per-state files are read into a single GeoDataFrame.
+
+    Used by functions that need every feature of the layer in memory (adjacency, change detection, raster indexes).
+    """
+    df = get_layer(layer, state = state, year = year, cb = cb, **kwargs)
+    return df.read() if isinstance(df, NationalDataset) else df
@@ -0,0 +1,213 @@
+import os
+import json
+import shutil
+import tempfile
+import requests
+import pyproj
+import pandas as pd
+import geopandas as gpd
+import pyarrow.parquet as pq
+from pathlib import Path
+from itertools import repeat
+from shapely.geometry import box, shape
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Iterable, Iterator, List, Union
+from .constants import logger
+from . import util
+
+class NationalDataset:
+    """Handle to a national layer assembled from per-state files.
+
+    The layer is stored on disk as one GeoParquet file per state, and nothing is loaded until `read`
+    (or iteration) asks for it.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        # Temporary directory holding an uncached dataset, removed once the dataset is no longer referenced
+        self._tmp: Optional[tempfile.TemporaryDirectory] = None
+
+    def __repr__(self) -> str:
+        return f"NationalDataset('{self.path}', states = {len(self.states)})"
+
+    def __iter__(self) -> Iterator[gpd.GeoDataFrame]:
+        """Iterate over the states of the layer, loading one state at a time."""
+        for state in self.states:
+            yield self.read(states = state)
+
+    @property
+    def states(self) -> List[str]:
+        """FIPS codes of the states in the dataset."""
+        return sorted(path.stem for path in self.path.glob('*.parquet'))
+
+    @property
+    def n_features(self) -> int:
+        """Number of features in the dataset, read from the file metadata."""
+        return sum(pq.read_metadata(path).num_rows for path in self._paths())
+
+    @property
+    def crs(self) -> Optional[pyproj.CRS]:
+        """CRS of the dataset, read from the file metadata (None if the dataset has no states)."""
+        paths = self._paths()
+        if len(paths) == 0:
+            return None
+        column = self._geometry_metadata(paths[0])
+        # GeoParquet files without a crs entry are in OGC:CRS84, and a null entry means the CRS is unknown
+        if 'crs' not in column:
+            return pyproj.CRS.from_user_input('OGC:CRS84')
+        return pyproj.CRS.from_user_input(column['crs']) if column['crs'] is not None else None
+
+    def bounds(self, state: str) -> tuple:
+        """Bounds (minx, miny, maxx, maxy) of a state's features, read from the file metadata."""
+        return tuple(self._geometry_metadata(self.path / f'{state}.parquet')['bbox'])
+
+    def read(self, states: Optional[Union[str, Iterable[str]]] = None, columns: Optional[List[str]] = None, bbox = None, mask = None) -> gpd.GeoDataFrame:
+        """Load (part of) the dataset.
+
+        Args:
+            states (Optional[Union[str, Iterable[str]]], optional): State(s) to load, as FIPS codes, names or abbreviations. Defaults to None (all states).
+            columns (Optional[List[str]], optional): Columns to load. Defaults to None (all columns).
+            bbox (optional): Only return features intersecting this bounding box (minx, miny, maxx, maxy), or the bounds of a GeoDataFrame/GeoSeries.
+                             States whose bounds do not intersect it are not read. Defaults to None.
+            mask (optional): Only return features intersecting this geometry (or GeoJSON dict, or GeoDataFrame/GeoSeries). Defaults to None.
+                             GeoDataFrames and GeoSeries given as bbox or mask are reprojected to the CRS of the dataset.
+
+        Returns:
+            geopandas.GeoDataFrame: The features of the selected states.
+        """
+        if isinstance(states, str):
+            states = [states]
+        states = self.states if states is None else [util.validate_state(state) for state in states]
+
+        region = self._region(bbox, mask)
+
+        frames = []
+        for state in states:
+            if region is not None and not box(*self.bounds(state)).intersects(region):
+                continue
+            df = gpd.read_parquet(self.path / f'{state}.parquet', columns = columns)
+            if region is not None:
+                df = df.iloc[df.sindex.query(region, predicate = 'intersects')].sort_index()
+            frames.append(df)
+
+        if len(frames) == 0:
+            paths = self._paths()
+            if len(paths) == 0:
+                # No state was published for the layer
+                return gpd.GeoDataFrame(columns = columns or ['geometry'], geometry = 'geometry')
+            return gpd.GeoDataFrame(gpd.read_parquet(paths[0], columns = columns).iloc[:0])
+        return gpd.GeoDataFrame(pd.concat(frames, ignore_index = True), crs = frames[0].crs)
+
+    def _region(self, bbox, mask):
+        # bbox and mask as a geometry in the CRS of the dataset, as `geopandas.read_file` takes them
+        if isinstance(bbox, (gpd.GeoDataFrame, gpd.GeoSeries)):
+            return box(*self._to_crs(bbox).total_bounds)
+        if bbox is not None:
+            return box(*bbox)
+        if isinstance(mask, (gpd.GeoDataFrame, gpd.GeoSeries)):
+            return self._to_crs(mask).unary_union
+        if isinstance(mask, dict):
+            return shape(mask)
+        return mask
+
+    def _to_crs(self, df: Union[gpd.GeoDataFrame, gpd.GeoSeries]) -> Union[gpd.GeoDataFrame, gpd.GeoSeries]:
+        crs = self.crs
+        if df.crs is None or crs is None or df.crs.equals(crs):
+            return df
+        return df.to_crs(crs)
+
+    def _paths(self) -> List[Path]:
+        return [self.path / f'{state}.parquet' for state in self.states]
+
+    def _geometry_metadata(self, path: Path) -> dict:
+        geo = json.loads(pq.read_schema(path).metadata[b'geo'])
+        return geo['columns'][geo['primary_column']]
+
+def assemble_national(layer: str, year: int, cb: bool = False, refresh: bool = False, use_cache: bool = False, workers: Optional[int] = None, crs = None, precision: Optional[float] = None, derived: bool = False, **kwargs) -> NationalDataset:
+    """Assemble a national layer from per-state files.
+
+    States are downloaded and parsed concurrently in worker processes, and each is written to its own
+    GeoParquet file, so the national layer is never held in memory. With use_cache = True the dataset is
+    stored under CACHE_PATH/datasets and a complete dataset is reused by later calls unless refresh = True.
+    Otherwise it is written to a temporary directory, removed once the returned dataset is no longer referenced.
+
+    Args:
+        layer (str): One of 'tract', 'bg', or a school district type ('unsd', 'elsd', 'scsd').
+        year (int): The year for which to fetch the boundaries.
+        cb (bool, optional): If to use the cartographic boundary files. Defaults to False.
+        refresh (bool, optional): If to rebuild the dataset (and refresh the cached files, if use_cache = True). Defaults to False.
+        use_cache (bool, optional): If to utilise the cache for the downloaded zip files and the dataset. Defaults to False.
+        workers (Optional[int], optional): Number of states processed concurrently. Defaults to None (all cores).
+        crs (optional): Coordinate reference system to store the boundaries in. Defaults to None (NAD83, EPSG:4269).
+        precision (Optional[float], optional): Grid size to snap coordinates to, in the units of the CRS. Defaults to None.
+        derived (bool, optional): If to store representative points, bounds and areas as float columns (see `derived_attributes`). Defaults to False.
+        **kwargs: Further arguments passed on to the get_* function.
+
+    Returns:
+        NationalDataset: Handle to the assembled dataset.
+    """
+    name = Path(util.tiger_url(year, layer, cb, '500k', 'us')).stem
+    if crs is not None:
+        name += '.' + util.crs_key(crs)
+    if precision is not None:
+        name += '.' + util.precision_key(precision)
+    if derived:
+        name += '.derived'
+    path = util.CACHE_PATH / 'datasets' / name
+
+    if use_cache and (path / '_SUCCESS').exists() and not refresh:
+        return NationalDataset(path)
+
+    if use_cache:
+        path.parent.mkdir(parents = True, exist_ok = True)
+        tmp = Path(tempfile.mkdtemp(prefix = f'.{name}.', dir = path.parent))
+    else:
+        tmp_dir = tempfile.TemporaryDirectory(prefix = f'{name}.')
+        tmp = Path(tmp_dir.name)
+
+    states = util.get_state_fips_table().fips.tolist()
+    kwargs = {**kwargs, 'year': year, 'cb': cb, 'refresh': refresh, 'use_cache': use_cache, 'crs': crs, 'precision': precision, 'derived': derived, 'progress_bar': False}
+    try:
+        with ProcessPoolExecutor(max_workers = workers if workers is not None and workers > 0 else os.cpu_count()) as executor:
+            list(executor.map(_write_state, repeat(layer), states, repeat(tmp), repeat(kwargs)))
+    except BaseException:
+        if use_cache:
+            shutil.rmtree(tmp, ignore_errors = True)
+        else:
+            tmp_dir.cleanup()
+        raise
+    (tmp / '_SUCCESS').touch()
+
+    if not use_cache:
+        dataset = NationalDataset(tmp)
+        dataset._tmp = tmp_dir
+        return dataset
+
+    # The dataset is built aside and moved into place, so states of an earlier build never linger in it
+    if path.exists():
+        stale = Path(tempfile.mkdtemp(prefix = f'.{name}.', dir = path.parent))
+        try:
+            os.replace(path, stale / name)
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(stale, ignore_errors = True)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # Another process moved its dataset into place first
+        shutil.rmtree(tmp, ignore_errors = True)
+    return NationalDataset(path)
+
+def _write_state(layer: str, state: str, path: Path, kwargs: dict):
+    from .enum_units import get_layer
+
+    try:
+        df = get_layer(layer, state = state, **kwargs)
+    except requests.HTTPError:
+        # Not every state or territory is published for every vintage
+        logger.warning(f"Skipping state {state}: no {layer} file available")
+        return
+
+    tmp_path = path / f'{state}.parquet.part'
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, path / f'{state}.parquet')
@@ -0,0 +1,109 @@
+import numpy as np
+import shapely
+import geopandas as gpd
+from pathlib import Path
+from typing import NamedTuple, Tuple, Union
+
+class EncodedGeometry(NamedTuple):
+    geometry_type: int
+    coords: np.ndarray
+    offsets: Tuple[np.ndarray, ...]
+    origin: np.ndarray
+    grid_size: float
+    crs: str
+
+def quantize(df: gpd.GeoDataFrame, grid_size: float) -> gpd.GeoDataFrame:
+    """Snap the coordinates of a layer to a grid.
+
+    Every vertex is snapped independently, so a boundary shared by two features is snapped identically in
+    both and the layer stays free of gaps and overlaps. Features made invalid by snapping (e.g. a collapsed
+    spike) are repaired, keeping only their polygonal part.
+
+    Args:
+        df (geopandas.GeoDataFrame): The layer.
+        grid_size (float): Size of the grid, in the units of the layer's CRS (e.g. 1e-6 degrees, or 1 metre).
+
+    Raises:
+        ValueError: If grid_size is not positive.
+
+    Returns:
+        geopandas.GeoDataFrame: The layer with snapped coordinates.
+    """
+    geoms = snap_geometries(np.asarray(df.geometry.values), grid_size)
+    return df.set_geometry(gpd.GeoSeries(geoms, index = df.index, crs = df.crs))
+
+def snap_geometries(geoms: np.ndarray, grid_size: float) -> np.ndarray:
+    """Snap an array of shapely geometries to a grid (see `quantize`)."""
+    if grid_size <= 0:
+        raise ValueError(f"Invalid precision: {grid_size}. Should be a positive grid size")
+
+    geoms = shapely.set_precision(geoms, grid_size, mode = 'pointwise')
+    invalid = ~shapely.is_valid(geoms) & ~shapely.is_missing(geoms)
+    if invalid.any():
+        polygonal = np.isin(shapely.get_type_id(geoms), [3, 6])
+        geoms[invalid & polygonal] = _polygonal_part(shapely.make_valid(geoms[invalid & polygonal]))
+        geoms[invalid & ~polygonal] = shapely.make_valid(geoms[invalid & ~polygonal])
+    return geoms
+
+def _polygonal_part(geoms: np.ndarray) -> np.ndarray:
+    # make_valid returns collapsed rings as lines or points alongside the remaining polygons
+    parts, index = shapely.get_parts(geoms, return_index = True)
+    polygons, part_index = shapely.get_parts(parts, return_index = True)
+    index = index[part_index]
+    keep = shapely.get_type_id(polygons) == 3
+
+    # Features without any polygonal part (e.g. collapsed entirely) are left empty
+    result = np.empty(len(geoms), dtype = object)
+    result[:] = shapely.from_wkt('POLYGON EMPTY')
+    features, indices = np.unique(index[keep], return_inverse = True)
+    if len(features) > 0:
+        result[features] = shapely.multipolygons(polygons[keep], indices = indices)
+    single = shapely.get_num_geometries(result) == 1
+    result[single] = shapely.get_geometry(result[single], 0)
+    return result
+
+def encode_geometry(geometry: gpd.GeoSeries, grid_size: float) -> EncodedGeometry:
+    """Encode geometries as integer offsets on a grid, a compact format for storage.
+
+    Coordinates are stored as 32-bit integers (64-bit if the extent of the layer needs it) counting grid
+    cells from the lower left corner of the layer, in the ragged array layout of `shapely.to_ragged_array`.
+    Layers mixing Polygon and MultiPolygon features decode to MultiPolygons.
+
+    Args:
+        geometry (geopandas.GeoSeries): The geometries to encode, e.g. the geometry column of a layer.
+        grid_size (float): Size of the grid, in the units of the geometries' CRS.
+
+    Raises:
+        ValueError: If grid_size is not positive.
+
+    Returns:
+        EncodedGeometry: The encoded geometries.
+    """
+    if grid_size <= 0:
+        raise ValueError(f"Invalid precision: {grid_size}. Should be a positive grid size")
+
+    geometry_type, coords, offsets = shapely.to_ragged_array(np.asarray(geometry.values))
+    origin = coords.min(axis = 0) if len(coords) > 0 else np.zeros(2)
+    cells = np.round((coords - origin) / grid_size)
+    dtype = np.int32 if len(cells) == 0 or cells.max() <= np.iinfo(np.int32).max else np.int64
+
+    crs = geometry.crs.to_wkt() if geometry.crs is not None else ''
+    return EncodedGeometry(int(geometry_type), cells.astype(dtype), offsets, origin, float(grid_size), crs)
+
+def decode_geometry(encoded: EncodedGeometry) -> gpd.GeoSeries:
+    """Decode geometries encoded by `encode_geometry`."""
+    coords = encoded.coords * encoded.grid_size + encoded.origin
+    geoms = shapely.from_ragged_array(shapely.GeometryType(encoded.geometry_type), coords, encoded.offsets)
+    return gpd.GeoSeries(geoms, crs = encoded.crs or None)
+
+def save_encoded(encoded: EncodedGeometry, path: Union[str, Path]):
+    """Save encoded geometries to a (compressed) .npz file."""
+    offsets = {f'offsets_{i}': offset for i, offset in enumerate(encoded.offsets)}
+    np.savez_compressed(path, geometry_type = encoded.geometry_type, coords = encoded.coords, origin = encoded.origin,
+                        grid_size = encoded.grid_size, crs = encoded.crs, **offsets)
+
+def load_encoded(path: Union[str, Path]) -> EncodedGeometry:
+    """Load encoded geometries saved by `save_encoded`."""
+    with np.load(path) as f:
+        offsets = tuple(f[f'offsets_{i}'] for i in range(sum(key.startswith('offsets_') for key in f.files)))
+        return EncodedGeometry(int(f['geometry_type']), f['coords'], offsets, f['origin'], float(f['grid_size']), str(f['crs']))
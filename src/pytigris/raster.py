@@ -0,0 +1,273 @@
+import os
+import json
+import tempfile
+import numpy as np
+import shapely
+import pyproj
+import geopandas as gpd
+from pathlib import Path
+from scipy import ndimage
+from typing import Any, NamedTuple, Optional
+from .util import get_geoids, derived_cache_path, layer_cache_key, standardize_year
+from .enum_units import read_layer
+
+# Grid codes of cells outside every feature, and of cells crossed by a boundary
+NO_FEATURE = -1
+AMBIGUOUS = -2
+
+# Number of cells along each side of a tile of the grid
+TILE_SIZE = 512
+
+class RasterIndex(NamedTuple):
+    # Position in blocks of the cells of each tile, or -1 for tiles whose cells all hold the same code
+    tiles: np.ndarray
+    # Code of the cells of tiles not in blocks
+    fill: np.ndarray
+    # Cells of the remaining tiles, of shape (number of tiles, tile size, tile size)
+    blocks: np.ndarray
+    origin: tuple
+    resolution: float
+    # Number of rows and columns of cells of the grid
+    shape: tuple
+    # If longitudes west of the antimeridian are shifted by 360 degrees
+    wrap: bool
+    geoids: np.ndarray
+    geometries: np.ndarray
+    crs: pyproj.CRS
+
+def build_raster_index(df: gpd.GeoDataFrame, resolution: float, tile_size: int = TILE_SIZE) -> RasterIndex:
+    """Rasterize a layer into a grid of feature positions, for fast point lookups (see `lookup_points`).
+
+    The grid is split into square tiles, built one at a time. Only tiles overlapping a feature's bounds are
+    rasterized, and tiles whose cells all hold the same code are stored as that code alone, so national layers
+    only take memory for the cells near their boundaries. In geographic CRSs, layers crossing the antimeridian
+    (e.g. with the Aleutian Islands) have the longitudes west of it shifted by 360 degrees, so the grid does not
+    span the whole globe.
+
+    Cells crossed by a feature boundary are marked as ambiguous: the boundaries are traced with vertices at
+    most half a cell apart, and the cells holding them are dilated by one cell to catch boundaries clipping
+    a cell corner. The remaining cells of a tile form connected regions, each inside a single feature or outside
+    all of them, so only one cell centre per region is tested against the layer.
+
+    Args:
+        df (geopandas.GeoDataFrame): The layer, e.g. from `get_tracts`, `get_block_groups`, `get_counties` or `get_zctas`.
+        resolution (float): Size of the grid cells, in the units of the layer's CRS (e.g. 0.001 degrees, or 100 metres).
+        tile_size (int, optional): Number of cells along each side of a tile. Defaults to TILE_SIZE.
+
+    Raises:
+        ValueError: If resolution or tile_size is not positive, or the layer has no CRS.
+
+    Returns:
+        RasterIndex: The tiled grid, holding the position of the feature covering each cell, NO_FEATURE (-1) or AMBIGUOUS (-2).
+    """
+    return _build_raster_index(df, resolution, tile_size)
+
+def lookup_points(index: RasterIndex, x, y, crs: Optional[Any] = None) -> np.ndarray:
+    """GEOIDs of the features containing points, using a raster index (see `build_raster_index`).
+
+    Points in cells inside a single feature are answered by indexing the grid. Only points in cells crossed
+    by a boundary are tested against the geometries. Points on a shared boundary are assigned to one of the features.
+
+    Args:
+        index (RasterIndex): The raster index of the layer.
+        x (array-like): x coordinates (e.g. longitudes) of the points.
+        y (array-like): y coordinates (e.g. latitudes) of the points.
+        crs (Optional[Any], optional): CRS of the points, if it differs from the layer's (e.g. 'EPSG:4326' for GPS coordinates). Defaults to None.
+
+    Returns:
+        numpy.ndarray: GEOID of the feature containing each point, or None for points outside every feature.
+    """
+    x, y = np.asarray(x, dtype = float), np.asarray(y, dtype = float)
+    if crs is not None and not pyproj.CRS.from_user_input(crs).equals(index.crs):
+        x, y = pyproj.Transformer.from_crs(crs, index.crs, always_xy = True).transform(x, y)
+    if index.wrap:
+        x = np.where(x < 0, x + 360, x)
+
+    n_rows, n_cols = index.shape
+    cols = np.floor((x - index.origin[0]) / index.resolution)
+    rows = np.floor((index.origin[1] - y) / index.resolution)
+    inside = (cols >= 0) & (cols < n_cols) & (rows >= 0) & (rows < n_rows)
+
+    codes = np.full(len(x), NO_FEATURE, dtype = np.int32)
+    codes[inside] = _grid_codes(index, rows[inside].astype(np.intp), cols[inside].astype(np.intp))
+
+    ambiguous = np.flatnonzero(codes == AMBIGUOUS)
+    codes[ambiguous] = NO_FEATURE
+    if len(ambiguous) > 0:
+        point_idx, feature_idx = shapely.STRtree(index.geometries).query(shapely.points(x[ambiguous], y[ambiguous]), predicate = 'intersects')
+        codes[ambiguous[point_idx[::-1]]] = feature_idx[::-1]
+
+    geoids = np.empty(len(x), dtype = object)
+    found = codes >= 0
+    geoids[found] = index.geoids[codes[found]]
+    return geoids
+
+def get_raster_index(layer: str, resolution: float, year: Optional[int] = None, state: Optional[str] = None, cb: bool = False, use_cache: bool = False, **kwargs) -> RasterIndex:
+    """Raster index of a layer, for assigning large numbers of points to features (see `lookup_points`).
+
+    With use_cache = True the tiles of the grid are saved next to the layer as a .npy file and memory-mapped
+    on later calls, so only the cells looked up are read from disk.
+
+    Args:
+        layer (str): One of 'county', 'tract', 'bg', 'zcta' (or any other layer accepted by `get_layer`).
+        resolution (float): Size of the grid cells, in the units of the layer's CRS (e.g. 0.001 degrees, or 100 metres with crs = 'EPSG:5070').
+        year (Optional[int], optional): The year for which to fetch the boundaries. Defaults to None (latest year available).
+        state (Optional[str], optional): The state to build the index for. Defaults to None (the whole country).
+        cb (bool, optional): If to use the cartographic boundary file. Defaults to False.
+        use_cache (bool, optional): If to utilise the cache for the downloaded file and the grid. Defaults to False.
+        **kwargs: Further arguments passed on to the get_* function (e.g. crs).
+
+    Raises:
+        ValueError: If resolution is not positive, or the layer is not available.
+
+    Returns:
+        RasterIndex: The tiled grid, holding the position of the feature covering each cell, NO_FEATURE (-1) or AMBIGUOUS (-2).
+    """
+    if resolution <= 0:
+        raise ValueError(f"Invalid resolution: {resolution}. Should be a positive cell size")
+
+    year = standardize_year(year, layer, cb)
+    df = read_layer(layer, state = state, year = year, cb = cb, use_cache = use_cache, **kwargs)
+    if not use_cache:
+        return build_raster_index(df, resolution)
+
+    path = derived_cache_path(layer_cache_key(layer, year, cb, state, **kwargs), f'.r{resolution:g}.npy')
+    meta_path = path.with_suffix('.json')
+
+    geoids = get_geoids(df).values.astype(str)
+    if path.exists() and meta_path.exists() and not kwargs.get('refresh', False):
+        meta = json.loads(meta_path.read_text())
+        # The layer may have changed since the grid was built
+        if meta['geoids'] == geoids.tolist():
+            blocks = np.load(path, mmap_mode = 'r')[:meta['blocks']]
+            return RasterIndex(np.array(meta['tiles'], dtype = np.int32), np.array(meta['fill'], dtype = np.int32), blocks, tuple(meta['origin']),
+                               meta['resolution'], tuple(meta['shape']), meta['wrap'], geoids, _index_geometries(df, meta['wrap']), df.crs)
+
+    path.parent.mkdir(parents = True, exist_ok = True)
+    # The tiles are written to disk as they are built, rather than held in memory
+    fd, tmp_path = tempfile.mkstemp(dir = path.parent, prefix = path.stem + '.', suffix = '.tmp.npy')
+    os.close(fd)
+    try:
+        index = _build_raster_index(df, resolution, TILE_SIZE, Path(tmp_path))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    meta_path.write_text(json.dumps({
+        'origin': index.origin,
+        'resolution': index.resolution,
+        'shape': index.shape,
+        'wrap': index.wrap,
+        'tiles': index.tiles.tolist(),
+        'fill': index.fill.tolist(),
+        'blocks': len(index.blocks),
+        'geoids': geoids.tolist()
+    }))
+    return index._replace(blocks = np.load(path, mmap_mode = 'r')[:len(index.blocks)])
+
+def _build_raster_index(df: gpd.GeoDataFrame, resolution: float, tile_size: int = TILE_SIZE, path: Optional[Path] = None) -> RasterIndex:
+    # With a path, the tiles are written to a memory-mapped .npy file
+    if resolution <= 0:
+        raise ValueError(f"Invalid resolution: {resolution}. Should be a positive cell size")
+    if tile_size <= 0:
+        raise ValueError(f"Invalid tile size: {tile_size}. Should be a positive number of cells")
+    if df.crs is None:
+        raise ValueError("Cannot build a raster index for a layer without a CRS")
+
+    geoms = np.asarray(df.geometry.values)
+    wrap = _crosses_antimeridian(geoms, df.crs)
+    geoms = _index_geometries(df, wrap)
+
+    minx, miny, maxx, maxy = shapely.total_bounds(geoms)
+    shape = (max(int(np.ceil((maxy - miny) / resolution)), 1), max(int(np.ceil((maxx - minx) / resolution)), 1))
+    origin = (float(minx), float(maxy))
+
+    # Only tiles overlapping the bounds of a feature need rasterizing
+    n_tiles = (-(-shape[0] // tile_size), -(-shape[1] // tile_size))
+    extent = tile_size * resolution
+    tile_rows, tile_cols = np.divmod(np.arange(n_tiles[0] * n_tiles[1]), n_tiles[1])
+    left, top = origin[0] + tile_cols * extent, origin[1] - tile_rows * extent
+    tree = shapely.STRtree(geoms)
+    tile_idx, feature_idx = tree.query(shapely.box(left, top - extent, left + extent, top))
+    order = np.argsort(tile_idx, kind = 'stable')
+    tile_idx, feature_idx = tile_idx[order], feature_idx[order]
+    occupied, starts = np.unique(tile_idx, return_index = True)
+    ends = np.append(starts[1:], len(tile_idx))
+
+    tiles = np.full(n_tiles, -1, dtype = np.int32)
+    fill = np.full(n_tiles, NO_FEATURE, dtype = np.int32)
+    blocks_shape = (len(occupied), tile_size, tile_size)
+    if path is None:
+        blocks = np.empty(blocks_shape, dtype = np.int32)
+    else:
+        blocks = np.lib.format.open_memmap(path, mode = 'w+', dtype = np.int32, shape = blocks_shape)
+
+    boundaries = shapely.boundary(geoms)
+    n_blocks = 0
+    for tile, start, end in zip(occupied, starts, ends):
+        cells = _rasterize_tile(tree, boundaries[feature_idx[start:end]], (left[tile], top[tile]), resolution, tile_size)
+        if (cells == cells[0, 0]).all():
+            fill[tile_rows[tile], tile_cols[tile]] = cells[0, 0]
+        else:
+            blocks[n_blocks] = cells
+            tiles[tile_rows[tile], tile_cols[tile]] = n_blocks
+            n_blocks += 1
+    if path is not None:
+        blocks.flush()
+
+    return RasterIndex(tiles, fill, blocks[:n_blocks], origin, float(resolution), shape, wrap, get_geoids(df).values.astype(str), geoms, df.crs)
+
+def _rasterize_tile(tree: shapely.STRtree, boundaries: np.ndarray, corner: tuple, resolution: float, tile_size: int) -> np.ndarray:
+    # The tile is rasterized with a margin of one cell, so boundaries just outside it are dilated into its edge cells
+    origin = (corner[0] - resolution, corner[1] + resolution)
+    shape = (tile_size + 2, tile_size + 2)
+    extent = shape[0] * resolution
+
+    boundaries = shapely.clip_by_rect(boundaries, origin[0], origin[1] - extent, origin[0] + extent, origin[1])
+    coords = shapely.get_coordinates(shapely.segmentize(boundaries, resolution / 2))
+    ambiguous = np.zeros(shape, dtype = bool)
+    rows, cols = _cells(coords[:, 0], coords[:, 1], origin, resolution, shape)
+    ambiguous[rows, cols] = True
+    ambiguous = ndimage.binary_dilation(ambiguous, structure = np.ones((3, 3), dtype = bool))
+
+    # Regions of cells not crossed by a boundary lie entirely within one feature (or none)
+    labels, n_regions = ndimage.label(~ambiguous)
+    region_feature = np.full(n_regions + 1, NO_FEATURE, dtype = np.int32)
+    region_feature[0] = AMBIGUOUS
+    if n_regions > 0:
+        flat = labels.ravel()
+        _, first = np.unique(flat, return_index = True)
+        first = first[flat[first] > 0]
+        rows, cols = np.unravel_index(first, shape)
+        centres = shapely.points(origin[0] + (cols + 0.5) * resolution, origin[1] - (rows + 0.5) * resolution)
+        point_idx, feature_idx = tree.query(centres, predicate = 'within')
+        # Keep the first feature of any overlapping features
+        region_feature[flat[first[point_idx[::-1]]]] = feature_idx[::-1]
+    return region_feature[labels][1:-1, 1:-1]
+
+def _grid_codes(index: RasterIndex, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    tile_size = index.blocks.shape[1]
+    tile_rows, tile_cols = rows // tile_size, cols // tile_size
+    slots = index.tiles[tile_rows, tile_cols]
+    codes = index.fill[tile_rows, tile_cols]
+    in_block = slots >= 0
+    codes[in_block] = index.blocks[slots[in_block], rows[in_block] % tile_size, cols[in_block] % tile_size]
+    return codes
+
+def _crosses_antimeridian(geoms: np.ndarray, crs) -> bool:
+    if not pyproj.CRS.from_user_input(crs).is_geographic or len(geoms) == 0:
+        return False
+    minx, _, maxx, _ = shapely.total_bounds(geoms)
+    return bool(maxx - minx > 180)
+
+def _index_geometries(df: gpd.GeoDataFrame, wrap: bool) -> np.ndarray:
+    geoms = np.asarray(df.geometry.values)
+    if not wrap:
+        return geoms
+    # Shift longitudes west of the antimeridian east by 360 degrees
+    return shapely.transform(geoms, lambda coords: np.where(coords[:, :1] < 0, coords + [360, 0], coords))
+
+def _cells(x: np.ndarray, y: np.ndarray, origin: tuple, resolution: float, shape: tuple):
+    rows = np.clip(np.floor((origin[1] - y) / resolution).astype(np.intp), 0, shape[0] - 1)
+    cols = np.clip(np.floor((x - origin[0]) / resolution).astype(np.intp), 0, shape[1] - 1)
+    return rows, cols
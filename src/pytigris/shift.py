@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import shapely
+import pyproj
+import geopandas as gpd
+from typing import NamedTuple, Tuple
+from .constants import INSET_CRS
+from .util import derived_cache_path, geometry_digest
+
+class Inset(NamedTuple):
+    # Bounds (lon/lat) the state is anchored to, so subsets of a state land where the whole state would
+    bounds: Tuple[float, float, float, float]
+    # Scale applied when preserve_area = False
+    scale: float
+
+INSETS = {
+    '02': Inset((-170.0, 51.2, -129.9, 71.5), 0.5),
+    '15': Inset((-160.3, 18.9, -154.8, 22.3), 1.0),
+    '72': Inset((-67.3, 17.9, -65.2, 18.55), 2.5)
+}
+
+# Position (in INSET_CRS) of the centre of each inset, by position and preserve_area
+INSET_POSITIONS = {
+    ('below', False): {'02': (-1700000, 500000), '15': (-500000, 250000), '72': (900000, 200000)},
+    ('below', True): {'02': (-2100000, 0), '15': (-800000, 250000), '72': (900000, 200000)},
+    ('outside', False): {'02': (-2400000, 3900000), '15': (-2800000, 1300000), '72': (2200000, 400000)},
+    ('outside', True): {'02': (-2900000, 4300000), '15': (-2800000, 1300000), '72': (2200000, 400000)}
+}
+
+def shift_geometry(gdf: gpd.GeoDataFrame, position: str = 'below', preserve_area: bool = False, use_cache: bool = False) -> gpd.GeoDataFrame:
+    """Move Alaska, Hawaii and Puerto Rico into insets for national maps, like `shift_geometry` in R tigris.
+
+    The layer is projected to Conus Albers (EPSG:5070). The features of each of the three states (selected by STATEFP)
+    are then rotated upright, scaled and moved with a single affine transform per state. All other features are left in place.
+    With use_cache = True the shifted geometries are cached, keyed by the layer's geometries and the options.
+
+    Args:
+        gdf (geopandas.GeoDataFrame): The layer, with a STATEFP column (e.g. from `get_states`, `get_counties` or `get_tracts`).
+        position (str, optional): 'below' (insets beneath the lower 48 states) or 'outside' (insets close to
+                                  their true positions). Defaults to 'below'.
+        preserve_area (bool, optional): If to keep the true sizes of the states. Otherwise Alaska is shrunk and Puerto Rico enlarged. Defaults to False.
+        use_cache (bool, optional): If to utilise the cache for the shifted geometries. Defaults to False.
+
+    Raises:
+        ValueError: If position is not 'below' or 'outside', or the layer has no STATEFP column or no CRS.
+
+    Returns:
+        geopandas.GeoDataFrame: The shifted layer, in EPSG:5070.
+    """
+    if position not in {'below', 'outside'}:
+        raise ValueError(f"Invalid position: '{position}'. Should be one of: 'below', 'outside'")
+    if 'STATEFP' not in gdf.columns:
+        raise ValueError("Cannot shift a layer without a STATEFP column")
+    if gdf.crs is None:
+        raise ValueError("Cannot shift a layer without a CRS")
+
+    path = derived_cache_path(f'shift_{geometry_digest(gdf)}', f'.{position}{".area" if preserve_area else ""}.pkl')
+    if use_cache and path.exists():
+        geoms = shapely.from_wkb(pd.read_pickle(path).values)
+    else:
+        geoms = _shift(gdf, position, preserve_area)
+        if use_cache:
+            path.parent.mkdir(parents = True, exist_ok = True)
+            pd.Series(shapely.to_wkb(geoms)).to_pickle(path)
+
+    return gdf.set_geometry(gpd.GeoSeries(geoms, index = gdf.index, crs = INSET_CRS))
+
+def _shift(gdf: gpd.GeoDataFrame, position: str, preserve_area: bool) -> np.ndarray:
+    geoms = np.asarray(gdf.to_crs(INSET_CRS).geometry.values).copy()
+    statefp = gdf['STATEFP'].astype(str).values
+    to_inset = pyproj.Transformer.from_crs('EPSG:4269', INSET_CRS, always_xy = True)
+
+    for state, inset in INSETS.items():
+        selected = statefp == state
+        if not selected.any():
+            continue
+        matrix, offset = _affine(inset, INSET_POSITIONS[(position, preserve_area)][state], preserve_area, to_inset)
+        geoms[selected] = shapely.transform(geoms[selected], lambda coords: coords @ matrix.T + offset)
+    return geoms
+
+def _affine(inset: Inset, target: Tuple[float, float], preserve_area: bool, to_inset: pyproj.Transformer) -> Tuple[np.ndarray, np.ndarray]:
+    # Rotate about the centre of the inset so its parallels are horizontal, scale, then move the centre to the target
+    minx, miny, maxx, maxy = inset.bounds
+    lon, lat = (minx + maxx) / 2, (miny + maxy) / 2
+    anchor = np.array(to_inset.transform(lon, lat))
+    west, east = np.array(to_inset.transform(lon - 0.5, lat)), np.array(to_inset.transform(lon + 0.5, lat))
+    angle = -np.arctan2(*(east - west)[::-1])
+
+    scale = 1.0 if preserve_area else inset.scale
+    matrix = scale * np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    return matrix, np.array(target) - matrix @ anchor
@@ -1,5 +1,6 @@
 import requests
 import os
+import contextlib
 import tempfile
 from tqdm import tqdm
 import shutil
@@ -8,14 +9,42 @@ from pathlib import Path
 import geopandas as gpd
 import functools
 import pandas as pd
+import numpy as np
+import fiona
 import importlib
-from typing import Optional
-from .constants import SUMMARY_LEVEL_CODES, logger
+import hashlib
+import heapq
+import json
+import pyproj
+import shapely
+from collections import OrderedDict
+from shapely.geometry import box, shape
+from shapely.geometry.base import BaseGeometry
+from itertools import repeat, islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Iterable, Iterator
+from .constants import SUMMARY_LEVEL_CODES, MIN_FEATURES_PER_WORKER, STREAM_CHUNK_SIZE, logger
+from .catalog import check_available, latest_year, is_available, _catalog_latest
+from .precision import quantize
+from .derived import DerivedAttributes, derived_attributes, add_derived, take_derived, save_derived, load_derived
 import datetime
 
 CACHE_PATH = Path('~/.pyTigris_cache/').expanduser()
+ROW_ORDER_COLUMN = '_PYTIGRIS_ROW'
+BLOB_CHUNK_SIZE = 1 << 20
+# Number of parsed layers kept in memory, shared by repeated calls with use_cache = True
+MEMORY_CACHE_SIZE = 4
+_LAYER_MEMORY_CACHE = OrderedDict()
+
+# Arguments of the get_* functions that do not change the features returned
+CACHE_NEUTRAL_ARGS = {'refresh', 'progress_bar', 'workers', 'use_cache', 'output'}
 
 def construct_url(year, query_type, cb, resolution, state = 'us'):
+    # Fail before making any request if the file is not published
+    check_available(query_type.lower(), year, cb, resolution, state)
+    return tiger_url(year, query_type, cb, resolution, state)
+
+def tiger_url(year, query_type, cb, resolution, state = 'us'):
     query_type_abb = query_type[:2].lower()
     query_type = query_type.lower()
     # Query_type is one of: state, county, tract
@@ -55,6 +84,8 @@ def construct_url(year, query_type, cb, resolution, state = 'us'):
             lastTwoDigits = str(year)[-2:]
             if query_type == 'zcta':
                 query_type =  'zcta5'
+            elif query_type == 'block':
+                query_type = 'tabblock'
             url += f'TIGER2010/{query_type.upper()}/{year}/tl_2010_{state}_{query_type}{lastTwoDigits}.zip'
         elif year in {2008, 2009}:
             if query_type == 'zcta':
@@ -70,15 +101,27 @@ def construct_url(year, query_type, cb, resolution, state = 'us'):
             if query_type == 'zcta':
                 query_type =  'zcta520' if year >= 2020 else 'zcta510'
                 qury_type_o = 'ZCTA520' if year >= 2020 else 'ZCTA5'
+            elif query_type == 'block':
+                # 2011-2013 republish the 2010 blocks without the vintage suffix in the file name
+                query_type = 'tabblock20' if year >= 2020 else 'tabblock10' if year >= 2014 else 'tabblock'
+                qury_type_o = 'TABBLOCK20' if year >= 2020 else 'TABBLOCK'
             url += f'TIGER{year}/{qury_type_o.upper()}/tl_{year}_{state}_{query_type}.zip'
         else:
             raise ValueError(f'Data for `cb = False` is only available for the years: 2000 and, 2008 onwards. Year specified: {year}')
     
     return url
 
-def standardize_year(year:Optional[int]) -> int:
+def standardize_year(year:Optional[int], layer: Optional[str] = None, cb: Optional[bool] = None) -> int:
     if year is None:
-        year = (datetime.date.today() - datetime.timedelta(days = 366)).year
+        # Files for a year are released during the following year
+        released = (datetime.date.today() - datetime.timedelta(days = 366)).year
+        if layer is not None:
+            # Latest vintage published for the layer, or one released since the catalog was built if the layer is still published
+            year = latest_year(layer, cb = cb)
+            if year == _catalog_latest():
+                year = max(year, released)
+        else:
+            year = released
         # Log retrieving date if not specified
         logger.info(f"Retrieving data for the year: {year}")
     return year
@@ -88,70 +131,592 @@ def get_state_name(state_fips):
     return table[table['fips'] == state_fips].name.iloc[0]
 
 
-def load_tiger(url, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False) -> gpd.GeoDataFrame:
+def load_tiger(url, refresh : bool = False, progress_bar: bool = True, use_cache: bool = False, workers: Optional[int] = None, bbox = None, mask = None, crs = None, precision: Optional[float] = None, output: str = 'geopandas', derived: bool = False) -> gpd.GeoDataFrame:
+    if precision is not None and precision <= 0:
+        raise ValueError(f"Invalid precision: {precision}. Should be a positive grid size")
+
+    if output not in {'geopandas', 'arrow'}:
+        raise ValueError(f"Invalid output value: '{output}'. Should be one of: 'geopandas', 'arrow'")
+
     if use_cache and not os.path.exists(CACHE_PATH):
         os.makedirs(CACHE_PATH)
+
+    if output == 'arrow':
+        from .arrow import load_tiger_arrow
+        return load_tiger_arrow(url, refresh = refresh, progress_bar = progress_bar, use_cache = use_cache, workers = workers, bbox = bbox, mask = mask, crs = crs, precision = precision, derived = derived)
     
     tiger_file = url.split("/")[-1]
-    filename = None
     df = None
+    if crs is not None:
+        # bbox and mask are given in the requested CRS
+        bbox, mask = _filters_with_crs(bbox, mask, crs)
     if use_cache:
-        filename = CACHE_PATH / tiger_file
-        # Check cache for compressed file
-        if filename.exists() and not refresh:
-            df = gpd.read_file('zip://' + str(filename.absolute()))
+        blob = cached_blob(tiger_file)
+        # Check cache for compressed file (and its spatially indexed copy)
+        if blob is not None and not refresh:
+            df = _read_cached(blob, workers, bbox, mask, crs, precision, derived)
     
     if df is None:
-        try:
-            r = requests.get(url, stream=True, allow_redirects=True)
-        except requests.HTTPError as e:
-            raise ValueError(f"No data file exists at expected URL: {url}")
-        if r.status_code != 200:
-            r.raise_for_status()  # Will only raise for 4xx codes, so...
-            raise RuntimeError(f"Request to {url} returned status code {r.status_code}")
-        
-        file_size = int(r.headers.get('Content-Length', 0))
-        desc = "(Unknown total file size)" if file_size == 0 else ""
-        r.raw.read = functools.partial(r.raw.read, decode_content=True)  # Decompress if needed
-        df = None
-
-        with (tqdm.wrapattr(r.raw, "read", total=file_size, desc=desc) if progress_bar else r.raw) as r_raw:
+        with open_tiger_url(url, progress_bar) as r_raw:
             if use_cache:
-                with open(filename, "wb") as file:
-                    shutil.copyfileobj(r_raw, file)
-                df = gpd.read_file('zip://' + str(filename.absolute()))
+                blob = store_blob(r_raw, tiger_file, url)
+                df = _read_cached(blob, workers, bbox, mask, crs, precision, derived)
             else:
                 with tempfile.NamedTemporaryFile(suffix = '.zip') as file:
                     shutil.copyfileobj(r_raw, file)
                     file.seek(0)
-                    df = gpd.read_file('zip://' + file.name)
+                    df = read_tiger_file('zip://' + file.name, workers, bbox, mask)
     
-    return standardise_df(df)
+    df = standardise_df(df)
+    if crs is not None and not df.crs.equals(crs):
+        df = df.to_crs(crs)
+        if bbox is not None or mask is not None:
+            # Filtering the source file by the reprojected bbox or mask can select extra features
+            region = box(*bbox.to_crs(crs).total_bounds) if bbox is not None else mask.to_crs(crs).unary_union
+            df = df[df.intersects(region)]
+    if precision is not None and not use_cache:
+        # Cached layers are quantized once, when first read
+        df = quantize(df, precision)
+    if derived and not use_cache:
+        # Cached layers read their derived attributes from disk
+        df = add_derived(df)
+    return df
+
+@contextlib.contextmanager
+def open_tiger_url(url: str, progress_bar: bool = True):
+    """Stream the content of a TIGER file, raising if it does not exist."""
+    try:
+        r = requests.get(url, stream=True, allow_redirects=True)
+    except requests.HTTPError as e:
+        raise ValueError(f"No data file exists at expected URL: {url}")
+    if r.status_code != 200:
+        r.raise_for_status()  # Will only raise for 4xx codes, so...
+        raise RuntimeError(f"Request to {url} returned status code {r.status_code}")
+    
+    file_size = int(r.headers.get('Content-Length', 0))
+    desc = "(Unknown total file size)" if file_size == 0 else ""
+    r.raw.read = functools.partial(r.raw.read, decode_content=True)  # Decompress if needed
+
+    with (tqdm.wrapattr(r.raw, "read", total=file_size, desc=desc) if progress_bar else r.raw) as r_raw:
+        yield r_raw
+
+def store_blob(stream, name: str, url: Optional[str] = None) -> Path:
+    """Store a downloaded file in the content-addressed cache and point `name` at it.
+
+    Files are stored once per SHA-256 checksum under CACHE_PATH/blobs, and the index maps each file name to its
+    checksum. Storing identical content under another name (or re-fetching it) does not use any more disk space.
+
+    Args:
+        stream: File-like object to read the content from.
+        name (str): Name of the file (e.g. tl_2020_us_county.zip).
+        url (Optional[str], optional): URL the file was fetched from. Defaults to None.
+
+    Returns:
+        Path: Path of the stored blob.
+    """
+    blob_dir = CACHE_PATH / 'blobs'
+    blob_dir.mkdir(parents = True, exist_ok = True)
+
+    digest = hashlib.sha256()
+    with tempfile.NamedTemporaryFile(dir = blob_dir, suffix = '.part', delete = False) as file:
+        for chunk in iter(functools.partial(stream.read, BLOB_CHUNK_SIZE), b''):
+            digest.update(chunk)
+            file.write(chunk)
+    digest = digest.hexdigest()
+
+    blob = blob_dir / (digest + Path(name).suffix)
+    if blob.exists():
+        os.remove(file.name)
+    else:
+        os.replace(file.name, blob)
+
+    previous = _read_index_entry(name)
+    if previous is not None:
+        if previous['digest'] == digest:
+            logger.info(f"Refreshed {name}: content unchanged")
+        else:
+            logger.info(f"Refreshed {name}: content changed")
+            # Artifacts derived from the old content are stale, including those built from two layers (named '<from>_to_<to>')
+            stem = Path(name).stem
+            for pattern in [stem + '.*', stem + '_*', '*_to_' + stem + '.*', '*_to_' + stem + '_*']:
+                for path in (CACHE_PATH / 'derived').glob(pattern):
+                    if path.exists():
+                        os.remove(path)
+
+    _write_index_entry(name, {
+        'digest': digest,
+        'size': blob.stat().st_size,
+        'url': url,
+        'fetched': datetime.datetime.now().isoformat(timespec = 'seconds')
+    })
+
+    if previous is not None and previous['digest'] != digest:
+        _remove_unreferenced(previous['digest'])
+
+    return blob
+
+def cached_blob(name: str) -> Optional[Path]:
+    """Path of the cached content for the file `name`, or None if it is not cached."""
+    entry = _read_index_entry(name)
+    if entry is not None:
+        blob = CACHE_PATH / 'blobs' / (entry['digest'] + Path(name).suffix)
+        if blob.exists():
+            return blob
+
+    # Files cached by earlier versions are stored under their own name
+    legacy = CACHE_PATH / name
+    if legacy.is_file():
+        with open(legacy, 'rb') as file:
+            blob = store_blob(file, name)
+        os.remove(legacy)
+        return blob
+
+    return None
+
+def get_cache_index() -> pd.DataFrame:
+    """Index of the files in the cache, with the checksum of the content each name points to."""
+    entries = [{'name': path.name[:-len('.json')], **json.loads(path.read_text())} for path in sorted((CACHE_PATH / 'index').glob('*.json'))]
+    return pd.DataFrame(entries, columns = ['name', 'digest', 'size', 'url', 'fetched'])
+
+def _read_index_entry(name: str) -> Optional[dict]:
+    path = CACHE_PATH / 'index' / (name + '.json')
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+def _write_index_entry(name: str, entry: dict):
+    # One file per name, replaced atomically, so concurrent downloads do not overwrite each other's entries
+    path = CACHE_PATH / 'index' / (name + '.json')
+    path.parent.mkdir(parents = True, exist_ok = True)
+    with tempfile.NamedTemporaryFile('w', dir = path.parent, suffix = '.part', delete = False) as file:
+        json.dump(entry, file)
+    os.replace(file.name, path)
+
+def _remove_unreferenced(digest: str):
+    if any(json.loads(path.read_text())['digest'] == digest for path in (CACHE_PATH / 'index').glob('*.json')):
+        return
+    for path in [*(CACHE_PATH / 'blobs').glob(digest + '.*'), *(CACHE_PATH / 'parsed').glob(digest + '*')]:
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+def parsed_layer(blob: Path, workers: Optional[int] = None, crs = None, precision: Optional[float] = None) -> Path:
+    """Path of the parsed copy of a cached blob (see `parsed_cache_path`), parsing, reprojecting and quantizing it first if needed."""
+    crs = _reprojection(blob, crs)
+    parsed = parsed_cache_path(blob, crs, precision)
+    if not parsed.exists():
+        if precision is not None:
+            df = quantize(_read_cached(blob, workers, None, None, crs), precision)
+        elif crs is None:
+            df = read_tiger_file('zip://' + str(blob.absolute()), workers)
+        else:
+            df = _read_cached(blob, workers, None, None)
+            if df.crs is None:
+                df = df.set_crs(epsg = 4269)
+            df = df.to_crs(crs)
+        write_parsed(df, parsed)
+    return parsed
+
+def _read_cached(blob: Path, workers: Optional[int], bbox, mask, crs = None, precision: Optional[float] = None, derived: bool = False) -> gpd.GeoDataFrame:
+    parsed = parsed_layer(blob, workers, crs, precision)
+    if bbox is not None or mask is not None:
+        df = read_parsed(parsed, bbox, mask, keep_order = derived)
+    else:
+        df = _read_parsed_in_memory(parsed)
+
+    if derived:
+        attributes = cached_derived(parsed)
+        if ROW_ORDER_COLUMN in df.columns:
+            attributes = take_derived(attributes, df.pop(ROW_ORDER_COLUMN).values)
+        df = add_derived(df, attributes)
+    return df
+
+def _read_parsed_in_memory(parsed: Path) -> gpd.GeoDataFrame:
+    key = str(parsed)
+    if key in _LAYER_MEMORY_CACHE:
+        _LAYER_MEMORY_CACHE.move_to_end(key)
+    else:
+        _LAYER_MEMORY_CACHE[key] = read_parsed(parsed)
+        while len(_LAYER_MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+            _LAYER_MEMORY_CACHE.popitem(last = False)
+    # Callers modify the returned frame in place
+    return _LAYER_MEMORY_CACHE[key].copy()
+
+def _filters_with_crs(bbox, mask, crs):
+    if isinstance(bbox, tuple):
+        bbox = gpd.GeoSeries([box(*bbox)], crs = crs)
+    if isinstance(mask, dict):
+        mask = shape(mask)
+    if isinstance(mask, BaseGeometry):
+        mask = gpd.GeoSeries([mask], crs = crs)
+    return bbox, mask
+
+def crs_key(crs) -> str:
+    """Short name of a CRS, used to key cached reprojections."""
+    crs = pyproj.CRS.from_user_input(crs)
+    epsg = crs.to_epsg()
+    if epsg is not None:
+        return f'epsg{epsg}'
+    return hashlib.sha1(crs.to_wkt().encode()).hexdigest()[:12]
+
+def parsed_cache_path(blob: Path, crs = None, precision: Optional[float] = None) -> Path:
+    """Path of the spatially indexed (FlatGeobuf) copy of a cached blob, optionally reprojected and quantized. Blobs with the same content share it.
+
+    A crs equal to the blob's own shares the copy that is not reprojected.
+    """
+    crs = _reprojection(blob, crs)
+    name = blob.stem
+    if crs is not None:
+        name += '.' + crs_key(crs)
+    if precision is not None:
+        name += '.' + precision_key(precision)
+    return CACHE_PATH / 'parsed' / (name + '.fgb')
+
+def _reprojection(blob: Path, crs):
+    # The CRS to reproject a blob to, or None if it is already in it
+    if crs is not None and pyproj.CRS.from_user_input(crs).equals(_blob_crs(blob)):
+        return None
+    return crs
+
+@functools.lru_cache(maxsize = None)
+def _blob_crs(blob: Path) -> pyproj.CRS:
+    # Blobs are named by their content, so the CRS of a path never changes
+    with fiona.open('zip://' + str(blob.absolute())) as src:
+        wkt = src.crs_wkt
+    # Files without a projection definition are in NAD83 (see `standardise_df`)
+    return pyproj.CRS.from_wkt(wkt) if wkt else pyproj.CRS.from_epsg(4269)
+
+def precision_key(precision: float) -> str:
+    """Short name of a grid size, used to key cached quantized layers."""
+    return f'p{precision:g}'
+
+def write_parsed(df: gpd.GeoDataFrame, path: Path, spatial_index: bool = True):
+    """Write a layer to a FlatGeobuf file with a packed R-tree, so bounding box reads only touch matching features.
+
+    Without the spatial index, features are stored in the order given.
+    """
+    path.parent.mkdir(parents = True, exist_ok = True)
+    # The packed R-tree reorders features, so keep track of the original order (unless given, e.g. for a partition of a layer)
+    if ROW_ORDER_COLUMN not in df.columns:
+        df = df.assign(**{ROW_ORDER_COLUMN: np.arange(len(df))})
+    schema = gpd.io.file.infer_schema(df)
+    # Layers mix Polygon and MultiPolygon features
+    schema['geometry'] = 'Unknown'
+    tmp_path = path.with_name(path.stem + '.tmp' + path.suffix)
+    df.to_file(tmp_path, driver = 'FlatGeobuf', schema = schema, SPATIAL_INDEX = 'YES' if spatial_index else 'NO')
+    os.replace(tmp_path, path)
+
+def read_parsed(path: Path, bbox = None, mask = None, keep_order: bool = False) -> gpd.GeoDataFrame:
+    """Read a layer written by `write_parsed`, in the original feature order.
+
+    With keep_order = True the column holding each feature's position in the original layer is kept.
+    """
+    df = gpd.read_file(path, bbox = bbox, mask = mask)
+    if ROW_ORDER_COLUMN in df.columns:
+        df = df.sort_values(ROW_ORDER_COLUMN).reset_index(drop = True)
+        if not keep_order:
+            df = df.drop(columns = ROW_ORDER_COLUMN)
+    return df
+
+def cached_derived(parsed: Path) -> DerivedAttributes:
+    """Derived attributes (see `derived_attributes`) of a parsed layer, computed once and stored next to it."""
+    path = parsed.with_name(parsed.stem + '.derived.npz')
+    if path.exists():
+        return load_derived(path)
+    attributes = derived_attributes(standardise_df(_read_parsed_in_memory(parsed)).geometry)
+    save_derived(attributes, path)
+    return attributes
+
+def derived_cache_path(name: str, suffix: str) -> Path:
+    """Path of an artifact derived from a layer (see `layer_cache_name`), cached alongside the layer."""
+    return CACHE_PATH / 'derived' / (name + suffix)
+
+def layer_cache_name(layer: str, year: int, cb: bool = False, state: Optional[str] = None, resolution: str = '500k') -> str:
+    """Name identifying the features returned for a layer, used as the key for derived artifacts.
+
+    The name is the stem of the file the features are read from (at the given resolution, for cartographic
+    boundary files), suffixed with the state FIPS code when the features are a state subset of a national file.
+    Refreshing that file with new content removes the artifacts (see `store_blob`).
+    """
+    layer = layer.lower()
+    state = validate_state(state) if state is not None else None
+    if state is not None and is_available(layer, year, cb, resolution, state):
+        return Path(tiger_url(year, layer, cb, resolution, state)).stem
+    name = Path(tiger_url(year, layer, cb, resolution, 'us')).stem
+    return name if state is None else f'{name}_{state}'
+
+def layer_cache_key(layer: str, year: int, cb: bool = False, state: Optional[str] = None, **kwargs) -> str:
+    """Key for artifacts derived from a layer loaded with further get_* arguments.
+
+    The key is `layer_cache_name` (at the resolution passed, if any), suffixed with a hash of the other arguments
+    that change the features returned (e.g. counties, bbox, crs, precision), so artifacts of a subset, reprojection or
+    quantization of the layer are cached separately from those of the plain layer.
+    """
+    resolution = kwargs.pop('resolution', None) or '500k'
+    name = layer_cache_name(layer, year, cb, state, resolution)
+    args = {key: value for key, value in kwargs.items() if key not in CACHE_NEUTRAL_ARGS and value is not None}
+    if len(args) == 0:
+        return name
+
+    digest = hashlib.sha256()
+    for key in sorted(args):
+        digest.update(key.encode() + b'=' + _cache_key_bytes(key, args[key]) + b';')
+    return f'{name}.{digest.hexdigest()[:16]}'
+
+def _cache_key_bytes(key: str, value) -> bytes:
+    if key == 'crs':
+        return crs_key(value).encode()
+    if isinstance(value, (gpd.GeoDataFrame, gpd.GeoSeries)):
+        return geometry_digest(value).encode()
+    if isinstance(value, BaseGeometry):
+        return value.wkb
+    if isinstance(value, (set, frozenset)):
+        value = sorted(value)
+    return repr(value).encode()
+
+def get_geoids(df: pd.DataFrame) -> pd.Series:
+    """GEOIDs of the features of a layer, across the identifier columns used by different vintages."""
+    if 'GEOID' in df.columns:
+        return df['GEOID'].astype(str)
+
+    for col in ['GEO_ID', 'AFFGEOID']:
+        if col in df.columns:
+            # GEO_ID and AFFGEOID prefix the GEOID with the summary level (e.g. 1400000US25001010100)
+            return df[col].astype(str).str.split('US').str[-1]
+
+    id_cols = [col for col in df.columns if col.endswith('IDFP') or col.startswith('ZCTA5CE')]
+    if len(id_cols) > 0:
+        return df[id_cols[0]].astype(str)
+
+    raise ValueError(f"No GEOID column found in columns: {', '.join(df.columns)}")
+
+def geometry_digest(df: gpd.GeoDataFrame) -> str:
+    """Hash of the geometries (and CRS) of a layer, used to key artifacts derived from layers passed in by the caller."""
+    digest = hashlib.sha256(pd.util.hash_array(shapely.to_wkb(np.asarray(df.geometry.values))).tobytes())
+    digest.update(df.crs.to_wkt().encode() if df.crs is not None else b'')
+    return digest.hexdigest()[:16]
+
+def read_tiger_file(path: str, workers: Optional[int] = None, bbox = None, mask = None) -> gpd.GeoDataFrame:
+    """Read a TIGER/Line file, optionally splitting the parse across worker processes.
+
+    The file is split into contiguous feature ranges, one per worker, and the parsed
+    ranges are concatenated back in their original order.
+
+    Args:
+        path (str): Path of the file to read (any path accepted by `geopandas.read_file`).
+        workers (Optional[int], optional): Number of worker processes. None or 1 parses on a single core,
+                                           -1 uses all available cores. Defaults to None.
+        bbox (optional): Only read features intersecting this bounding box. Filtered reads use a single process. Defaults to None.
+        mask (optional): Only read features intersecting this geometry. Filtered reads use a single process. Defaults to None.
+
+    Returns:
+        geopandas.GeoDataFrame: The features of the file, in file order.
+    """
+    if workers is None or workers == 1 or bbox is not None or mask is not None:
+        return gpd.read_file(path, bbox = bbox, mask = mask)
+
+    with fiona.open(path) as src:
+        bounds = feature_ranges(len(src), workers)
+
+    if len(bounds) <= 2:
+        return gpd.read_file(path)
+
+    with ProcessPoolExecutor(max_workers = len(bounds) - 1) as executor:
+        frames = list(executor.map(_read_feature_range, repeat(path), bounds[:-1], bounds[1:]))
+
+    return gpd.GeoDataFrame(pd.concat(frames, ignore_index = True), crs = frames[0].crs)
+
+def feature_ranges(n_features: int, workers: int) -> np.ndarray:
+    """Bounds of the contiguous feature ranges a file is split into, one per worker (-1 for all cores).
+
+    Small files are not worth the cost of starting worker processes, so each range holds at least
+    MIN_FEATURES_PER_WORKER features, and a file too small to split is a single range.
+    """
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    workers = max(min(workers, n_features // MIN_FEATURES_PER_WORKER), 1)
+    return np.linspace(0, n_features, workers + 1).astype(int)
+
+def _read_feature_range(path: str, start: int, stop: int) -> gpd.GeoDataFrame:
+    return gpd.read_file(path, rows = slice(start, stop))
+
+def iter_tiger_file(path: str, chunksize: Optional[int] = None, where: Optional[str] = None) -> Iterator[gpd.GeoDataFrame]:
+    """Stream a TIGER/Line file in chunks, so only one chunk of features is held in memory at a time.
+
+    Args:
+        path (str): Path of the file to read (any path accepted by `fiona.open`).
+        chunksize (Optional[int], optional): Maximum number of features per chunk. Defaults to None (a single chunk with all features).
+        where (Optional[str], optional): Attribute filter (OGR SQL WHERE clause) applied while reading,
+                                         so features not matching it are never parsed. Defaults to None.
+
+    Returns:
+        Iterator[geopandas.GeoDataFrame]: The features of the file, in file order.
+    """
+    with fiona.open(path) as src:
+        columns = [*src.schema['properties'], 'geometry']
+        crs = src.crs_wkt or None
+        features = src.filter(where = where) if where is not None else iter(src)
+        while True:
+            chunk = list(islice(features, chunksize))
+            if len(chunk) == 0 and chunksize is not None:
+                return
+            yield gpd.GeoDataFrame.from_features(chunk, crs = crs, columns = columns)
+            if chunksize is None or len(chunk) < chunksize:
+                return
+
+def stream_tiger(url: str, partition_by: str, values: Optional[Iterable[str]] = None, chunksize: Optional[int] = None, refresh: bool = False, progress_bar: bool = True, use_cache: bool = False) -> Iterator[gpd.GeoDataFrame]:
+    """Stream the features of a TIGER file, optionally only those with the given values of a partitioning column.
+
+    Without the cache, the file is read in chunks and filtered by `values` while reading. With use_cache = True,
+    the file is split once into one file per value of the partitioning column (see `write_partitioned`),
+    and later calls only read the partitions they ask for. Either way features are returned in file order.
+
+    Args:
+        url (str): URL of the file.
+        partition_by (str): Name (or prefix, e.g. 'COUNTYFP' for 'COUNTYFP20') of the column to filter and partition on.
+        values (Optional[Iterable[str]], optional): Values of the partitioning column to return. Defaults to None (all features).
+        chunksize (Optional[int], optional): Maximum number of features per chunk. Defaults to None (a single chunk with all features).
+        refresh (bool, optional): If to refresh the cached file (if use_cache = True). Defaults to False.
+        progress_bar (bool, optional): If to display the progress bar for download. Defaults to True.
+        use_cache (bool, optional): If to utilise the cache for the downloaded zip file and its partitions. Defaults to False.
+
+    Returns:
+        Iterator[geopandas.GeoDataFrame]: The matching features, as they are read.
+    """
+    tiger_file = url.split("/")[-1]
+    if use_cache:
+        blob = cached_blob(tiger_file)
+        if blob is None or refresh:
+            with open_tiger_url(url, progress_bar) as r_raw:
+                blob = store_blob(r_raw, tiger_file, url)
+        path = partitioned_cache_path(blob, partition_by)
+        if not path.exists():
+            write_partitioned('zip://' + str(blob.absolute()), path, partition_by)
+        yield from read_partitioned(path, values, chunksize)
+    else:
+        with tempfile.NamedTemporaryFile(suffix = '.zip') as file:
+            with open_tiger_url(url, progress_bar) as r_raw:
+                shutil.copyfileobj(r_raw, file)
+            file.flush()
+            source = 'zip://' + file.name
+            where = None
+            if values is not None:
+                with fiona.open(source) as src:
+                    column = _partition_column(src.schema['properties'], partition_by)
+                where = f"{column} IN ({', '.join(repr(str(value)) for value in sorted(values))})"
+            yield from iter_tiger_file(source, chunksize, where)
+
+def partitioned_cache_path(blob: Path, partition_by: str) -> Path:
+    """Directory of the partitioned copy of a cached blob (see `write_partitioned`). Blobs with the same content share it."""
+    return CACHE_PATH / 'parsed' / f'{blob.stem}.{partition_by.lower()}'
+
+def write_partitioned(source: str, path: Path, partition_by: str):
+    """Split a TIGER file into one FlatGeobuf file (see `write_parsed`) per value of a column, e.g. one per county.
+
+    The source is streamed in chunks of STREAM_CHUNK_SIZE features, so at most one chunk plus one partition is held in memory.
+    Partitions keep the features in file order, along with their position in the file, so `read_partitioned` can merge them back.
+    """
+    path.parent.mkdir(parents = True, exist_ok = True)
+    # A directory of its own, so processes partitioning the same file concurrently do not remove each other's parts
+    tmp_path = Path(tempfile.mkdtemp(dir = path.parent, prefix = path.name + '.', suffix = '.tmp'))
+    try:
+        _write_partitions(source, tmp_path, partition_by)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors = True)
+        raise
+
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        if not path.exists():
+            raise
+        # Written concurrently by another process
+        shutil.rmtree(tmp_path)
+
+def _write_partitions(source: str, tmp_path: Path, partition_by: str):
+    start = 0
+    for i, chunk in enumerate(iter_tiger_file(source, STREAM_CHUNK_SIZE)):
+        chunk[ROW_ORDER_COLUMN] = np.arange(start, start + len(chunk))
+        start += len(chunk)
+        column = _partition_column(chunk.columns, partition_by)
+        for value, part in chunk.groupby(column):
+            part.to_pickle(tmp_path / f'{value}.{i}.pkl')
+
+    for value in sorted({part.name.split('.')[0] for part in tmp_path.glob('*.pkl')}):
+        parts = sorted(tmp_path.glob(f'{value}.*.pkl'), key = lambda part: int(part.name.split('.')[1]))
+        frames = [pd.read_pickle(part) for part in parts]
+        write_parsed(gpd.GeoDataFrame(pd.concat(frames, ignore_index = True), crs = frames[0].crs), tmp_path / f'{value}.fgb', spatial_index = False)
+        for part in parts:
+            os.remove(part)
+
+def read_partitioned(path: Path, values: Optional[Iterable[str]] = None, chunksize: Optional[int] = None) -> Iterator[gpd.GeoDataFrame]:
+    """Read the partitions written by `write_partitioned`, in the order of the source file.
+
+    With chunksize set, features are merged from the partitions one at a time, so only one chunk is held in memory.
+    """
+    if values is None:
+        paths = sorted(path.glob('*.fgb'))
+    else:
+        paths = [path / f'{value}.fgb' for value in sorted(values) if (path / f'{value}.fgb').exists()]
+
+    # All partitions share the schema of the source file, so take it from any of them
+    schema_path = paths[0] if len(paths) > 0 else next(path.glob('*.fgb'), None)
+    if schema_path is None:
+        # The source file had no features
+        if chunksize is None:
+            yield gpd.GeoDataFrame(columns = ['geometry'], geometry = 'geometry')
+        return
+    with fiona.open(schema_path) as src:
+        columns = [col for col in src.schema['properties'] if col != ROW_ORDER_COLUMN] + ['geometry']
+        crs = src.crs_wkt or None
+
+    if chunksize is None:
+        if len(paths) == 0:
+            yield gpd.GeoDataFrame(columns = columns, geometry = 'geometry', crs = crs)
+            return
+        frames = [read_parsed(partition, keep_order = True) for partition in paths]
+        df = pd.concat(frames, ignore_index = True).sort_values(ROW_ORDER_COLUMN).reset_index(drop = True)
+        yield gpd.GeoDataFrame(df.drop(columns = ROW_ORDER_COLUMN), crs = frames[0].crs)
+        return
+
+    with contextlib.ExitStack() as stack:
+        sources = [stack.enter_context(fiona.open(partition)) for partition in paths]
+        features = heapq.merge(*sources, key = lambda feature: feature['properties'][ROW_ORDER_COLUMN])
+        while True:
+            chunk = list(islice(features, chunksize))
+            if len(chunk) == 0:
+                return
+            yield gpd.GeoDataFrame.from_features(chunk, crs = crs, columns = columns + [ROW_ORDER_COLUMN]).drop(columns = ROW_ORDER_COLUMN)
+
+def _partition_column(columns: Iterable[str], partition_by: str) -> str:
+    # Column names carry a vintage suffix in some files (e.g. COUNTYFP10)
+    matches = [col for col in columns if col.startswith(partition_by)]
+    if len(matches) == 0:
+        raise ValueError(f"No column '{partition_by}' found in columns: {', '.join(columns)}")
+    return matches[0]
 
 def standardise_df(df):
-    df.set_crs(epsg = 4269)
+    # Files without a projection definition are in NAD83
+    if df.crs is None:
+        df = df.set_crs(epsg = 4269)
 
-    # Standardise columns ending with 00 or 10
-    for col in list(df.columns):
+    df.rename(columns = dict(zip(df.columns, standard_column_names(df.columns))), inplace = True)
+    return df
+
+def standard_column_names(columns: Iterable[str]) -> list:
+    """Standardised names of the columns of a TIGER file, shared across vintages (e.g. COUNTYFP10 and CO both become COUNTYFP)."""
+    names = []
+    for col in columns:
+        # Standardise columns ending with 00 or 10
         if col[-2:] in {'00', '10'}:
-            df.rename(columns = {col: col[:-2]}, inplace = True)
-    
-    # for col in list(df.columns):
-    #     if col[-2:] == 'FP':
-    #         df.rename(columns = {col: col[:-2]}, inplace = True)
+            col = col[:-2]
 
-    if 'COUNTY' in df.columns:
-        df.rename(columns = {'COUNTY': 'COUNTYFP'}, inplace = True)
+        # if col[-2:] == 'FP':
+        #     col = col[:-2]
 
-    if 'STATE' in df.columns:
-        df.rename(columns = {'STATE': 'STATEFP'}, inplace = True)
-    
-    if 'CO' in df.columns:
-        df.rename(columns = {'CO': 'COUNTYFP'}, inplace = True)
-    
-    if 'ST' in df.columns:
-        df.rename(columns = {'ST': 'STATEFP'}, inplace = True)
-    return df
+        names.append({'COUNTY': 'COUNTYFP', 'STATE': 'STATEFP', 'CO': 'COUNTYFP', 'ST': 'STATEFP'}.get(col, col))
+    return names
 
 @functools.cache
 def get_state_fips_table():
@@ -165,6 +730,7 @@ def get_county_fips_table():
     return pd.read_csv(path / 'data' / 'national_county.csv', dtype = str)
 
 def clear_cache():
+    _LAYER_MEMORY_CACHE.clear()
     if CACHE_PATH.exists():
         shutil.rmtree(CACHE_PATH)
 
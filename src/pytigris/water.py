@@ -0,0 +1,123 @@
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+import shapely
+import requests
+import geopandas as gpd
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+from .constants import EQUAL_AREA_CRS, logger
+from .catalog import check_available
+from .util import construct_url, load_tiger, cached_blob, derived_cache_path, geometry_digest, standardize_year
+from .enum_units import get_counties
+
+def erase_water(gdf: gpd.GeoDataFrame, year: Optional[int] = None, area_threshold: float = 0.75, use_cache: bool = False, workers: Optional[int] = None) -> gpd.GeoDataFrame:
+    """Erase water areas from the features of a layer, e.g. to map tracts without the lakes and coastal water they extend into.
+
+    The area water of every county the layer covers is downloaded, and the water bodies at or above the
+    `area_threshold` quantile of water area are erased. Features not intersecting any of them (found with an
+    STRtree spatial index) are left untouched; the rest are differenced against their water in batches across
+    worker processes. With use_cache = True the result is cached, keyed by the layer's geometries, year, threshold
+    and the content of the cached water files, so refreshing the water of a county invalidates it.
+
+    Args:
+        gdf (geopandas.GeoDataFrame): The layer to erase water from.
+        year (Optional[int], optional): The year of the area water files. Defaults to None (latest year available).
+        area_threshold (float, optional): Quantile of water area at or above which water bodies are erased,
+                                          e.g. 0.75 erases the largest 25% of water bodies and 0 erases all of them. Defaults to 0.75.
+        use_cache (bool, optional): If to utilise the cache for the downloaded files and the result. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes. Defaults to None (all cores).
+
+    Raises:
+        ValueError: If area_threshold is not between 0 and 1, or the layer has no CRS.
+
+    Returns:
+        geopandas.GeoDataFrame: The layer with water erased. Features entirely covered by water are dropped.
+    """
+    if not 0 <= area_threshold <= 1:
+        raise ValueError(f"Invalid area_threshold: {area_threshold}. Should be between 0 and 1")
+    if gdf.crs is None:
+        raise ValueError("Cannot erase water from a layer without a CRS")
+
+    year = standardize_year(year, 'areawater', False)
+    check_available('areawater', year, False, scope = 'county')
+
+    counties = _covered_counties(gdf, year, use_cache)
+    path = _cache_path(gdf, counties, year, area_threshold) if use_cache else None
+    if path is not None and path.exists():
+        erased = pd.read_pickle(path)
+    else:
+        erased = _erase(gdf, counties, year, area_threshold, use_cache, workers)
+        if use_cache:
+            # Keyed by the water files just downloaded
+            path = _cache_path(gdf, counties, year, area_threshold)
+            path.parent.mkdir(parents = True, exist_ok = True)
+            erased.to_pickle(path)
+
+    geoms = np.asarray(gdf.geometry.values).copy()
+    geoms[erased.index.values] = shapely.from_wkb(erased.values)
+    df = gdf.set_geometry(gpd.GeoSeries(geoms, index = gdf.index, crs = gdf.crs))
+    return df[~shapely.is_empty(geoms)]
+
+def _cache_path(gdf: gpd.GeoDataFrame, counties: List[str], year: int, area_threshold: float) -> Path:
+    # Counties whose water file is not cached (not yet downloaded, or not published) are keyed as such
+    water = hashlib.sha256()
+    for county in counties:
+        blob = cached_blob(construct_url(year, 'areawater', False, '500k', county).split('/')[-1])
+        water.update(f'{county}:{blob.stem if blob is not None else ""};'.encode())
+    return derived_cache_path(f'erase_water_{geometry_digest(gdf)}', f'.{year}.t{area_threshold:g}.w{water.hexdigest()[:16]}.pkl')
+
+def _erase(gdf: gpd.GeoDataFrame, counties: List[str], year: int, area_threshold: float, use_cache: bool, workers: Optional[int]) -> pd.Series:
+    # Erased geometries (as WKB) of the features intersecting water, indexed by position
+    workers = workers if workers is not None and workers > 0 else os.cpu_count()
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        frames = [df for df in executor.map(_county_water, counties, repeat(year), repeat(use_cache), repeat(gdf.crs)) if df is not None]
+        if len(frames) == 0:
+            return pd.Series([], dtype = object)
+
+        water = gpd.GeoDataFrame(pd.concat(frames, ignore_index = True), crs = gdf.crs)
+        area = water.to_crs(EQUAL_AREA_CRS).area
+        water = water[area >= area.quantile(area_threshold)]
+
+        feature_idx, water_idx = water.sindex.query(gdf.geometry, predicate = 'intersects')
+        order = np.argsort(feature_idx, kind = 'stable')
+        feature_idx, water_idx = feature_idx[order], water_idx[order]
+        candidates, starts = np.unique(feature_idx, return_index = True)
+        if len(candidates) == 0:
+            return pd.Series([], dtype = object)
+
+        water_geoms = np.asarray(water.geometry.values)
+        groups = [water_geoms[idx] for idx in np.split(water_idx, starts[1:])]
+        feature_geoms = np.asarray(gdf.geometry.values)[candidates]
+
+        n_batches = min(len(candidates), workers * 4)
+        bounds = np.linspace(0, len(candidates), n_batches + 1).astype(int)
+        batches = executor.map(_erase_batch, [feature_geoms[a:b] for a, b in zip(bounds[:-1], bounds[1:])], [groups[a:b] for a, b in zip(bounds[:-1], bounds[1:])])
+        erased = np.concatenate(list(batches))
+
+    return pd.Series(shapely.to_wkb(erased), index = candidates)
+
+def _erase_batch(geoms: np.ndarray, water: List[np.ndarray]) -> np.ndarray:
+    return shapely.difference(geoms, np.array([shapely.union_all(group) for group in water], dtype = object))
+
+def _covered_counties(gdf: gpd.GeoDataFrame, year: int, use_cache: bool) -> List[str]:
+    # Counties covered by the layer, as 5-digit FIPS codes
+    if 'STATEFP' in gdf.columns and 'COUNTYFP' in gdf.columns:
+        return sorted(set(gdf['STATEFP'] + gdf['COUNTYFP']))
+
+    counties = get_counties(year = year, bbox = gdf, use_cache = use_cache, progress_bar = False)
+    _, county_idx = counties.sindex.query(gdf.to_crs(counties.crs).geometry, predicate = 'intersects')
+    counties = counties.iloc[np.unique(county_idx)]
+    return sorted(set(counties['STATEFP'] + counties['COUNTYFP']))
+
+def _county_water(county: str, year: int, use_cache: bool, crs) -> Optional[gpd.GeoDataFrame]:
+    url = construct_url(year, 'areawater', False, '500k', county)
+    try:
+        return load_tiger(url, progress_bar = False, use_cache = use_cache, crs = crs)
+    except requests.HTTPError:
+        # Counties of older layers may have since been dissolved or renamed
+        logger.warning(f"Skipping county {county}: no area water file for {year}")
+        return None
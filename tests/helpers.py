@@ -0,0 +1,43 @@
+import unittest
+import tempfile
+import zipfile
+import geopandas as gpd
+from pathlib import Path
+from shapely.geometry import box
+import pytigris
+
+class CacheTestCase(unittest.TestCase):
+    """Test case running each test against an empty cache in a temporary directory (`self.tmp`)."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self._cache_path = pytigris.util.CACHE_PATH
+        pytigris.util.CACHE_PATH = self.tmp / 'cache'
+
+    def tearDown(self):
+        pytigris.util.CACHE_PATH = self._cache_path
+        pytigris.util._LAYER_MEMORY_CACHE.clear()
+        self._tmp.cleanup()
+
+def cache_zipped_layer(df: gpd.GeoDataFrame, layer: str, year: int, state: str = 'us', cb: bool = False, resolution: str = '500k') -> Path:
+    """Store a layer in the cache as a zipped shapefile, named as the Census Bureau file it stands in for."""
+    name = Path(pytigris.util.tiger_url(year, layer, cb, resolution, state)).name
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        df.to_file(tmp / (name[:-4] + '.shp'))
+        with zipfile.ZipFile(tmp / name, 'w') as z:
+            for path in tmp.glob(name[:-4] + '.*'):
+                if path.suffix != '.zip':
+                    z.write(path, path.name)
+        with open(tmp / name, 'rb') as f:
+            return pytigris.util.store_blob(f, name)
+
+def cache_national_tracts(year: int = 2015) -> Path:
+    """Store two neighbouring tracts in different states in the cache, as a national dataset assembled from per-state files."""
+    path = pytigris.util.CACHE_PATH / 'datasets' / Path(pytigris.util.tiger_url(year, 'tract', False, '500k', 'us')).stem
+    path.mkdir(parents = True)
+    for state, x in [('06', 0), ('32', 1)]:
+        gpd.GeoDataFrame({'STATEFP': [state], 'GEOID': [state + '001400100']}, geometry = [box(x, 0, x + 1, 1)], crs = 'EPSG:4269').to_parquet(path / f'{state}.parquet')
+    (path / '_SUCCESS').touch()
+    return path
@@ -0,0 +1,38 @@
+import unittest
+import pytigris
+from helpers import CacheTestCase, cache_national_tracts
+
+class AdjacencyTests(unittest.TestCase):
+
+    def test_adjacency_counties(self):
+        adjacency = pytigris.get_adjacency('county', 2020, state = 'ri')
+        self.assertEqual(adjacency.matrix.shape, (len(adjacency.geoids), len(adjacency.geoids)), "Adjacency matrix is not square")
+        self.assertEqual((adjacency.matrix != adjacency.matrix.T).nnz, 0, "Adjacency matrix is not symmetric")
+        self.assertEqual(adjacency.matrix.diagonal().sum(), 0, "Counties are neighbours of themselves")
+
+    def test_rook_subset_of_queen(self):
+        queen = pytigris.get_adjacency('tract', 2020, state = 'de', kind = 'queen', use_cache = True)
+        rook = pytigris.get_adjacency('tract', 2020, state = 'de', kind = 'rook', use_cache = True)
+        self.assertLessEqual(rook.matrix.nnz, queen.matrix.nnz, "Rook contiguity found more neighbours than queen")
+        self.assertEqual(rook.matrix.multiply(queen.matrix).nnz, rook.matrix.nnz, "Rook neighbours are not queen neighbours")
+
+    def test_invalid_kind(self):
+        with self.assertRaises(ValueError):
+            pytigris.get_adjacency('tract', 2020, state = 'de', kind = 'bishop')
+
+class AdjacencyCacheTests(CacheTestCase):
+
+    def test_national_from_states(self):
+        # Layers assembled from per-state files are read into a single GeoDataFrame
+        cache_national_tracts(2015)
+        adjacency = pytigris.get_adjacency('tract', 2015, kind = 'rook', use_cache = True)
+        self.assertEqual(sorted(adjacency.geoids), ['06001400100', '32001400100'], "National layer was not read")
+        self.assertEqual(adjacency.matrix.nnz, 2, "Neighbouring tracts across states are not adjacent")
+
+    def test_cache_key(self):
+        # The graph of a subset of the layer is not reused for the whole layer
+        cache_national_tracts(2015)
+        subset = pytigris.get_adjacency('tract', 2015, use_cache = True, bbox = (0.1, 0.1, 0.4, 0.4))
+        full = pytigris.get_adjacency('tract', 2015, use_cache = True)
+        self.assertEqual(len(subset.geoids), 1, "bbox was not applied")
+        self.assertEqual(len(full.geoids), 2, "Cached graph of a subset was returned for the whole layer")
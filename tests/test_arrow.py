@@ -0,0 +1,94 @@
+import unittest
+import pyarrow as pa
+import geopandas as gpd
+from shapely.geometry import box
+import pytigris
+from helpers import CacheTestCase, cache_zipped_layer
+
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None
+
+class ArrowTests(unittest.TestCase):
+
+    def test_arrow(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020)
+        table = pytigris.get_tracts(state = 'ri', year = 2020, output = 'arrow')
+        self.assertIsInstance(table, pa.Table, "output = 'arrow' did not return a pyarrow Table")
+        self.assertEqual(table.column_names, list(df.columns), "Arrow output has different columns")
+        self.assertEqual(table['GEOID'].to_pylist(), df.GEOID.tolist(), "Arrow output has different features")
+        self.assertEqual(table.schema.field('geometry').metadata[b'ARROW:extension:name'], b'geoarrow.wkb', "Geometry is not tagged as GeoArrow")
+        geometry = gpd.GeoSeries.from_wkb(table['geometry'].to_pylist(), crs = df.crs)
+        self.assertTrue(geometry.geom_equals(df.geometry).all(), "Arrow output has different geometries")
+
+    def test_arrow_filtering(self):
+        df = pytigris.get_tracts(state = 'az', counties = 'Coconino', year = 2020)
+        table = pytigris.get_tracts(state = 'az', counties = 'Coconino', year = 2020, output = 'arrow')
+        self.assertEqual(table['GEOID'].to_pylist(), df.GEOID.tolist(), "Filtering counties on the Arrow side failed")
+
+    def test_arrow_crs(self):
+        df = pytigris.get_counties(states = 'ma', year = 2020, crs = 'EPSG:5070', use_cache = True)
+        table = pytigris.get_counties(states = 'ma', year = 2020, crs = 'EPSG:5070', output = 'arrow', use_cache = True)
+        geometry = gpd.GeoSeries.from_wkb(table['geometry'].to_pylist(), crs = df.crs)
+        self.assertTrue(geometry.geom_equals(df.geometry.reset_index(drop = True)).all(), "Reprojected Arrow output differs")
+
+    def test_value_errors(self):
+        with self.assertRaises(ValueError):
+            pytigris.get_states(year = 2020, output = 'pandas')
+
+class ArrowCacheTests(CacheTestCase):
+
+    def test_cached_parsed_tier(self):
+        # Arrow output reads (and writes) the same parsed copy of a cached file as GeoDataFrame output
+        df = gpd.GeoDataFrame({'STATEFP': '44', 'COUNTYFP': '001', 'TRACTCE': ['000100', '000200'], 'GEOID': ['44001000100', '44001000200']},
+                              geometry = [box(-71.3, 41.6, -71.2, 41.7), box(-71.2, 41.6, -71.1, 41.7)], crs = 'EPSG:4269')
+        cache_zipped_layer(df, 'tract', 2020, '44')
+
+        kwargs = {'state': 'ri', 'year': 2020, 'use_cache': True, 'crs': 'EPSG:5070', 'precision': 1, 'derived': True}
+        table = pytigris.get_tracts(output = 'arrow', **kwargs)
+        parsed = sorted(path.name.split('.', 1)[1] for path in (pytigris.util.CACHE_PATH / 'parsed').iterdir())
+        self.assertIn('epsg5070.p1.fgb', parsed, "Arrow output did not write the parsed cache")
+        self.assertIn('epsg5070.p1.derived.npz', parsed, "Arrow output did not cache the derived attributes")
+
+        df = pytigris.get_tracts(**kwargs)
+        self.assertEqual(table['GEOID'].to_pylist(), df.GEOID.tolist(), "Arrow and GeoDataFrame output differ")
+        self.assertEqual(table['AREA_M2'].to_pylist(), df.AREA_M2.tolist(), "Arrow and GeoDataFrame derived attributes differ")
+
+    def test_blocks_and_water(self):
+        df = gpd.GeoDataFrame({'STATEFP20': '10', 'COUNTYFP20': ['001', '003'], 'GEOID20': ['100010001001000', '100030001001000']},
+                              geometry = [box(-75.6, 39.1, -75.5, 39.2), box(-75.5, 39.1, -75.4, 39.2)], crs = 'EPSG:4269')
+        cache_zipped_layer(df, 'block', 2020, '10')
+        table = pytigris.get_blocks(state = 'de', year = 2020, use_cache = True, output = 'arrow')
+        self.assertIsInstance(table, pa.Table, "Blocks with output = 'arrow' did not return a pyarrow Table")
+        self.assertEqual(table['GEOID'].to_pylist(), df.GEOID20.tolist(), "Arrow blocks have different features")
+        chunks = list(pytigris.get_blocks(state = 'de', year = 2020, chunksize = 1, use_cache = True, output = 'arrow'))
+        self.assertTrue(all(isinstance(chunk, pa.Table) for chunk in chunks), "Block chunks with output = 'arrow' are not pyarrow Tables")
+
+        water = gpd.GeoDataFrame({'HYDROID': ['1101'], 'FULLNAME': ['Silver Lk']}, geometry = [box(-75.55, 39.15, -75.54, 39.16)], crs = 'EPSG:4269')
+        cache_zipped_layer(water, 'areawater', 2020, '10001')
+        table = pytigris.get_area_water(state = 'de', counties = '001', year = 2020, use_cache = True, output = 'arrow')
+        self.assertIsInstance(table, pa.Table, "Area water with output = 'arrow' did not return a pyarrow Table")
+        self.assertEqual(table['HYDROID'].to_pylist(), ['1101'], "Arrow area water has different features")
+
+    def test_parallel_read(self):
+        df = gpd.GeoDataFrame({'GEOID': [f'{i:04d}' for i in range(8)]}, geometry = [box(i, 0, i + 1, 1) for i in range(8)], crs = 'EPSG:4269')
+        path = 'zip://' + str(cache_zipped_layer(df, 'state', 2020).absolute())
+        min_features = pytigris.util.MIN_FEATURES_PER_WORKER
+        pytigris.util.MIN_FEATURES_PER_WORKER = 2
+        try:
+            table = pytigris.arrow.read_arrow(path, workers = 4)
+        finally:
+            pytigris.util.MIN_FEATURES_PER_WORKER = min_features
+        self.assertEqual(table['GEOID'].to_pylist(), df.GEOID.tolist(), "Parallel Arrow read did not preserve feature order")
+
+    @unittest.skipUnless(pyogrio, "pyogrio is not installed")
+    def test_pyogrio_read(self):
+        # Attributes are read straight into Arrow, and filters are reprojected to the CRS of the file
+        df = gpd.GeoDataFrame({'GEOID': ['01', '02']}, geometry = [box(0, 0, 1, 1), box(2, 0, 3, 1)], crs = 'EPSG:4269')
+        path = 'zip://' + str(cache_zipped_layer(df, 'state', 2020).absolute())
+        table = pytigris.arrow.read_arrow(path)
+        self.assertEqual(table['GEOID'].to_pylist(), ['01', '02'], "pyogrio read returned different features")
+        self.assertEqual(table.schema.field('geometry').metadata[b'ARROW:extension:name'], b'geoarrow.wkb', "Geometry is not tagged as GeoArrow")
+        bbox = gpd.GeoSeries([box(0.2, 0.2, 0.8, 0.8)], crs = 'EPSG:4269').to_crs('EPSG:3857')
+        self.assertEqual(pytigris.arrow.read_arrow(path, bbox = bbox)['GEOID'].to_pylist(), ['01'], "bbox was not reprojected for pyogrio")
@@ -0,0 +1,70 @@
+import unittest
+import pandas as pd
+import geopandas as gpd
+from shapely.geometry import box
+import pytigris
+from helpers import CacheTestCase, cache_zipped_layer
+
+class BlockTests(unittest.TestCase):
+
+    def test_block(self):
+        for year in [2010, 2019, None]:
+            with self.subTest(f"Year = {year}"):
+                df = pytigris.get_blocks(state = 'de', year = year)
+                self.assertTrue(len(df) > 0, f"get_blocks(state = 'de', year = {year}) does not return full dataframe")
+                self.assertIn("COUNTYFP", df.columns, "Block columns were not standardised")
+
+    def test_block_filtering(self):
+        df_orig = pytigris.get_blocks(state = 'de', year = 2020)
+        df_filtered = pytigris.get_blocks(state = 'de', counties = ['Kent', '005'], year = 2020)
+        self.assertGreater(len(df_filtered), 0, "Filtering failed: removed all blocks")
+        self.assertLess(len(df_filtered), len(df_orig), "Filtering blocks by counties failed")
+        self.assertEqual(set(df_filtered["COUNTYFP"]), {'001', '005'}, "Filtering returned blocks of other counties")
+
+    def test_chunks(self):
+        df = pytigris.get_blocks(state = 'de', year = 2020)
+        chunks = list(pytigris.get_blocks(state = 'de', year = 2020, chunksize = 5000))
+        self.assertTrue(all(len(chunk) <= 5000 for chunk in chunks), "Chunks exceed chunksize")
+        self.assertEqual(df.GEOID.tolist(), pd.concat(chunks).GEOID.tolist(), "Chunks do not add up to the full layer")
+
+    def test_cached_partitions(self):
+        df = pytigris.get_blocks(state = 'de', counties = '003', year = 2020)
+        df_cached = pytigris.get_blocks(state = 'de', counties = '003', year = 2020, use_cache = True)
+        df_partition = pytigris.get_blocks(state = 'de', counties = '003', year = 2020, use_cache = True)
+        self.assertEqual(df.GEOID.tolist(), df_cached.GEOID.tolist(), "Partitioned cache returned different blocks")
+        self.assertEqual(df.GEOID.tolist(), df_partition.GEOID.tolist(), "Reading from the partitioned cache returned different blocks")
+
+    def test_url(self):
+        self.assertTrue(pytigris.util.tiger_url(2012, 'block', False, '500k', '10').endswith('TIGER2012/TABBLOCK/tl_2012_10_tabblock.zip'))
+        self.assertTrue(pytigris.util.tiger_url(2014, 'block', False, '500k', '10').endswith('TIGER2014/TABBLOCK/tl_2014_10_tabblock10.zip'))
+
+    def test_value_errors(self):
+        for kwargs in [{'state': None}, {'state': 'de', 'year': 2005}, {'state': 'de', 'chunksize': 0}]:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    pytigris.get_blocks(**kwargs)
+
+class BlockCacheTests(CacheTestCase):
+
+    def test_cached_file_order(self):
+        # Partitions are merged back into file order, and keep the schema of the file when empty
+        counties = ['003', '001', '003', '001', '001', '003', '001']
+        df = gpd.GeoDataFrame({'STATEFP20': '10', 'COUNTYFP20': counties, 'GEOID20': [f'10{county}00010010{i:02d}' for i, county in enumerate(counties)]},
+                              geometry = [box(-75.6 + i / 100, 39.1, -75.59 + i / 100, 39.11) for i in range(len(counties))], crs = 'EPSG:4269')
+        blob = cache_zipped_layer(df, 'block', 2020, '10')
+
+        df_cached = pytigris.get_blocks(state = 'de', year = 2020, use_cache = True)
+        self.assertEqual(df_cached.GEOID.tolist(), df.GEOID20.tolist(), "Partitioned cache did not return blocks in file order")
+        chunks = list(pytigris.get_blocks(state = 'de', year = 2020, chunksize = 3, use_cache = True))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1], "Chunks of the partitioned cache do not match chunksize")
+        self.assertEqual(pd.concat(chunks).GEOID.tolist(), df.GEOID20.tolist(), "Chunks of the partitioned cache are not in file order")
+
+        df_empty = pytigris.get_blocks(state = 'de', counties = '005', year = 2020, use_cache = True)
+        self.assertEqual(len(df_empty), 0, "Partitioned cache returned blocks of other counties")
+        self.assertEqual(list(df_empty.columns), list(df_cached.columns), "Empty read from the partitioned cache lost the schema")
+
+        # Another process partitioning the same file keeps the partitions already written
+        path = pytigris.util.partitioned_cache_path(blob, 'COUNTYFP')
+        pytigris.util.write_partitioned('zip://' + str(blob.absolute()), path, 'COUNTYFP')
+        self.assertEqual(list(path.parent.glob('*.tmp')), [], "Temporary partitions were left behind")
+        self.assertEqual(pytigris.get_blocks(state = 'de', year = 2020, use_cache = True).GEOID.tolist(), df.GEOID20.tolist(), "Partitions were lost")
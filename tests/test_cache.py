@@ -57,7 +57,11 @@ class CacheTests(unittest.TestCase):
         with self.subTest():
             self.assertTrue(all(df_2019_orig == df_2019_cached), "2019 cached copy and downloaded copy are not the same")
 
-
-
-        
-
+    def test_cache_refresh_deduplicated(self):
+        pytigris.get_states(year = 2020, use_cache = True)
+        index = pytigris.util.get_cache_index().set_index('name')
+        n_blobs = len(list((pytigris.util.CACHE_PATH / 'blobs').iterdir()))
+        pytigris.get_states(year = 2020, use_cache = True, refresh = True)
+        refreshed_index = pytigris.util.get_cache_index().set_index('name')
+        self.assertEqual(index.loc['tl_2020_us_state.zip', 'digest'], refreshed_index.loc['tl_2020_us_state.zip', 'digest'], "Refreshed copy has a different checksum")
+        self.assertEqual(n_blobs, len(list((pytigris.util.CACHE_PATH / 'blobs').iterdir())), "Refreshing unchanged content stored it again")
@@ -0,0 +1,54 @@
+import unittest
+import datetime
+import pytigris
+
+class CatalogTests(unittest.TestCase):
+
+    def test_list_available_layer(self):
+        df = pytigris.list_available(layer = 'tract')
+        self.assertGreater(len(df), 0, "No tract files listed in the catalog")
+        self.assertTrue((df['layer'] == 'tract').all(), "list_available returned other layers")
+
+    def test_list_available_year(self):
+        df = pytigris.list_available(layer = 'county', year = 2015, cb = True)
+        self.assertEqual(set(df['resolution']), {'500k', '5m', '20m'}, "Missing resolutions for cartographic county files")
+
+    def test_latest_year(self):
+        latest = pytigris.list_available(layer = 'state', cb = False)['year'].max()
+        released = (datetime.date.today() - datetime.timedelta(days = 366)).year
+        self.assertEqual(pytigris.util.standardize_year(None, 'state', False), max(latest, released), "year = None did not resolve to the latest vintage")
+        # Layers no longer published keep the last year in the catalog
+        self.assertEqual(pytigris.util.standardize_year(None, 'zcta', True), 2020, "year = None resolved past the last vintage of a discontinued layer")
+
+    def test_newer_than_catalog(self):
+        # Vintages released after the catalog was built are still downloaded, if the layer is still published
+        latest = pytigris.catalog.get_catalog()['year'].max()
+        self.assertTrue(pytigris.util.construct_url(latest + 1, 'state', False, '500k').endswith(f'TIGER{latest + 1}/STATE/tl_{latest + 1}_us_state.zip'))
+        self.assertTrue(pytigris.catalog.is_available('tract', latest + 1, False, scope = 'state'), "Per-state tracts not assumed for a newer year")
+        with self.assertRaises(ValueError):
+            pytigris.util.construct_url(latest + 1, 'zcta', True, '500k')
+
+    def test_unavailable_raises(self):
+        for layer, year, cb, state in [('unsd', 2014, True, '19'), ('tract', 2018, True, 'us'), ('zcta', 2020, False, '08')]:
+            with self.subTest(f"{layer}, {year}, cb = {cb}, state = {state}"):
+                with self.assertRaises(ValueError):
+                    pytigris.util.construct_url(year, layer, cb, '500k', state)
+
+    def test_scope(self):
+        # Per-state and per-county layers are checked by scope, not by passing 'state' in place of a FIPS code
+        self.assertTrue(pytigris.catalog.is_available('tract', 2015, False, '500k', scope = 'state'), "Per-state tracts not found by scope")
+        self.assertFalse(pytigris.catalog.is_available('tract', 2015, False, '500k', scope = 'us'), "National tracts listed for 2015")
+        self.assertTrue(pytigris.catalog.is_available('tract', 2015, False, '500k', state = '06'), "Per-state tracts not found by state")
+        self.assertTrue(pytigris.catalog.is_available('areawater', 2020, False, state = '06037'), "Per-county area water not found by county")
+
+    def test_build_catalog(self):
+        # The candidates reproduce the shipped catalog up to its latest year, without any request to the server
+        df = pytigris.catalog.build_catalog(verify = False)
+        columns = ['layer', 'year', 'cb', 'resolution', 'scope']
+        self.assertTrue(df[columns].equals(pytigris.catalog.get_catalog()[columns]), "Unverified catalog differs from the shipped catalog")
+        self.assertEqual(pytigris.catalog.build_catalog(verify = False, latest = 2030)['year'].max(), 2030, "Catalog not extended to the given year")
+
+    def test_shipped_catalog_verified(self):
+        # The shipped catalog must list the files found on the server, not the candidates (run `python -m pytigris.catalog`)
+        self.assertTrue(pytigris.catalog.catalog_verified(), "Shipped catalog was not verified against the server")
+        self.assertFalse(pytigris.catalog.get_catalog()['size'].isna().any(), "Shipped catalog is missing file sizes")
@@ -0,0 +1,30 @@
+import unittest
+import pytigris
+
+class ChangesTests(unittest.TestCase):
+
+    def test_compare_same_vintage(self):
+        changes = pytigris.compare_vintages('tract', 2021, 2021, state = 'de')
+        self.assertEqual(len(changes.added) + len(changes.removed) + len(changes.geometry_changed) + len(changes.attribute_changed), 0, "Comparing a vintage with itself found changes")
+        self.assertGreater(len(changes.unchanged), 0, "No tracts compared")
+
+    def test_compare_decennial(self):
+        changes = pytigris.compare_vintages('tract', 2019, 2020, state = 'de', use_cache = True)
+        self.assertGreater(len(changes.added) + len(changes.removed) + len(changes.geometry_changed), 0, "No changes found across the 2020 redistricting")
+        cached = pytigris.compare_vintages('tract', 2019, 2020, state = 'de', use_cache = True)
+        self.assertEqual(changes, cached, "Cached feature hashes gave a different result")
+
+    def test_cache_key(self):
+        key = pytigris.util.layer_cache_key('tract', 2020, state = 'de')
+        self.assertEqual(key, pytigris.util.layer_cache_name('tract', 2020, state = 'de'), "Plain layers are not keyed by their name")
+        self.assertEqual(key, pytigris.util.layer_cache_key('tract', 2020, state = 'de', progress_bar = False, workers = 4, crs = None), "Arguments not changing the features changed the key")
+        variants = [{'counties': '001'}, {'crs': 'EPSG:5070'}, {'precision': 1e-6}, {'bbox': (-75.6, 39.6, -75.5, 39.7)}, {'derived': True}]
+        keys = [pytigris.util.layer_cache_key('tract', 2020, state = 'de', **kwargs) for kwargs in variants]
+        self.assertEqual(len(set(keys + [key])), len(variants) + 1, "Arguments changing the features did not change the key")
+        self.assertEqual(pytigris.util.layer_cache_key('tract', 2020, state = 'de', crs = 5070), keys[1], "Equivalent CRS gave different keys")
+
+    def test_cache_key_resolution(self):
+        # Keys start with the stem of the file read, so refreshing it removes the artifacts
+        key = pytigris.util.layer_cache_key('county', 2020, cb = True, resolution = '20m')
+        self.assertTrue(key.startswith('cb_2020_us_county_20m'), "Key does not name the file at the resolution read")
+        self.assertEqual(pytigris.util.layer_cache_key('county', 2020, cb = True, resolution = '500k'), pytigris.util.layer_cache_name('county', 2020, cb = True), "Default resolution changed the key")
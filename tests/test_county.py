@@ -1,4 +1,5 @@
 import unittest
+from pathlib import Path
 import pytigris
 
 class CountyTests(unittest.TestCase):
@@ -40,3 +41,20 @@ class CountyTests(unittest.TestCase):
             with self.subTest(f"Year = {year}"):
                 with self.assertRaises(ValueError):
                     pytigris.get_counties(year = year, cb = True)
+
+    def test_crs(self):
+        df = pytigris.get_counties(states = 'ri', year = 2020, crs = 'EPSG:5070', use_cache = True)
+        self.assertEqual(df.crs.to_epsg(), 5070, "Counties were not reprojected")
+        df_cached = pytigris.get_counties(states = 'ri', year = 2020, crs = 'EPSG:5070', use_cache = True)
+        self.assertTrue(df.geom_equals(df_cached).all(), "Cached reprojection differs from the original")
+
+    def test_crs_unchanged(self):
+        # Requesting the CRS the file is already in reads the copy that is not reprojected
+        df = pytigris.get_counties(states = 'ri', year = 2020, crs = 'EPSG:4269', use_cache = True)
+        self.assertEqual(df.crs.to_epsg(), 4269, "Counties were reprojected")
+        blob = pytigris.util.cached_blob(Path(pytigris.util.tiger_url(2020, 'county', False, '500k')).name)
+        self.assertEqual(pytigris.util.parsed_cache_path(blob, 'EPSG:4269'), pytigris.util.parsed_cache_path(blob), "A copy in the source CRS was cached")
+
+    def test_source_crs(self):
+        df = pytigris.get_counties(year = 1990, cb = True)
+        self.assertIsNotNone(df.crs, "Source CRS was not set")
@@ -0,0 +1,50 @@
+import unittest
+import geopandas as gpd
+from shapely.geometry import box
+import pytigris
+from helpers import CacheTestCase, cache_zipped_layer
+
+class CrosswalkTests(unittest.TestCase):
+
+    def test_crosswalk_tracts(self):
+        df = pytigris.get_crosswalk('tract', 2010, 2020, state = 'de')
+        self.assertGreater(len(df), 0, "Crosswalk is empty")
+        weights = df.groupby('GEOID_from')['weight'].sum()
+        self.assertTrue(((weights > 0.99) & (weights < 1.01)).all(), "Crosswalk weights do not sum to 1 for each source tract")
+
+    def test_crosswalk_cached(self):
+        df = pytigris.get_crosswalk('bg', 2019, 2020, state = 'ri', use_cache = True)
+        df_cached = pytigris.get_crosswalk('bg', 2019, 2020, state = 'ri', use_cache = True)
+        self.assertTrue(df.equals(df_cached), "Cached crosswalk differs from the original")
+
+class CrosswalkCacheTests(CacheTestCase):
+
+    def cache_tracts(self, state: str, year: int, boxes: list):
+        df = gpd.GeoDataFrame({
+            'STATEFP': state, 'COUNTYFP': '001', 'TRACTCE': [f'{j:06d}' for j in range(len(boxes))],
+            'GEOID': [f'{state}001{j:06d}' for j in range(len(boxes))]
+        }, geometry = boxes, crs = 'EPSG:4269')
+        cache_zipped_layer(df, 'tract', year, state)
+
+    def test_crosswalk_all_states(self):
+        # Per-state tract files stored in the cache: one tract per state in 2015, split in two in 2016
+        for i, state in enumerate(pytigris.util.get_state_fips_table().fips):
+            self.cache_tracts(state, 2015, [box(i, 0, i + 1, 1)])
+            self.cache_tracts(state, 2016, [box(i, 0, i + 0.5, 1), box(i + 0.5, 0, i + 1, 1)])
+
+        df = pytigris.get_crosswalk('tract', 2015, 2016, use_cache = True, workers = 2)
+        n_states = len(pytigris.util.get_state_fips_table())
+        self.assertEqual(df.GEOID_from.nunique(), n_states, "Crosswalk is missing states")
+        self.assertEqual(len(df), 2 * n_states, "Crosswalk has the wrong number of pairs")
+        self.assertTrue((abs(df.weight - 0.5) < 1e-9).all(), "Crosswalk weights are wrong")
+
+        # A crosswalk of a subset is cached separately from that of the whole layer
+        subset = pytigris.get_crosswalk('tract', 2015, 2016, state = 'ca', use_cache = True, bbox = (4.1, 0.1, 4.2, 0.2))
+        full = pytigris.get_crosswalk('tract', 2015, 2016, state = 'ca', use_cache = True)
+        self.assertEqual(len(subset), 1, "bbox was not applied")
+        self.assertEqual(len(full), 2, "Cached crosswalk of a subset was returned for the whole layer")
+
+        # New content for the to-year file invalidates the cached crosswalk
+        self.cache_tracts('06', 2016, [box(4, 0, 5, 1)])
+        refreshed = pytigris.get_crosswalk('tract', 2015, 2016, state = 'ca', use_cache = True)
+        self.assertEqual(len(refreshed), 1, "Stale crosswalk was returned after the to-year file changed")
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+import geopandas as gpd
+from shapely.geometry import Polygon, box
+import pytigris
+from pytigris.derived import DERIVED_COLUMNS
+
+class DerivedTests(unittest.TestCase):
+
+    def test_derived(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020, derived = True)
+        for col in DERIVED_COLUMNS:
+            self.assertIn(col, df.columns, f"Derived column {col} missing")
+            self.assertEqual(df[col].dtype, np.float64, f"Derived column {col} is not a float column")
+        points = gpd.GeoSeries(gpd.points_from_xy(df.POINT_X, df.POINT_Y), index = df.index, crs = df.crs)
+        self.assertTrue(df.geometry.intersects(points).all(), "Representative points fall outside their features")
+        self.assertTrue(np.allclose(df[['MINX', 'MINY', 'MAXX', 'MAXY']].values, df.bounds.values), "Bounds do not match the geometries")
+        self.assertTrue(np.allclose(df.AREA_M2, df.to_crs('EPSG:6933').area), "Areas are not in square metres")
+
+    def test_cached(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020, derived = True)
+        df_cached = pytigris.get_tracts(state = 'ri', year = 2020, derived = True, use_cache = True)
+        df_cached = pytigris.get_tracts(state = 'ri', year = 2020, derived = True, use_cache = True)
+        self.assertTrue(np.allclose(df[DERIVED_COLUMNS].values, df_cached[DERIVED_COLUMNS].values), "Cached derived attributes differ")
+
+    def test_cached_subset(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020, derived = True).set_index('GEOID')
+        bbox = (-71.5, 41.7, -71.4, 41.8)
+        df_bbox = pytigris.get_tracts(state = 'ri', year = 2020, derived = True, use_cache = True, bbox = bbox)
+        self.assertTrue(np.allclose(df_bbox[DERIVED_COLUMNS].values, df.loc[df_bbox.GEOID, DERIVED_COLUMNS].values), "Derived attributes of a subset are misaligned")
+
+    def test_arrow(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020, derived = True)
+        table = pytigris.get_tracts(state = 'ri', year = 2020, derived = True, output = 'arrow')
+        self.assertTrue(np.allclose(table.select(DERIVED_COLUMNS).to_pandas().values, df[DERIVED_COLUMNS].values), "Arrow derived attributes differ")
+
+    def test_missing_and_empty(self):
+        attributes = pytigris.derived.derived_attributes(gpd.GeoSeries([box(0, 0, 1, 1), None, Polygon()], crs = 'EPSG:4269'))
+        self.assertGreater(attributes.area[0], 0, "Area of a feature is not positive")
+        self.assertTrue(np.isnan(attributes.area[1:]).all(), "Missing and empty geometries do not get NaN areas")
+        self.assertTrue(np.isnan(attributes.points[1:]).all(), "Missing and empty geometries do not get NaN points")
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+import shapely
+import geopandas as gpd
+from shapely.geometry import box
+import pytigris
+
+class PrecisionTests(unittest.TestCase):
+
+    def test_precision(self):
+        df = pytigris.get_counties(states = 'ma', year = 2020, crs = 'EPSG:5070', precision = 10)
+        coords = shapely.get_coordinates(df.geometry.values)
+        self.assertTrue(np.allclose(coords / 10, np.round(coords / 10)), "Coordinates were not snapped to the grid")
+        self.assertTrue(df.is_valid.all(), "Snapping produced invalid geometries")
+
+    def test_shared_boundaries(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020, precision = 1e-4)
+        left, right = df.sindex.query(df.geometry, predicate = 'intersects')
+        keep = left < right
+        overlap = shapely.area(shapely.intersection(df.geometry.values[left[keep]], df.geometry.values[right[keep]]))
+        self.assertLess(overlap.max(), 1e-12, "Snapping made neighbouring tracts overlap")
+
+    def test_cached_precision(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020, precision = 1e-4)
+        df_cached = pytigris.get_tracts(state = 'ri', year = 2020, precision = 1e-4, use_cache = True)
+        self.assertTrue(df.geom_equals(df_cached).all(), "Cached quantized layer differs")
+
+    def test_encoding(self):
+        df = pytigris.get_tracts(state = 'ri', year = 2020, precision = 1e-5)
+        encoded = pytigris.encode_geometry(df.geometry, 1e-5)
+        self.assertEqual(encoded.coords.dtype, np.int32, "Coordinates were not encoded as 32-bit integers")
+        decoded = pytigris.decode_geometry(encoded)
+        self.assertTrue(decoded.geom_equals_exact(df.geometry.reset_index(drop = True), 1e-9).all(), "Decoded geometries differ")
+
+    def test_collapsed(self):
+        # Features collapsing entirely at the grid size become empty, alongside features that are kept
+        for geometry in [[box(0, 0, 1e-4, 1e-4)], [box(0, 0, 1e-4, 1e-4), box(0, 0, 1, 1)]]:
+            with self.subTest(n = len(geometry)):
+                df = pytigris.quantize(gpd.GeoDataFrame(geometry = geometry, crs = 'EPSG:5070'), 0.001)
+                self.assertTrue(df.geometry.iloc[0].is_empty, "Collapsed feature was not emptied")
+                self.assertTrue(df.geometry.iloc[1:].equals(gpd.GeoSeries(geometry[1:], index = df.index[1:], crs = 'EPSG:5070')), "Other features were changed")
+
+    def test_value_errors(self):
+        with self.assertRaises(ValueError):
+            pytigris.get_states(year = 2020, precision = 0)
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+import geopandas as gpd
+from shapely.geometry import box
+import pytigris
+from helpers import CacheTestCase, cache_national_tracts
+
+class RasterTests(unittest.TestCase):
+
+    def test_lookup(self):
+        tracts = pytigris.get_tracts(state = 'ri', year = 2020)
+        index = pytigris.build_raster_index(tracts, 0.002)
+        rng = np.random.default_rng(0)
+        minx, miny, maxx, maxy = tracts.total_bounds
+        x, y = rng.uniform(minx, maxx, 20000), rng.uniform(miny, maxy, 20000)
+        geoids = pytigris.lookup_points(index, x, y)
+
+        points = gpd.GeoDataFrame(geometry = gpd.points_from_xy(x, y), crs = tracts.crs)
+        joined = gpd.sjoin(points, tracts, how = 'left', predicate = 'within')
+        joined = joined[~joined.index.duplicated()]
+        exact = joined.GEOID.where(joined.GEOID.notna(), None).values
+        self.assertTrue((geoids == exact).all(), "Raster lookup disagrees with an exact spatial join")
+        self.assertTrue((index.blocks >= 0).any(), "No cells were assigned to a tract")
+
+    def test_tiles(self):
+        # A grid of 50 x 50 features, split into tiles of 8 x 8 cells
+        features = [box(x, y, x + 1, y + 1) for x in range(50) for y in range(50)]
+        df = gpd.GeoDataFrame({'GEOID': [str(i) for i in range(len(features))]}, geometry = features, crs = 'EPSG:5070')
+        index = pytigris.build_raster_index(df, 0.25, tile_size = 8)
+        self.assertEqual(index.shape, (200, 200), "Wrong grid shape")
+        self.assertEqual(index.tiles.shape, (25, 25), "Wrong number of tiles")
+        self.assertEqual(index.blocks.shape[1:], (8, 8), "Wrong tile size")
+
+        rng = np.random.default_rng(0)
+        x, y = rng.uniform(-1, 51, 5000), rng.uniform(-1, 51, 5000)
+        outside = (x < 0) | (x >= 50) | (y < 0) | (y >= 50)
+        x, y = x[~outside], y[~outside]
+        expected = (np.floor(x) * 50 + np.floor(y)).astype(int).astype(str)
+        self.assertTrue((pytigris.lookup_points(index, x, y) == expected).all(), "Lookup across tiles failed")
+
+    def test_antimeridian(self):
+        # Features on both sides of the antimeridian, e.g. the Aleutian Islands
+        df = gpd.GeoDataFrame({'GEOID': ['02016', '02013']}, geometry = [box(178, 51, 180, 52), box(-180, 51, -178, 52)], crs = 'EPSG:4269')
+        index = pytigris.build_raster_index(df, 0.1)
+        self.assertTrue(index.wrap, "Longitudes were not normalised")
+        self.assertEqual(index.shape, (10, 40), "The grid spans the whole globe")
+        self.assertEqual(list(pytigris.lookup_points(index, [178.5, -178.5, 0], [51.5, 51.5, 51.5])), ['02016', '02013', None], "Lookup across the antimeridian failed")
+
+    def test_cached(self):
+        index = pytigris.get_raster_index('tract', 0.002, year = 2020, state = 'ri', use_cache = True)
+        index_cached = pytigris.get_raster_index('tract', 0.002, year = 2020, state = 'ri', use_cache = True)
+        self.assertIsInstance(index_cached.blocks, np.memmap, "Cached grid is not memory-mapped")
+        self.assertTrue(np.array_equal(index.tiles, index_cached.tiles), "Cached tiles differ")
+        self.assertTrue(np.array_equal(index.blocks, index_cached.blocks), "Cached grid differs")
+
+    def test_value_errors(self):
+        with self.assertRaises(ValueError):
+            pytigris.get_raster_index('tract', 0, year = 2020, state = 'ri')
+
+class RasterCacheTests(CacheTestCase):
+
+    def test_cache_key(self):
+        # The grid of a subset of the layer is not reused for the whole layer
+        cache_national_tracts(2015)
+        subset = pytigris.get_raster_index('tract', 0.1, year = 2015, use_cache = True, bbox = (0.1, 0.1, 0.4, 0.4))
+        full = pytigris.get_raster_index('tract', 0.1, year = 2015, use_cache = True)
+        self.assertEqual(subset.shape, (10, 10), "bbox was not applied")
+        self.assertEqual(full.shape, (10, 20), "Cached grid of a subset was returned for the whole layer")
+        self.assertEqual(list(pytigris.lookup_points(full, [0.5, 1.5], [0.5, 0.5])), ['06001400100', '32001400100'], "Lookup across states failed")
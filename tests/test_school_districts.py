@@ -1,5 +1,6 @@
 import unittest
 import pytigris
+from helpers import CacheTestCase
 
 class SDTests(unittest.TestCase):
 
@@ -28,14 +29,31 @@ class SDTests(unittest.TestCase):
 
     def test_error_all(self):
         with self.assertRaises(ValueError):
-            pytigris.get_school_districts(year = 2020)
+            pytigris.get_school_districts(year = 2005)
 
-    def test_error_all_cb(self):
-        with self.assertRaises(ValueError):
-            pytigris.get_school_districts(year = 2018, cb = True)
+    def test_national_from_states(self):
+        dataset = pytigris.get_school_districts(year = 2018, cb = True, dtype = 'secondary')
+        self.assertIsInstance(dataset, pytigris.NationalDataset, "National school districts were not assembled from per-state files")
+        self.assertGreater(len(dataset.states), 1, "National dataset is missing states")
+        df = dataset.read(states = 'ca')
+        self.assertTrue((df["STATEFP"] == '06').all(), "Reading one state returned other states")
 
     def test_value_errors_cb(self):
         for year in [1990, 1995, 2000, 2002, 2005, 2012, 2014]:
             with self.subTest(f"Year = {year}"):
                 with self.assertRaises(ValueError):
-                    pytigris.get_school_districts(year = year, state = 'ia', cb = True)
\ No newline at end of file
+                    pytigris.get_school_districts(year = year, state = 'ia', cb = True)
+
+class SDCacheTests(CacheTestCase):
+
+    def test_national_cache(self):
+        dataset = pytigris.get_school_districts(year = 2018, cb = True, dtype = 'secondary')
+        self.assertFalse((pytigris.util.CACHE_PATH / 'datasets').exists(), "National dataset was cached with use_cache = False")
+        path = dataset.path
+        del dataset
+        self.assertFalse(path.exists(), "Temporary national dataset was not removed")
+
+        dataset = pytigris.get_school_districts(year = 2018, cb = True, dtype = 'secondary', use_cache = True)
+        (dataset.path / '99.parquet').write_bytes((dataset.path / '06.parquet').read_bytes())
+        dataset = pytigris.get_school_districts(year = 2018, cb = True, dtype = 'secondary', use_cache = True, refresh = True)
+        self.assertNotIn('99', dataset.states, "Refreshing kept the states of an earlier build")
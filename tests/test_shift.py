@@ -0,0 +1,37 @@
+import unittest
+import pytigris
+
+class ShiftTests(unittest.TestCase):
+
+    def test_shift_geometry(self):
+        states = pytigris.get_states(cb = True, resolution = '20m', year = 2020)
+        lower = states[~states.STATEFP.isin(['02', '15', '72'])].to_crs('EPSG:5070')
+        for position in ['below', 'outside']:
+            with self.subTest(position = position):
+                shifted = pytigris.shift_geometry(states, position = position)
+                self.assertEqual(len(shifted), len(states), "Shifting changed the number of features")
+                self.assertEqual(shifted.crs.to_epsg(), 5070, "Shifted layer is not in Conus Albers")
+                insets = shifted[shifted.STATEFP.isin(['02', '15', '72'])]
+                self.assertFalse(insets.intersects(lower.unary_union).any(), "Insets overlap the lower 48 states")
+                alaska, hawaii, puerto_rico = [insets[insets.STATEFP == state].unary_union for state in ['02', '15', '72']]
+                self.assertFalse(alaska.intersects(hawaii) or alaska.intersects(puerto_rico) or hawaii.intersects(puerto_rico), "Insets overlap each other")
+                self.assertTrue(shifted[shifted.STATEFP == '06'].geom_equals(lower[lower.STATEFP == '06']).all(), "Other states were moved")
+
+    def test_preserve_area(self):
+        states = pytigris.get_states(cb = True, resolution = '20m', year = 2020)
+        area = states.to_crs('EPSG:5070').area
+        shifted = pytigris.shift_geometry(states, preserve_area = True)
+        self.assertAlmostEqual(shifted.area.sum() / area.sum(), 1, places = 6, msg = "preserve_area = True changed areas")
+
+    def test_cached(self):
+        counties = pytigris.get_counties(cb = True, resolution = '20m', year = 2020)
+        shifted = pytigris.shift_geometry(counties, use_cache = True)
+        shifted_cached = pytigris.shift_geometry(counties, use_cache = True)
+        self.assertTrue(shifted.geom_equals(shifted_cached).all(), "Cached result differs")
+
+    def test_value_errors(self):
+        states = pytigris.get_states(cb = True, resolution = '20m', year = 2020)
+        for gdf, kwargs in [(states, {'position': 'left'}), (states.drop(columns = 'STATEFP'), {})]:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    pytigris.shift_geometry(gdf, **kwargs)
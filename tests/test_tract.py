@@ -1,5 +1,8 @@
 import unittest
+import geopandas as gpd
+from shapely.geometry import box
 import pytigris
+from helpers import CacheTestCase, cache_national_tracts
 
 class TractTests(unittest.TestCase):
 
@@ -44,3 +47,42 @@ class TractTests(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     pytigris.get_tracts(year = year, cb = True)
 
+    def test_parallel_read(self):
+        df_serial = pytigris.get_tracts(year = 2020, state = 'ca')
+        # CA has too few tracts to be split under the default threshold, so lower it to read four ranges
+        min_features = pytigris.util.MIN_FEATURES_PER_WORKER
+        pytigris.util.MIN_FEATURES_PER_WORKER = len(df_serial) // 4
+        try:
+            df_parallel = pytigris.get_tracts(year = 2020, state = 'ca', workers = 4)
+        finally:
+            pytigris.util.MIN_FEATURES_PER_WORKER = min_features
+        self.assertEqual(df_serial.GEOID.tolist(), df_parallel.GEOID.tolist(), "Parallel read did not preserve feature order")
+        self.assertTrue(df_serial.geom_equals(df_parallel).all(), "Parallel read returned different geometries")
+
+    def test_bbox_filtering(self):
+        bbox = (-71.2, 42.3, -71.0, 42.4)
+        df_orig = pytigris.get_tracts(year = 2020, state = 'ma', use_cache = True)
+        df_filtered = pytigris.get_tracts(year = 2020, state = 'ma', bbox = bbox, use_cache = True)
+        self.assertGreater(len(df_filtered), 0, "Filtering failed: removed all tracts (bbox)")
+        self.assertLess(len(df_filtered), len(df_orig), "Filtering tracts by bbox failed")
+
+class TractCacheTests(CacheTestCase):
+
+    def test_national_from_states(self):
+        # A dataset assembled earlier is reused without any download
+        cache_national_tracts(2015)
+        dataset = pytigris.get_tracts(year = 2015, use_cache = True)
+        self.assertIsInstance(dataset, pytigris.NationalDataset, "National tracts were not assembled from per-state files")
+        self.assertEqual(dataset.read().GEOID.tolist(), ['06001400100', '32001400100'], "National dataset was not reused")
+
+    def test_national_filters(self):
+        self.assertEqual(len(pytigris.NationalDataset(self.tmp).read(bbox = (0, 0, 1, 1))), 0, "Empty dataset did not read as empty")
+
+        for state, x in [('06', -120), ('32', -117)]:
+            gpd.GeoDataFrame({'STATEFP': [state], 'GEOID': [state + '001400100']}, geometry = [box(x, 38, x + 1, 39)], crs = 'EPSG:4269').to_parquet(self.tmp / f'{state}.parquet')
+        dataset = pytigris.NationalDataset(self.tmp)
+
+        mask = {'type': 'Polygon', 'coordinates': [[(-119.5, 38.5), (-119.4, 38.5), (-119.4, 38.6), (-119.5, 38.5)]]}
+        self.assertEqual(dataset.read(mask = mask).GEOID.tolist(), ['06001400100'], "GeoJSON mask was not applied")
+        bbox = gpd.GeoSeries([box(-116.6, 38.4, -116.4, 38.6)], crs = 'EPSG:4269').to_crs('EPSG:5070')
+        self.assertEqual(dataset.read(bbox = bbox).GEOID.tolist(), ['32001400100'], "Projected bbox was not reprojected to the dataset's CRS")
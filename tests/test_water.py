@@ -0,0 +1,43 @@
+import unittest
+import geopandas as gpd
+from shapely.geometry import box
+import pytigris
+from helpers import CacheTestCase, cache_zipped_layer
+
+class WaterTests(unittest.TestCase):
+
+    def test_area_water(self):
+        df = pytigris.get_area_water(state = 'ri', counties = 'Newport', year = 2020)
+        self.assertTrue(len(df) > 0, "get_area_water(state = 'ri', counties = 'Newport') does not return full dataframe")
+
+    def test_erase_water(self):
+        tracts = pytigris.get_tracts(state = 'ri', year = 2020, crs = 'EPSG:5070')
+        erased = pytigris.erase_water(tracts, year = 2020)
+        self.assertLessEqual(len(erased), len(tracts), "Erasing water added features")
+        self.assertLess(erased.area.sum(), tracts.area.sum(), "No water was erased")
+        self.assertTrue(erased.geometry.is_valid.all(), "Erasing water produced invalid geometries")
+
+    def test_cached(self):
+        tracts = pytigris.get_tracts(state = 'ri', year = 2020)
+        erased = pytigris.erase_water(tracts, year = 2020, use_cache = True)
+        erased_cached = pytigris.erase_water(tracts, year = 2020, use_cache = True)
+        self.assertTrue(erased.geom_equals(erased_cached).all(), "Cached result differs")
+
+    def test_value_errors(self):
+        tracts = pytigris.get_tracts(state = 'ri', year = 2020)
+        for kwargs in [{'area_threshold': 1.5}, {'year': 2005}]:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    pytigris.erase_water(tracts, **kwargs)
+
+class WaterCacheTests(CacheTestCase):
+
+    def test_cache_invalidated(self):
+        # Refreshing the water of a county invalidates the cached result
+        tracts = gpd.GeoDataFrame({'STATEFP': ['44'], 'COUNTYFP': ['005']}, geometry = [box(-71.4, 41.4, -71.2, 41.6)], crs = 'EPSG:4269').to_crs('EPSG:5070')
+        for water in [box(-71.4, 41.4, -71.3, 41.6), box(-71.4, 41.4, -71.35, 41.6)]:
+            water = gpd.GeoDataFrame({'HYDROID': ['1']}, geometry = [water], crs = 'EPSG:4269')
+            cache_zipped_layer(water, 'areawater', 2020, '44005')
+            erased = pytigris.erase_water(tracts, year = 2020, area_threshold = 0, use_cache = True, workers = 1)
+            expected = tracts.difference(water.to_crs(tracts.crs).geometry.iloc[0]).area.iloc[0]
+            self.assertAlmostEqual(erased.area.iloc[0] / expected, 1, places = 6, msg = "Cached result of the earlier water file was returned")